@@ -0,0 +1,142 @@
+"""Fixtures and options for the builder benchmarks.
+
+The benchmarks use the ``benchmark`` fixture of ``pytest-benchmark`` when the
+plugin is installed (so ``--benchmark-save``/``--benchmark-compare`` work as
+usual).  Without it a small fallback fixture with the same calling
+conventions times each benchmark and prints a summary table, and
+``--benchmark-json`` writes the timings for later comparison.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks.synthetic_idd import write_synthetic_idd
+
+HAVE_PYTEST_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("synthetic IDD")
+    group.addoption(
+        "--synthetic-sizes",
+        default="100,1000",
+        help="Comma-separated class counts of the synthetic IDDs to benchmark (e.g. 100,1000,20000)",
+    )
+    group.addoption("--synthetic-fields", type=int, default=10, help="Fields per synthetic class")
+    group.addoption("--synthetic-choice-keys", type=int, default=4, help="Keys per synthetic choice field")
+    group.addoption("--synthetic-memo-lines", type=int, default=1, help="Memo lines per synthetic class")
+    if not HAVE_PYTEST_BENCHMARK:
+        group.addoption("--benchmark-json", type=Path, help="Write fallback benchmark timings as JSON")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "synthetic_classes" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("synthetic_sizes").split(",")]
+        metafunc.parametrize("synthetic_classes", sizes, ids=[f"{size}cls" for size in sizes], scope="session")
+
+
+@pytest.fixture(scope="session")
+def synthetic_idd_file(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory, synthetic_classes: int
+) -> Path:
+    """A synthetic IDD with ``synthetic_classes`` classes, written once per session."""
+    config = request.config
+    return write_synthetic_idd(
+        tmp_path_factory.mktemp("idd") / "Energy+.idd",
+        synthetic_classes,
+        config.getoption("synthetic_fields"),
+        choice_keys=config.getoption("synthetic_choice_keys"),
+        memo_lines=config.getoption("synthetic_memo_lines"),
+    )
+
+
+class FallbackBenchmark:
+    """Minimal stand-in for the ``pytest-benchmark`` fixture."""
+
+    def __init__(self, name: str, *, max_time: float = 1.0, min_rounds: int = 3, max_rounds: int = 50) -> None:
+        self.name = name
+        self.max_time = max_time
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.timings: list[float] = []
+
+    def _time(self, target: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        start = time.perf_counter()
+        result = target(*args, **kwargs)
+        self.timings.append(time.perf_counter() - start)
+        return result
+
+    def __call__(self, target: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        result = self._time(target, args, kwargs)
+        while len(self.timings) < self.max_rounds and (
+            len(self.timings) < self.min_rounds or sum(self.timings) < self.max_time
+        ):
+            result = self._time(target, args, kwargs)
+        return result
+
+    def pedantic(
+        self,
+        target: Callable[..., Any],
+        args: tuple = (),
+        kwargs: dict | None = None,
+        setup: Callable[[], Any] | None = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0,
+    ) -> Any:
+        for _ in range(warmup_rounds):
+            target(*args, **(kwargs or {}))
+        result = None
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*args, **(kwargs or {}))
+            self.timings.append((time.perf_counter() - start) / iterations)
+        return result
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "min": min(self.timings),
+            "mean": statistics.fmean(self.timings),
+            "max": max(self.timings),
+            "rounds": len(self.timings),
+        }
+
+
+_fallback_results: list[FallbackBenchmark] = []
+
+if not HAVE_PYTEST_BENCHMARK:
+
+    @pytest.fixture
+    def benchmark(request: pytest.FixtureRequest) -> FallbackBenchmark:
+        bench = FallbackBenchmark(request.node.nodeid)
+        _fallback_results.append(bench)
+        return bench
+
+    def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+        results = [bench for bench in _fallback_results if bench.timings]
+        if not results:
+            return
+        terminalreporter.section("benchmarks (fallback timer; install pytest-benchmark for full statistics)")
+        width = max(len(bench.name) for bench in results)
+        terminalreporter.write_line(f"{'name':<{width}}  {'min (s)':>10}  {'mean (s)':>10}  {'rounds':>6}")
+        for bench in results:
+            stats = bench.stats()
+            terminalreporter.write_line(
+                f"{bench.name:<{width}}  {stats['min']:>10.4f}  {stats['mean']:>10.4f}  {stats['rounds']:>6}"
+            )
+        output = config.getoption("benchmark_json")
+        if output:
+            output.write_text(
+                json.dumps({"benchmarks": [{"name": b.name, "stats": b.stats()} for b in results]}, indent=2) + "\n"
+            )
@@ -0,0 +1,87 @@
+"""Synthetic ``Energy+.idd`` files for benchmarks.
+
+Synthetic IDDs let benchmarks run offline, without an EnergyPlus install,
+and at sizes beyond the real IDD (custom IDDs with plugin objects reach tens
+of thousands of classes).
+
+Run as a module to write one to disk::
+
+    python -m benchmarks.synthetic_idd synthetic.idd --classes 20000 --choice-keys 12
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+MEMO_LINE = "Synthetic object generated for benchmarks."
+
+
+def object_key(index: int) -> str:
+    """Return the IDD object name used for the ``index``-th synthetic class."""
+    return f"Synthetic:Object{index}"
+
+
+def synthetic_idd(
+    classes: int = 800,
+    fields: int = 10,
+    version: str = "23.1.0",
+    *,
+    choice_keys: int = 4,
+    memo_lines: int = 1,
+) -> str:
+    """Return the text of an IDD with ``classes`` objects of ``fields`` fields each.
+
+    Fields cycle through alpha, real (with limits and a default) and choice
+    types so every code path of the stub renderer is exercised.  Choice fields
+    get ``choice_keys`` keys and every object a memo of ``memo_lines`` lines.
+    """
+    lines = [f"!IDD_Version {version}", "!IDD_BUILD synthetic", ""]
+    for index in range(classes):
+        lines.append(f"\\group Synthetic Group {index % 40}")
+        lines.append(f"{object_key(index)},")
+        lines += [f"      \\memo {MEMO_LINE}"] * memo_lines
+        for position in range(fields):
+            terminator = ";" if position == fields - 1 else ","
+            kind = position % 3
+            prefix = "A" if kind != 1 else "N"
+            lines.append(f"  {prefix}{position + 1} {terminator} \\field Field {position}")
+            if position == 0:
+                lines.append("      \\required-field")
+            if kind == 1:
+                lines += ["      \\type real", "      \\minimum 0", "      \\maximum 100", "      \\default 1.0"]
+            elif kind == 2 and choice_keys:
+                lines.append("      \\type choice")
+                lines += [f"      \\key Choice{key}" for key in range(choice_keys)]
+        lines.append("")
+    return "\n".join(lines)
+
+
+def write_synthetic_idd(
+    path: str | Path,
+    classes: int = 800,
+    fields: int = 10,
+    *,
+    choice_keys: int = 4,
+    memo_lines: int = 1,
+) -> Path:
+    """Write :func:`synthetic_idd` output to ``path`` and return it."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(synthetic_idd(classes, fields, choice_keys=choice_keys, memo_lines=memo_lines))
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic Energy+.idd for benchmarks")
+    parser.add_argument("path", type=Path, help="Output IDD file")
+    parser.add_argument("--classes", type=int, default=800, help="Number of object classes")
+    parser.add_argument("--fields", type=int, default=10, help="Fields per class")
+    parser.add_argument("--choice-keys", type=int, default=4, help="Keys per choice field")
+    parser.add_argument("--memo-lines", type=int, default=1, help="Memo lines per class")
+    args = parser.parse_args(argv)
+    write_synthetic_idd(args.path, args.classes, args.fields, choice_keys=args.choice_keys, memo_lines=args.memo_lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Micro and macro benchmarks of the stub builder on synthetic IDDs.
+
+Run with ``pytest benchmarks`` (they are not part of the default test run)::
+
+    pytest benchmarks --synthetic-sizes 100,1000,20000 --synthetic-choice-keys 12
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mypy_eppy_builder.class_index import INDEX_FILE
+from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator, generate_overloads
+from mypy_eppy_builder.idd_cache import IddCache
+from mypy_eppy_builder.idd_model import build_object_specs
+from mypy_eppy_builder.idd_parser import parse_idd
+
+
+@pytest.fixture(scope="session")
+def generator(synthetic_idd_file: Path, tmp_path_factory: pytest.TempPathFactory) -> EppyStubGenerator:
+    """A generator with the synthetic IDD already parsed."""
+    generator = EppyStubGenerator(str(synthetic_idd_file), str(tmp_path_factory.mktemp("stubs")), use_cache=False)
+    assert generator.idd_info
+    return generator
+
+
+@pytest.fixture(scope="session")
+def stubs_dir(generator: EppyStubGenerator, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A directory holding one (empty) stub file per synthetic class and their class index."""
+    stubs = tmp_path_factory.mktemp("overload-stubs")
+    for obj, *_ in generator.idd_info[1:]:
+        (stubs / f"{generator.normalize_classname(obj['idfobj'])}.pyi").touch()
+    (stubs / INDEX_FILE).write_text(generator.render_class_index("23.1"))
+    return stubs
+
+
+def test_parse_idd(benchmark, synthetic_idd_file: Path) -> None:
+    idd_info = benchmark(parse_idd, synthetic_idd_file)
+    assert len(idd_info) > 1
+
+
+def test_load_cached_idd(benchmark, synthetic_idd_file: Path, tmp_path: Path) -> None:
+    cache = IddCache(tmp_path)
+    cache.store(synthetic_idd_file, parse_idd(synthetic_idd_file))
+    assert benchmark(cache.load, synthetic_idd_file) is not None
+
+
+def test_normalize_classname(benchmark, generator: EppyStubGenerator) -> None:
+    names = [record[0]["idfobj"] for record in generator.idd_info[1:]]
+    result = benchmark(lambda: [generator.normalize_classname(name) for name in names])
+    assert len(result) == len(names)
+
+
+def test_normalize_field_name(benchmark, generator: EppyStubGenerator) -> None:
+    names = [field["field"][0] for record in generator.idd_info[1:] for field in record[1:]]
+    result = benchmark(lambda: [generator.normalize_field_name(name) for name in names])
+    assert len(result) == len(names)
+
+
+def test_render_class_stub(benchmark, generator: EppyStubGenerator) -> None:
+    records = generator.idd_info[1:]
+    stubs = benchmark(lambda: [generator.render_class_stub(obj, fields) for obj, *fields in records])
+    assert len(stubs) == len(records)
+
+
+def test_build_object_specs(benchmark, generator: EppyStubGenerator) -> None:
+    records = generator.idd_info[1:]
+    specs = benchmark(build_object_specs, records)
+    assert len(specs) == len(records)
+
+
+def test_render_spec(benchmark, generator: EppyStubGenerator) -> None:
+    specs = generator.object_specs
+    stubs = benchmark(lambda: [generator.render_spec(spec) for spec in specs])
+    assert len(stubs) == len(specs)
+
+
+@pytest.mark.parametrize("overload_style", ["full", "compact"])
+def test_generate_overloads(benchmark, stubs_dir: Path, tmp_path: Path, overload_style: str) -> None:
+    output = tmp_path / "idf.pyi"
+    benchmark(generate_overloads, str(stubs_dir), str(output), overload_style=overload_style)
+    assert output.stat().st_size > 0
+
+
+def test_render_templates(benchmark, generator: EppyStubGenerator, tmp_path: Path) -> None:
+    generate_package = pytest.importorskip("mypy_eppy_builder.generate_package", exc_type=ImportError)
+    template_base = generate_package.TEMPLATES_DIR / "version-package"
+    index = generator.class_index
+    context = {
+        "package_name": "types_eplus231",
+        "package_slug": "types_eplus231",
+        "classnames": index.classnames,
+        "class_modules": index.class_modules,
+        "overloads": index.overloads,
+        "eplus_version": "23.1",
+        "builder_package_name": "mypy_eppy_builder",
+        "builder_version": "0.0.0",
+        "builder_repo_url": "https://github.com/samuelduchesne/mypy-eppy-builder",
+    }
+    benchmark(
+        generate_package.render_templates,
+        list(template_base.rglob("*.jinja2")),
+        context,
+        output_base=tmp_path,
+        template_base=template_base,
+    )
+    assert (tmp_path / "src" / "types_eplus231" / "__init__.py").exists()
+
+
+@pytest.mark.parametrize("jobs", [1, 0], ids=["serial", "all-cpus"])
+def test_generate_package_main(benchmark, synthetic_idd_file: Path, tmp_path: Path, jobs: int) -> None:
+    generate_package = pytest.importorskip("mypy_eppy_builder.generate_package", exc_type=ImportError)
+    argv = [
+        "--idd-file",
+        str(synthetic_idd_file),
+        "--version",
+        "23.1",
+        "--output-dir",
+        str(tmp_path / "generated"),
+        "--no-cache",
+        "--jobs",
+        str(jobs),
+    ]
+    benchmark.pedantic(generate_package.main, args=(argv,), rounds=1, iterations=1)
+    assert (tmp_path / "generated" / "types-archetypal").is_dir()
@@ -0,0 +1,410 @@
+"""Type-checker performance benchmark for generated stub packages.
+
+Generates a stub package from an IDD (a real ``Energy+.idd`` or a synthetic
+one), type-checks a corpus of usage files modelled on ``test.py`` and
+``test_error.py`` with mypy and pyright, and records wall time, peak RSS and
+on-disk cache size for each checker::
+
+    python -m benchmarks.typecheck --synthetic-classes 800 --calls 300 \\
+        --output bench.json --thresholds benchmarks/thresholds.json
+
+With ``--compare-slim`` the package is generated twice, with and without
+``--slim``, and the report compares the two builds' stub sizes and checker
+timings.  ``--compare-layouts`` benchmarks every ``--layout`` instead and
+also times installing each layout's version wheel.
+
+Results are written as JSON. The exit status is non-zero when a checker
+exceeds an absolute limit in the thresholds file or regresses past
+``max_regression`` relative to ``--baseline``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic_idd import write_synthetic_idd
+
+CHECKERS = ("mypy", "pyright")
+# generate_package options selecting slim stubs or the layout, and how many values each takes
+SLIM_OPTIONS = {"--slim": 0, "--slim-docs": 1, "--drop-constraints": 0}
+LAYOUT_OPTIONS = {"--layout": 1}
+LIBRARY_IMPORTS = {
+    "archetypal": "from archetypal.idfclass import IDF",
+    "eppy": "from eppy.modeleditor import IDF",
+}
+
+# Runs a command and reports its wall time and peak RSS as JSON on stdout.
+_MEASURE = """
+import json, resource, subprocess, sys, time
+start = time.perf_counter()
+proc = subprocess.run(sys.argv[1:], capture_output=True, text=True)
+wall = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+scale = 1 if sys.platform == "darwin" else 1024
+print(json.dumps({
+    "wall_s": wall,
+    "peak_rss_mb": rss * scale / 2**20,
+    "returncode": proc.returncode,
+    "output": proc.stdout + proc.stderr,
+}))
+"""
+
+
+def usage_corpus(keys: list[str], calls: int, library: str = "archetypal") -> str:
+    """Return a usage module making ``calls`` rounds of typed ``IDF`` calls over ``keys``."""
+    lines = [LIBRARY_IMPORTS[library], "", "idf = IDF()", ""]
+    for i in range(calls):
+        key = keys[(i * 7) % len(keys)]
+        lines += [
+            f'obj{i} = idf.newidfobject("{key}")',
+            f'found{i} = idf.getobject("{key}", "name")',
+            f'for item{i} in idf.idfobjects["{key}"]:',
+            f"    print(item{i})",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def error_corpus(keys: list[str], calls: int, library: str = "archetypal") -> str:
+    """Return a usage module where every call uses a misspelled key and must be rejected."""
+    lines = [LIBRARY_IMPORTS[library], "", "idf = IDF()", ""]
+    for i in range(calls):
+        key = keys[(i * 7) % len(keys)] + "S"
+        lines += [
+            f'obj{i} = idf.newidfobject("{key}")',
+            f'for item{i} in idf.idfobjects["{key}"]:',
+            f"    print(item{i})",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def build_typings(
+    idd_file: Path,
+    workdir: Path,
+    *,
+    version: str = "23.1",
+    package_type: str = "archetypal",
+    generate_args: list[str] | None = None,
+) -> tuple[Path, list[str]]:
+    """Generate the stub packages and lay them out as a ``typings`` stub path.
+
+    Returns:
+        The stub directory and the IDD keys available in the generated package.
+    """
+    from mypy_eppy_builder.class_index import INDEX_FILE, ClassIndex
+
+    output_dir = workdir / "generated"
+    _generate(idd_file, output_dir, version, package_type, generate_args or [])
+    typings = workdir / "typings"
+    shutil.rmtree(typings, ignore_errors=True)
+    typings.mkdir()
+    wrapper_src = output_dir / f"types-{package_type}" / "src"
+    for stubs in wrapper_src.glob("*-stubs"):
+        shutil.copytree(stubs, typings / stubs.name[: -len("-stubs")])
+    keys: list[str] = []
+    for version_src in output_dir.glob("types-eplus*/src/*"):
+        shutil.copytree(version_src, typings / version_src.name)
+        # Only version packages ship an index; the classes of the common package are theirs too
+        if (version_src / INDEX_FILE).exists():
+            keys += sorted(entry.idf_key for entry in ClassIndex.load(version_src / INDEX_FILE))
+    return typings, keys
+
+
+def _generate(idd_file: Path, output_dir: Path, version: str, package_type: str, generate_args: list[str]) -> None:
+    from mypy_eppy_builder.generate_package import main as generate
+
+    generate([
+        "--idd-file",
+        str(idd_file),
+        "--version",
+        version,
+        "--package-type",
+        package_type,
+        "--output-dir",
+        str(output_dir),
+        "--no-cache",
+        *generate_args,
+    ])
+
+
+def install_seconds(wheel: Path, workdir: Path, runs: int = 1) -> float:
+    """Return the best wall time of ``runs`` ``pip install``s of ``wheel`` into an empty target directory."""
+    target = workdir / "site-packages"
+    command = [sys.executable, "-m", "pip", "install", "--quiet", "--no-deps", "--no-index", "--no-compile"]
+    times = []
+    for _ in range(runs):
+        shutil.rmtree(target, ignore_errors=True)
+        start = time.perf_counter()
+        subprocess.run([*command, "--target", str(target), str(wheel)], check=True)  # noqa: S603
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def stub_size_mb(typings: Path) -> float:
+    """Return the size of the version packages' stubs laid out in ``typings``, in MiB."""
+    return sum(_directory_size_mb(package) for package in typings.glob("types_eplus*"))
+
+
+def without_options(generate_args: list[str], options: dict[str, int]) -> list[str]:
+    """Return ``generate_args`` without ``options`` (``{option: number of values}``) and their values."""
+    kept: list[str] = []
+    skip = 0
+    for arg in generate_args:
+        if skip:
+            skip -= 1
+        elif arg in options:
+            skip = options[arg]
+        else:
+            kept.append(arg)
+    return kept
+
+
+def compare(slim: dict, full: dict) -> dict:
+    """Return how the ``slim`` checker results compare with the ``full`` ones, as ratios per checker.
+
+    ``wall_speedup`` above 1 means the slim stubs check faster, ``peak_rss_ratio``
+    below 1 that they need less memory.
+    """
+    return {
+        checker: {
+            "wall_speedup": round(full[checker]["wall_s"] / measured["wall_s"], 3),
+            "peak_rss_ratio": round(measured["peak_rss_mb"] / full[checker]["peak_rss_mb"], 3),
+        }
+        for checker, measured in slim.items()
+        if checker in full
+    }
+
+
+def _directory_size_mb(path: Path) -> float:
+    if not path.exists():
+        return 0.0
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file()) / 2**20
+
+
+def _checker_command(checker: str, workdir: Path, typings: Path, corpus: Path) -> list[str]:
+    if checker == "mypy":
+        return [
+            sys.executable,
+            "-m",
+            "mypy",
+            "--ignore-missing-imports",
+            "--cache-dir",
+            str(workdir / ".mypy_cache"),
+            str(corpus),
+        ]
+    config = workdir / "pyrightconfig.json"
+    config.write_text(
+        json.dumps({
+            "stubPath": str(typings),
+            "reportMissingImports": False,
+            "reportMissingModuleSource": False,
+        })
+    )
+    return ["pyright", "--project", str(config), str(corpus)]
+
+
+def run_checker(checker: str, workdir: Path, typings: Path, corpus: Path) -> dict:
+    """Type-check ``corpus`` once with a cold cache and return the measurements."""
+    cache_dir = workdir / ".mypy_cache"
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    command = _checker_command(checker, workdir, typings, corpus)
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _MEASURE, *command],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=workdir,
+        env={**os.environ, "MYPYPATH": str(typings)},
+    )
+    result = json.loads(proc.stdout)
+    if checker == "mypy":
+        result["cache_mb"] = _directory_size_mb(cache_dir)
+    return result
+
+
+def benchmark(
+    checkers: list[str],
+    workdir: Path,
+    typings: Path,
+    keys: list[str],
+    *,
+    calls: int,
+    runs: int,
+    library: str = "archetypal",
+) -> dict:
+    """Run every checker ``runs`` times on the usage and error corpora.
+
+    The best (lowest) wall time and peak RSS of the runs on the usage corpus
+    are reported, plus the mypy cache size (pyright keeps no on-disk cache). The error corpus is checked once to confirm the stubs still
+    reject unknown keys.
+    """
+    usage = workdir / "usage.py"
+    usage.write_text(usage_corpus(keys, calls, library))
+    errors = workdir / "usage_error.py"
+    errors.write_text(error_corpus(keys, max(1, calls // 10), library))
+
+    results: dict[str, dict] = {}
+    for checker in checkers:
+        samples = [run_checker(checker, workdir, typings, usage) for _ in range(runs)]
+        error_run = run_checker(checker, workdir, typings, errors)
+        results[checker] = {
+            "wall_s": round(min(s["wall_s"] for s in samples), 3),
+            "peak_rss_mb": round(min(s["peak_rss_mb"] for s in samples), 1),
+            "clean": all(s["returncode"] == 0 for s in samples),
+            "rejects_unknown_keys": error_run["returncode"] != 0,
+            "runs": runs,
+        }
+        if "cache_mb" in samples[0]:
+            results[checker]["cache_mb"] = round(max(s["cache_mb"] for s in samples), 2)
+    return results
+
+
+def check_thresholds(results: dict, thresholds: dict, baseline: dict | None = None) -> list[str]:
+    """Return a message for every measurement breaking ``thresholds``.
+
+    ``thresholds`` maps checker names to absolute limits (``wall_s``,
+    ``peak_rss_mb``, ``cache_mb``) and may hold a global ``max_regression``
+    ratio applied against ``baseline`` results.
+    """
+    failures: list[str] = []
+    max_regression = thresholds.get("max_regression")
+    for checker, measured in results.items():
+        for metric, limit in thresholds.get(checker, {}).items():
+            if metric in measured and measured[metric] > limit:
+                failures.append(f"{checker} {metric} {measured[metric]} exceeds limit {limit}")
+        for flag in ("clean", "rejects_unknown_keys"):
+            if measured.get(flag) is False:
+                failures.append(f"{checker} {flag} check failed")
+        previous = (baseline or {}).get(checker)
+        if previous and max_regression is not None:
+            for metric in ("wall_s", "peak_rss_mb", "cache_mb"):
+                old, new = previous.get(metric), measured.get(metric)
+                if old and new is not None and new > old * (1 + max_regression):
+                    failures.append(
+                        f"{checker} {metric} regressed from {old} to {new} (more than {max_regression:.0%})"
+                    )
+    return failures
+
+
+def _measure(
+    args: argparse.Namespace, idd_file: Path, workdir: Path, generate_args: list[str], *, install: bool = False
+) -> dict:
+    """Generate the package with ``generate_args`` in ``workdir`` and benchmark the checkers on it.
+
+    With ``install`` the version wheel is built too, and the time to install it is measured.
+    """
+    workdir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    typings, keys = build_typings(idd_file, workdir, package_type=args.package_type, generate_args=generate_args)
+    generate_s = time.perf_counter() - start
+    results = benchmark(
+        args.checkers, workdir, typings, keys, calls=args.calls, runs=args.runs, library=args.package_type
+    )
+    measured = {
+        "classes": len(keys),
+        "calls": args.calls,
+        "generate_args": generate_args,
+        "generate_s": round(generate_s, 3),
+        "stub_mb": round(stub_size_mb(typings), 3),
+        "stub_files": sum(1 for _ in typings.glob("types_eplus*/*.pyi")),
+        "results": results,
+    }
+    if install:
+        wheels = workdir / "wheels"
+        _generate(idd_file, wheels, "23.1", args.package_type, [*generate_args, "--output-format", "wheel"])
+        (wheel,) = wheels.glob("types_eplus*.whl")
+        measured["install_s"] = round(install_seconds(wheel, workdir, args.runs), 3)
+    return measured
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--idd-file", type=Path, help="IDD file to generate the package from")
+    source.add_argument(
+        "--synthetic-classes", type=int, default=800, help="Generate a synthetic IDD with this many classes"
+    )
+    parser.add_argument("--synthetic-fields", type=int, default=10, help="Fields per synthetic class")
+    parser.add_argument("--calls", type=int, default=300, help="Rounds of IDF calls in the usage corpus")
+    parser.add_argument("--runs", type=int, default=3, help="Cold-cache runs per checker (best is kept)")
+    parser.add_argument("--checkers", nargs="+", choices=CHECKERS, default=list(CHECKERS))
+    parser.add_argument("--package-type", choices=sorted(LIBRARY_IMPORTS), default="archetypal")
+    parser.add_argument("--output", type=Path, help="Write the results JSON here")
+    parser.add_argument("--thresholds", type=Path, help="Thresholds JSON to enforce")
+    parser.add_argument("--baseline", type=Path, help="Previous results JSON for relative regression checks")
+    parser.add_argument("--workdir", type=Path, help="Keep generated files in this directory")
+    compare_group = parser.add_mutually_exclusive_group()
+    compare_group.add_argument(
+        "--compare-slim",
+        action="store_true",
+        help="Also benchmark the package generated without --slim and compare it with the --slim one",
+    )
+    compare_group.add_argument(
+        "--compare-layouts",
+        action="store_true",
+        help="Benchmark every --layout of the class stubs, including the install time of its version wheel",
+    )
+    parser.add_argument(
+        "generate_args",
+        nargs=argparse.REMAINDER,
+        help="Extra generate_package options after '--' (e.g. -- --overload-style compact)",
+    )
+    args = parser.parse_args(argv)
+    generate_args = [arg for arg in args.generate_args if arg != "--"]
+    if args.compare_slim and "--slim" not in generate_args:
+        generate_args.append("--slim")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = (args.workdir or Path(tmp)).resolve()
+        workdir.mkdir(parents=True, exist_ok=True)
+        idd_file = args.idd_file or write_synthetic_idd(
+            workdir / "synthetic.idd", args.synthetic_classes, args.synthetic_fields
+        )
+        report = {
+            "idd": str(args.idd_file)
+            if args.idd_file
+            else f"synthetic:{args.synthetic_classes}x{args.synthetic_fields}",
+        }
+        if args.compare_layouts:
+            from mypy_eppy_builder.layout import LAYOUTS
+
+            base_args = without_options(generate_args, LAYOUT_OPTIONS)
+            layouts = {
+                layout: _measure(args, idd_file, workdir / layout, [*base_args, "--layout", layout], install=True)
+                for layout in LAYOUTS
+            }
+            # Thresholds and baselines apply to the default layout
+            report.update(layouts["per-class"])
+            report["layouts"] = layouts
+        else:
+            report.update(_measure(args, idd_file, workdir / "slim" if args.compare_slim else workdir, generate_args))
+        if args.compare_slim:
+            full = _measure(args, idd_file, workdir / "full", without_options(generate_args, SLIM_OPTIONS))
+            report["full"] = full
+            report["stub_size_ratio"] = round(report["stub_mb"] / full["stub_mb"], 3)
+            report["slim_vs_full"] = compare(report["results"], full["results"])
+    results = report["results"]
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+
+    if not args.thresholds:
+        return 0
+    thresholds = json.loads(args.thresholds.read_text())
+    baseline = json.loads(args.baseline.read_text())["results"] if args.baseline else None
+    failures = check_thresholds(results, thresholds, baseline)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+from mypy_eppy_builder.generate_package import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Build wheels and sdists straight from in-memory file contents.
+
+A version package holds one stub per IDD class, so staging it on disk and
+then having a build backend read it all back means creating and reading
+thousands of small files.  The functions here take the rendered package as a
+``{relative path: content}`` mapping laid out like the package directory
+(``pyproject.toml``, ``README.md``, ``src/<module>/...``) and write each
+finished archive with a single file write.
+
+Archives are reproducible: entries are sorted and timestamps come from
+``$SOURCE_DATE_EPOCH`` (or a fixed 1980 date), so identical inputs produce
+byte-identical wheels and sdists.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import os
+import re
+import time
+from pathlib import Path
+
+from mypy_eppy_builder.version import get_version
+
+# Earliest timestamp a zip archive can represent.
+_ZIP_EPOCH = 315532800  # 1980-01-01T00:00:00Z
+WHEEL_TAG = "py3-none-any"
+
+
+def distribution_name(name: str) -> str:
+    """Return ``name`` normalized for archive file names (``types-eplus231`` -> ``types_eplus231``)."""
+    return re.sub(r"[-_.]+", "_", name).lower()
+
+
+def _timestamp() -> int:
+    return max(int(os.environ.get("SOURCE_DATE_EPOCH", _ZIP_EPOCH)), _ZIP_EPOCH)
+
+
+def core_metadata(
+    name: str,
+    version: str,
+    *,
+    summary: str = "",
+    requires_python: str | None = None,
+    classifiers: list[str] | None = None,
+    requires: list[str] | None = None,
+    extras: dict[str, list[str]] | None = None,
+    readme: str | None = None,
+) -> str:
+    """Return the ``METADATA``/``PKG-INFO`` text for a project.
+
+    ``requires`` lists unconditional requirements and ``extras`` maps extra
+    names to the requirements they pull in.
+    """
+    lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+    if summary:
+        lines.append(f"Summary: {summary}")
+    if requires_python:
+        lines.append(f"Requires-Python: {requires_python}")
+    lines += [f"Classifier: {classifier}" for classifier in classifiers or []]
+    lines += [f"Requires-Dist: {requirement}" for requirement in requires or []]
+    for extra, requirements in (extras or {}).items():
+        lines.append(f"Provides-Extra: {extra}")
+        lines += [f'Requires-Dist: {requirement}; extra == "{extra}"' for requirement in requirements]
+    if readme is not None:
+        lines.append("Description-Content-Type: text/markdown")
+        return "\n".join(lines) + "\n\n" + readme
+    return "\n".join(lines) + "\n"
+
+
+def wheel_contents(files: dict[str, str], source_dir: str = "src") -> dict[str, str]:
+    """Return the entries of ``files`` that belong in a wheel, relative to the wheel root."""
+    prefix = f"{source_dir}/"
+    return {path[len(prefix) :]: content for path, content in files.items() if path.startswith(prefix)}
+
+
+def _record_line(path: str, data: bytes) -> str:
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=").decode()
+    return f"{path},sha256={digest},{len(data)}"
+
+
+def build_wheel(files: dict[str, str], name: str, version: str, metadata: str, output_dir: str | Path) -> Path:
+    """Write a pure-Python wheel holding ``files`` to ``output_dir`` and return its path.
+
+    ``files`` maps paths relative to the wheel root (see :func:`wheel_contents`)
+    to their text content.
+    """
+    dist = distribution_name(name)
+    dist_info = f"{dist}-{version}.dist-info"
+    entries = {path: content.encode("utf-8") for path, content in sorted(files.items())}
+    entries[f"{dist_info}/METADATA"] = metadata.encode("utf-8")
+    entries[f"{dist_info}/WHEEL"] = (
+        f"Wheel-Version: 1.0\nGenerator: mypy-eppy-builder {get_version()}\nRoot-Is-Purelib: true\nTag: {WHEEL_TAG}\n"
+    ).encode()
+    record_path = f"{dist_info}/RECORD"
+    record = [_record_line(path, data) for path, data in entries.items()]
+    entries[record_path] = ("\n".join([*record, f"{record_path},,"]) + "\n").encode()
+
+    import zipfile
+
+    date_time = time.gmtime(_timestamp())[:6]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path, data in entries.items():
+            info = zipfile.ZipInfo(path, date_time=date_time)
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, data)
+
+    output = Path(output_dir) / f"{dist}-{version}-{WHEEL_TAG}.whl"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(buffer.getvalue())
+    return output
+
+
+def build_sdist(files: dict[str, str], name: str, version: str, metadata: str, output_dir: str | Path) -> Path:
+    """Write a ``.tar.gz`` sdist holding ``files`` and ``PKG-INFO`` to ``output_dir``."""
+    dist = distribution_name(name)
+    root = f"{dist}-{version}"
+    entries = {path: content.encode("utf-8") for path, content in sorted(files.items())}
+    entries["PKG-INFO"] = metadata.encode("utf-8")
+
+    import gzip
+    import tarfile
+
+    mtime = _timestamp()
+    tar_buffer = io.BytesIO()
+    with tarfile.open(fileobj=tar_buffer, mode="w", format=tarfile.PAX_FORMAT) as archive:
+        for path, data in entries.items():
+            info = tarfile.TarInfo(f"{root}/{path}")
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+
+    output = Path(output_dir) / f"{root}.tar.gz"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(gzip.compress(tar_buffer.getvalue(), mtime=mtime))
+    return output
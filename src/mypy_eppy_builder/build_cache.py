@@ -0,0 +1,274 @@
+"""Content-addressed cache of finished version packages, shareable between machines.
+
+CI runners building the same EnergyPlus versions would each regenerate
+identical ``types-eplusXX`` packages.  A :class:`BuildCache` keys a version
+package by the hash of its IDD file, the hash of the template tree, the
+builder version and the options that change the output, and stores the
+finished package (its source tree, or its wheel and sdist) as one zip
+artifact.  A later build with the same key unpacks the artifact instead of
+generating anything.
+
+Artifacts live in a :class:`CacheBackend`.  :class:`LocalBackend` keeps them
+in a directory, which a shared mount makes available across machines, and
+:class:`HttpBackend` uses any store answering ``GET`` and ``PUT`` on
+``<url>/<key>``, such as the stand-in :func:`make_server` runs.  Other
+backends register a URL scheme in :data:`BACKENDS`.  Writes are atomic, so
+builders racing on the same key never expose a partial artifact.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import re
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+from mypy_eppy_builder.idd_cache import hash_file
+from mypy_eppy_builder.manifest import hash_text, write_atomic
+from mypy_eppy_builder.version import get_version
+
+if TYPE_CHECKING:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BUILD_CACHE_ENV = "MYPY_EPPY_BUILDER_BUILD_CACHE"
+# Bump whenever the layout of the artifacts changes.
+ARTIFACT_FORMAT = 1
+# Timestamp of every artifact entry (1980-01-01, the earliest a zip archive holds), so artifacts are reproducible
+_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_BUILD_ENTRY = "build.json"
+_FILES_PREFIX = "files/"
+_KEY_RE = re.compile(r"[0-9a-f]{64}")
+
+
+class CacheBackend(Protocol):
+    """Storage of build artifacts by key; any object with these two methods can back a :class:`BuildCache`."""
+
+    def get(self, key: str) -> bytes | None:
+        """Return the artifact stored under ``key``, or ``None`` when there is none."""
+        ...
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``, replacing any artifact already there as a whole."""
+        ...
+
+
+class LocalBackend:
+    """Keep artifacts as ``<root>/<first two key characters>/<key>.zip`` files."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.zip"
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self.path_for(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        write_atomic(self.path_for(key), data)
+
+
+class HttpBackend:
+    """Keep artifacts in an HTTP store answering ``GET`` and ``PUT`` on ``<url>/<key>`` (404 for a miss)."""
+
+    def __init__(self, url: str, timeout: float = 30.0) -> None:
+        if not url.startswith(("http://", "https://")):
+            raise ValueError(f"Not an HTTP URL: {url!r}")  # noqa: TRY003
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def get(self, key: str) -> bytes | None:
+        from urllib.error import HTTPError
+        from urllib.request import urlopen
+
+        try:
+            with urlopen(f"{self.url}/{key}", timeout=self.timeout) as response:  # noqa: S310
+                return response.read()  # type: ignore[no-any-return]
+        except HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def put(self, key: str, data: bytes) -> None:
+        from urllib.request import Request, urlopen
+
+        request = Request(  # noqa: S310
+            f"{self.url}/{key}", data=data, method="PUT", headers={"Content-Type": "application/zip"}
+        )
+        with urlopen(request, timeout=self.timeout):  # noqa: S310
+            pass
+
+
+# URL scheme -> backend factory; locations without a scheme are local directories
+BACKENDS: dict[str, Callable[[str], CacheBackend]] = {
+    "http": HttpBackend,
+    "https": HttpBackend,
+    "file": lambda location: LocalBackend(location[len("file://") :]),
+}
+
+
+def backend_for(location: str) -> CacheBackend:
+    """Return the backend of ``location``: a URL with a scheme in :data:`BACKENDS`, or a directory path."""
+    scheme, sep, _ = location.partition("://")
+    if not sep:
+        return LocalBackend(location)
+    if scheme not in BACKENDS:
+        raise ValueError(f"No build cache backend for {scheme}:// locations")  # noqa: TRY003
+    return BACKENDS[scheme](location)
+
+
+def hash_tree(root: Path) -> str:
+    """Return the hex SHA-256 digest of the relative paths and contents of every file under ``root``."""
+    digest = hashlib.sha256()
+    for path in sorted(path for path in root.rglob("*") if path.is_file()):
+        digest.update(f"{path.relative_to(root).as_posix()}\0{hash_file(path)}\0".encode())
+    return digest.hexdigest()
+
+
+def pack_artifact(build: dict[str, Any], files: dict[str, bytes]) -> bytes:
+    """Return the zip artifact holding the JSON ``build`` description and ``files`` by relative path."""
+    import zipfile
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        entries = {_BUILD_ENTRY: json.dumps(build, sort_keys=True).encode()}
+        entries.update((_FILES_PREFIX + name, data) for name, data in sorted(files.items()))
+        for name, data in entries.items():
+            info = zipfile.ZipInfo(name, date_time=_DATE_TIME)
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, data)
+    return buffer.getvalue()
+
+
+def unpack_artifact(data: bytes) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """Return the build description and files of an artifact from :func:`pack_artifact`.
+
+    Raises:
+        ValueError: When ``data`` is no artifact or names a file outside its root.
+    """
+    import zipfile
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            build = json.loads(archive.read(_BUILD_ENTRY))
+            files = {
+                name[len(_FILES_PREFIX) :]: archive.read(name)
+                for name in archive.namelist()
+                if name.startswith(_FILES_PREFIX)
+            }
+    except (zipfile.BadZipFile, KeyError, zlib.error) as e:
+        raise ValueError(f"Not a build artifact: {e}") from e  # noqa: TRY003
+    for name in files:
+        path = Path(name)
+        if path.is_absolute() or ".." in path.parts:
+            raise ValueError(f"Build artifact names a file outside its root: {name!r}")  # noqa: TRY003
+    return build, files
+
+
+class BuildCache:
+    """Look up and store the artifacts of version package builds in a :class:`CacheBackend`.
+
+    Backend failures are reported and treated as misses, so an unreachable
+    or corrupt cache never fails a build.
+    """
+
+    def __init__(self, backend: CacheBackend, template_dir: Path) -> None:
+        self.backend = backend
+        # Everything every key depends on, whatever the version
+        self.salt = hash_text(str(ARTIFACT_FORMAT), get_version(), hash_tree(template_dir))
+
+    def key(self, idd_file: str | Path, eplus_version: str, options: dict[str, Any]) -> str:
+        """Return the key of building ``eplus_version`` from ``idd_file`` with the output-changing ``options``."""
+        return hash_text(self.salt, hash_file(idd_file), eplus_version, json.dumps(options, sort_keys=True))
+
+    def load(self, key: str) -> tuple[dict[str, Any], dict[str, bytes]] | None:
+        """Return the build description and files stored under ``key``, or ``None`` on a miss."""
+        try:
+            data = self.backend.get(key)
+            return None if data is None else unpack_artifact(data)
+        except (OSError, ValueError) as e:
+            print(f"Warning: ignoring build cache entry {key[:12]}: {e}")
+            return None
+
+    def store(self, key: str, build: dict[str, Any], files: dict[str, bytes]) -> None:
+        """Store the build description and files of a finished build under ``key``."""
+        try:
+            self.backend.put(key, pack_artifact(build, files))
+        except OSError as e:
+            print(f"Warning: could not store build cache entry {key[:12]}: {e}")
+
+
+def make_server(root: str | Path, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Return an HTTP server storing artifacts under ``root`` for :class:`HttpBackend` clients.
+
+    It stands in for a real artifact store: ``GET /<key>`` returns an
+    artifact or 404 and ``PUT /<key>`` stores one atomically.  Port 0 picks
+    a free port; call ``serve_forever()`` to run it.
+    """
+    from http.server import ThreadingHTTPServer
+
+    return ThreadingHTTPServer((host, port), _request_handler(LocalBackend(root)))
+
+
+def _request_handler(backend: LocalBackend) -> type[BaseHTTPRequestHandler]:
+    from http.server import BaseHTTPRequestHandler
+
+    class ArtifactHandler(BaseHTTPRequestHandler):
+        def _key(self) -> str | None:
+            key = self.path.strip("/")
+            if _KEY_RE.fullmatch(key):
+                return key
+            self.send_error(400, "Expected /<sha256 key>")
+            return None
+
+        def do_GET(self) -> None:
+            key = self._key()
+            if key is None:
+                return
+            data = backend.get(key)
+            if data is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/zip")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_PUT(self) -> None:
+            key = self._key()
+            if key is None:
+                return
+            backend.put(key, self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            self.send_response(204)
+            self.end_headers()
+
+    return ArtifactHandler
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a build cache directory over HTTP")
+    parser.add_argument("directory", help="Directory holding the artifacts")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    args = parser.parse_args(argv)
+    server = make_server(args.directory, args.host, args.port)
+    print(f"Serving build cache {args.directory} on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
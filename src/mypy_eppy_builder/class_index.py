@@ -0,0 +1,122 @@
+"""Index of the IDD keys, class names and stub modules of a version package.
+
+Class names are derived from IDD keys by
+:func:`~mypy_eppy_builder.idd_model.normalize_classname`, which cannot be
+reversed: ``Lead Input`` and ``Lead:Input`` both become ``Lead_Input``, and
+outside the ``per-class`` layout the stub file names do not even name the
+classes.  :class:`ClassIndex` records every object's key, class name and
+module once, while the IDD objects are at hand, and refuses keys that would
+share a class or stub file.  The overloads and the package templates read it,
+and each version package ships it as its runtime ``class_index`` module.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+from mypy_eppy_builder.idd_model import ObjectSpec
+from mypy_eppy_builder.layout import module_name
+from mypy_eppy_builder.lint import isort_key, member_key
+
+INDEX_MODULE = "class_index"
+INDEX_FILE = f"{INDEX_MODULE}.py"
+# Name of the ``{idf key: (key, classname, module)}`` dict in the runtime module
+_OBJECTS = "OBJECTS"
+
+
+class IndexEntry(NamedTuple):
+    """One IDD object: its key as the IDD spells it, its class name and the module defining the class."""
+
+    key: str
+    classname: str
+    module: str
+
+    @property
+    def idf_key(self) -> str:
+        """The key eppy files the object under in ``IDF.idfobjects``."""
+        return self.key.upper()
+
+
+def collisions(entries: Iterable[IndexEntry]) -> list[str]:
+    """Return a message for every IDF key, class name or module file name claimed by different objects.
+
+    Module names differing only in case collide too: they are one file on
+    case-insensitive file systems.
+    """
+    # Keys claiming each IDF key and class name (an object defined twice claims them twice)
+    claims: dict[tuple[str, str], list[str]] = {}
+    # Module names sharing each module file name
+    files: dict[str, set[str]] = {}
+    for entry in entries:
+        claims.setdefault(("IDF key", entry.idf_key), []).append(entry.key)
+        claims.setdefault(("class", entry.classname), []).append(entry.key)
+        files.setdefault(entry.module.lower(), set()).add(entry.module)
+    claims.update((("module file", name), sorted(modules)) for name, modules in files.items())
+    return [
+        f"{kind} {name!r} is claimed by {', '.join(map(repr, names))}"
+        for (kind, name), names in claims.items()
+        if len(names) > 1
+    ]
+
+
+class ClassIndex:
+    """IDD key <-> class name <-> module lookups of the objects of one version package."""
+
+    __slots__ = ("_by_classname", "_by_key", "entries")
+
+    def __init__(self, entries: Iterable[IndexEntry]) -> None:
+        self.entries = sorted(entries, key=lambda entry: isort_key(entry.classname))
+        problems = collisions(self.entries)
+        if problems:
+            raise ValueError("IDD objects collide in the class index: " + "; ".join(problems))
+        self._by_key = {entry.idf_key: entry for entry in self.entries}
+        self._by_classname = {entry.classname: entry for entry in self.entries}
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[ObjectSpec], layout: str = "per-class") -> ClassIndex:
+        """Index object ``specs`` with the modules ``layout`` writes their classes to."""
+        return cls(IndexEntry(spec.key, spec.classname, module_name(spec, layout)) for spec in specs)
+
+    @classmethod
+    def load(cls, path: Path) -> ClassIndex:
+        """Read the index back from a rendered ``class_index`` module without importing it."""
+        tree = ast.parse(path.read_text())
+        for node in tree.body:
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.target.id == _OBJECTS:
+                assert node.value is not None  # noqa: S101
+                objects: dict[str, tuple[str, str, str]] = ast.literal_eval(node.value)
+                return cls(IndexEntry(*entry) for entry in objects.values())
+        raise ValueError(f"{path} defines no {_OBJECTS}")  # noqa: TRY003
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        return iter(self.entries)
+
+    def by_key(self, key: str) -> IndexEntry:
+        """Return the entry of IDD ``key``, matched case-insensitively like ``IDF.idfobjects``."""
+        return self._by_key[key.upper()]
+
+    def by_classname(self, classname: str) -> IndexEntry:
+        """Return the entry of the class named ``classname``."""
+        return self._by_classname[classname]
+
+    @property
+    def classnames(self) -> list[str]:
+        """The class names, in isort order."""
+        return [entry.classname for entry in self.entries]
+
+    @property
+    def overloads(self) -> list[tuple[str, str]]:
+        """``(classname, idf key)`` pairs of the ``IDF`` overloads, in class name order."""
+        return [(entry.classname, entry.idf_key) for entry in self.entries]
+
+    @property
+    def class_modules(self) -> list[tuple[str, str]]:
+        """``(module, classname)`` pairs, in the order ruff's isort gives their imports."""
+        pairs = ((entry.module, entry.classname) for entry in self.entries)
+        return sorted(pairs, key=lambda pair: (isort_key(pair[0]), member_key(pair[1])))
@@ -0,0 +1,104 @@
+"""Find the IDD object types a corpus of models actually uses.
+
+A typical model uses a hundred or so of the ~800 IDD object types, yet a full
+stub package (and its ``IDF`` overloads, which every type check loads) covers
+all of them.  ``generate_package --subset-from`` scans a corpus of ``.idf``
+and ``.epJSON`` files with the helpers below and only builds stubs for the
+object types found there, plus an explicit allowlist.
+
+IDF files are streamed line by line and only the first token of every object
+is looked at, so scanning costs little more than reading the files.  Large
+corpora are scanned by several worker processes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+IDF_SUFFIXES = {".idf", ".imf"}
+EPJSON_SUFFIXES = {".epjson"}
+
+
+def corpus_files(paths: Iterable[str | Path]) -> list[Path]:
+    """Return the IDF and epJSON files in ``paths``, searching directories recursively."""
+    suffixes = IDF_SUFFIXES | EPJSON_SUFFIXES
+    files: set[Path] = set()
+    for path in map(Path, paths):
+        candidates = path.rglob("*") if path.is_dir() else [path]
+        files.update(file for file in candidates if file.suffix.lower() in suffixes and file.is_file())
+    return sorted(files)
+
+
+def scan_idf(path: str | Path) -> set[str]:
+    """Return the upper-cased object keys used in the IDF file at ``path``."""
+    keys: set[str] = set()
+    expecting_key = True
+    with open(path, encoding="latin-1") as idf_file:
+        for line in idf_file:
+            code = line.split("!", 1)[0]
+            while code:
+                if not expecting_key:
+                    # Skip field values up to the end of the current object
+                    end = code.find(";")
+                    if end < 0:
+                        break
+                    code = code[end + 1 :]
+                    expecting_key = True
+                    continue
+                code = code.lstrip()
+                if not code:
+                    break
+                comma, semicolon = code.find(","), code.find(";")
+                ends = [index for index in (comma, semicolon) if index >= 0]
+                end = min(ends) if ends else len(code)
+                keys.add(code[:end].strip().upper())
+                # Objects without fields (``Lead Input;``) end at their key
+                expecting_key = end == semicolon
+                code = code[end + 1 :]
+    keys.discard("")
+    return keys
+
+
+def scan_epjson(path: str | Path) -> set[str]:
+    """Return the upper-cased object types of the epJSON file at ``path``."""
+    with open(path, encoding="utf-8") as epjson_file:
+        model = json.load(epjson_file)
+    return {key.upper() for key in model} if isinstance(model, dict) else set()
+
+
+def scan_file(path: str | Path) -> set[str]:
+    """Return the upper-cased object keys used in an IDF or epJSON file."""
+    if Path(path).suffix.lower() in EPJSON_SUFFIXES:
+        return scan_epjson(path)
+    return scan_idf(path)
+
+
+def scan_corpus(files: list[Path], jobs: int = 1) -> Counter[str]:
+    """Count, for every upper-cased object key, the ``files`` that use it.
+
+    ``jobs`` worker processes share the files when there are several.
+    """
+    usage: Counter[str] = Counter()
+    if jobs <= 1 or len(files) < 2:
+        for keys in map(scan_file, files):
+            usage.update(keys)
+        return usage
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files), os.cpu_count() or 1)) as pool:
+        for keys in pool.map(scan_file, files, chunksize=chunksize):
+            usage.update(keys)
+    return usage
+
+
+def subset_keys(paths: Iterable[str | Path], allow: Iterable[str] = (), jobs: int = 1) -> frozenset[str]:
+    """Return the upper-cased object keys used by the corpus under ``paths`` plus the ``allow``-listed keys."""
+    files = corpus_files(paths)
+    usage = scan_corpus(files, jobs)
+    print(f"Found {len(usage)} object type(s) in {len(files)} model file(s)")
+    return frozenset(usage) | {key.upper() for key in allow}
@@ -0,0 +1,62 @@
+"""Share class stubs that are identical across EnergyPlus versions.
+
+Most IDD classes do not change between adjacent EnergyPlus releases, yet
+every ``types-eplusXX`` package would otherwise ship its own copy of every
+stub.  The rendered stubs of all versions are content-hashed; each class
+rendered identically by several versions is moved to the
+``types-eplus-common`` package, and those versions keep a one-line stub
+re-exporting it, so ``types_eplusXX.<ClassName>`` imports (and the ``IDF``
+overloads built on them) keep resolving to the right class.
+"""
+
+from __future__ import annotations
+
+from mypy_eppy_builder.manifest import hash_text
+
+COMMON_PACKAGE_NAME = "types-eplus-common"
+COMMON_PACKAGE_SLUG = "types_eplus_common"
+
+
+def shared_stubs(stubs_by_version: dict[str, dict[str, str]]) -> dict[str, str]:
+    """Return the stubs to move to the common package, keyed by file name.
+
+    ``stubs_by_version`` maps versions, oldest first, to their rendered
+    ``{file name: stub}``.  For every file the content rendered by the most
+    versions is shared when at least two versions rendered it; ties go to
+    the newest version's content.
+    """
+    shared: dict[str, str] = {}
+    names = sorted({name for stubs in stubs_by_version.values() for name in stubs})
+    for name in names:
+        # Content hash -> positions of the versions rendering that content
+        ranks: dict[str, list[int]] = {}
+        contents: dict[str, str] = {}
+        for rank, stubs in enumerate(stubs_by_version.values()):
+            if name in stubs:
+                digest = hash_text(stubs[name])
+                ranks.setdefault(digest, []).append(rank)
+                contents[digest] = stubs[name]
+        best = max(ranks, key=lambda digest: (len(ranks[digest]), ranks[digest][-1]))
+        if len(ranks[best]) >= 2:
+            shared[name] = contents[best]
+    return shared
+
+
+def reexport_stub(classname: str, common_slug: str = COMMON_PACKAGE_SLUG) -> str:
+    """Return a stub re-exporting ``classname`` from the common package."""
+    line = f"from {common_slug}.{classname} import {classname} as {classname}"
+    # Wrapped the way ruff's isort wraps lines over 120 characters
+    if len(line) > 120:
+        line = f"from {common_slug}.{classname} import (\n    {classname} as {classname},\n)"
+    return line + "\n"
+
+
+def reexport_shared(stubs_by_version: dict[str, dict[str, str]], shared: dict[str, str]) -> dict[str, dict[str, str]]:
+    """Return every version's stubs with those identical to a ``shared`` stub replaced by re-exports."""
+    return {
+        version: {
+            name: reexport_stub(name[: -len(".pyi")]) if shared.get(name) == content else content
+            for name, content in stubs.items()
+        }
+        for version, stubs in stubs_by_version.items()
+    }
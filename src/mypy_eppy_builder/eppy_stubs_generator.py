@@ -1,166 +1,524 @@
+import json
 import os
-import re
+import time
 from pathlib import Path
-from string import ascii_letters, digits
-from typing import Optional, cast
+from typing import Callable, NamedTuple, Optional, TypeVar, Union, cast
 
-from archetypal.idfclass import IDF
-from jinja2 import Environment, FileSystemLoader
+from mypy_eppy_builder import profiling
+from mypy_eppy_builder.class_index import INDEX_FILE, ClassIndex
+from mypy_eppy_builder.idd_cache import IddCache
+from mypy_eppy_builder.idd_model import (
+    FieldSpec,
+    ObjectSpec,
+    build_object_specs,
+    field_base_type,
+    normalize_classname,
+    normalize_field_name,
+    object_spec,
+    validation_rule,
+)
+from mypy_eppy_builder.idd_parser import parse_idd
+from mypy_eppy_builder.layout import class_imports, layout_modules
+from mypy_eppy_builder.lint import isort_key
+from mypy_eppy_builder.manifest import STUBS_MANIFEST_NAME, Manifest, hash_text, write_if_changed
+from mypy_eppy_builder.slim import (
+    ALIASES_FILE,
+    ALIASES_MODULE,
+    annotation_imports,
+    field_type,
+    import_statement,
+    shared_aliases,
+    truncate_doc,
+)
+from mypy_eppy_builder.templating import get_environment
+from mypy_eppy_builder.version import get_version
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+_T = TypeVar("_T")
+_S = TypeVar("_S")
+
+# Templates the class stubs are rendered from, relative to the template directory
+STUB_TEMPLATES = ("common/class_stub.pyi.jinja2", "common/module_stub.pyi.jinja2", "common/stubs.jinja2")
+
+
+class StubField(NamedTuple):
+    """A field as a slim class stub spells it: its annotation may be an alias and its note shortened."""
+
+    name: str
+    type: str
+    note: str
+
 
 # --- Utility to parse IDD definitions and generate stubs ---
 class EppyStubGenerator:
-    def __init__(self, idd_path: str, output_dir: str, template_dir: str = str(TEMPLATE_DIR)):
+    def __init__(
+        self,
+        idd_path: str,
+        output_dir: str,
+        template_dir: str = str(TEMPLATE_DIR),
+        *,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        incremental: bool = False,
+        manifest_path: Optional[str] = None,
+        jobs: int = 1,
+        subset: Optional[frozenset[str]] = None,
+        extensible_groups: Optional[int] = 1,
+        slim: bool = False,
+        slim_docs: str = "truncate",
+        field_constraints: bool = True,
+        layout: str = "per-class",
+    ):
         self.idd_path = idd_path
         self.output_dir = output_dir
-        self.idf = IDF()
-        self.env = Environment(  # noqa: S701
-            loader=FileSystemLoader(template_dir),
-            trim_blocks=False,
-            lstrip_blocks=False,
-        )
+        self.template_dir = template_dir
+        self.incremental = incremental
+        self.jobs = jobs
+        # Upper-cased IDD object keys to generate stubs for (all objects when None)
+        self.subset = subset
+        # Extensible groups spelled out in each stub (all when None); later numbered fields are not declared
+        self.extensible_groups = extensible_groups
+        # Slim stubs share annotations through the ``_aliases`` stub and ``truncate`` or ``drop`` their docs;
+        # without ``field_constraints`` they also drop the ``pydantic.Field`` metadata
+        self.slim = slim
+        self.slim_docs = slim_docs
+        self.field_constraints = field_constraints
+        self._aliases: Optional[dict[str, str]] = None
+        # Module layout of the class stubs, one of ``layout.LAYOUTS``
+        self.layout = layout
+        self.manifest_path = manifest_path or os.path.join(output_dir, STUBS_MANIFEST_NAME)
+        self.cache: Optional[IddCache] = IddCache(cache_dir) if use_cache else None
+        self._idd_info: Optional[list[list[dict]]] = None
+        self._object_specs: Optional[list[ObjectSpec]] = None
+        self._class_index: Optional[ClassIndex] = None
+        self.env = get_environment(template_dir, trim_blocks=False, lstrip_blocks=False)
 
-    def normalize_classname(self, obj_name: str) -> str:
-        """Return a valid Python class name for an IDD object.
-
-        EnergyPlus object names can contain characters such as spaces or
-        colons (e.g. ``BuildingSurface:Detailed``).  The original
-        implementation applied :py:meth:`str.title` which lower-cased
-        characters following an existing capital, producing names like
-        ``Buildingsurface_Detailed``.  That behaviour broke the expected
-        camel-casing of many IDD objects.
-
-        This version simply replaces any non alpha-numeric character with an
-        underscore while preserving the original casing of the remaining
-        characters so the example above becomes
-        ``BuildingSurface_Detailed``.
+    @property
+    def idd_info(self) -> list[list[dict]]:
+        """IDD object records for ``idd_path``, loaded on first access.
+
+        Records come from the on-disk parse cache when enabled, so a warm run
+        skips parsing the IDD entirely.
         """
+        if self._idd_info is None:
+            with profiling.phase("load IDD", idd=self.idd_path, cached=self.cache is not None):
+                if self.cache is not None:
+                    self._idd_info = self.cache.get_or_parse(self.idd_path)
+                else:
+                    self._idd_info = parse_idd(self.idd_path)
+        return self._idd_info
+
+    def reload(self) -> None:
+        """Forget the loaded IDD records so the next access reads ``idd_path`` again."""
+        self._idd_info = None
+        self._object_specs = None
+        self._class_index = None
+        self._aliases = None
+
+    def object_records(self) -> list[list[dict]]:
+        """The ``idd_info`` records of the objects to generate stubs for (those in ``subset``, if set)."""
+        records = self.idd_info[1:]
+        if self.subset is None:
+            return records
+        return [record for record in records if record[0]["idfobj"].upper() in self.subset]
 
-        return re.sub(r"[^0-9a-zA-Z]+", "_", obj_name.strip())
+    @property
+    def object_specs(self) -> list[ObjectSpec]:
+        """Typed specs of the objects in :meth:`object_records`, built on first access."""
+        if self._object_specs is None:
+            with profiling.phase("build object specs"):
+                self._object_specs = build_object_specs(self.object_records())
+        return self._object_specs
+
+    def normalize_classname(self, obj_name: str) -> str:
+        """Return a valid Python class name for an IDD object (see :func:`idd_model.normalize_classname`)."""
+        return normalize_classname(obj_name)
 
     def normalize_field_name(self, field_name: str) -> str:
         """Normalize field names using same process as `eppy`."""
-
-        def onlylegalchar(name):
-            """return only legal chars"""
-            legalchar = ascii_letters + digits + " "
-            return "".join([s for s in name[:] if s in legalchar])
-
-        def makefieldname(namefromidd):
-            """made a field name that can be used by bunch"""
-            newname = onlylegalchar(namefromidd)
-            bunchname = newname.replace(" ", "_")
-            return bunchname
-
-        return makefieldname(field_name)
-
-    def _get_numeric_limits(self, field: dict[str, list[str]]) -> dict[str, str]:
-        """Return pydantic Field constraints from an IDD field definition."""
-        mapping = {
-            "minimum": "ge",
-            "minimum>": "gt",
-            "maximum": "le",
-            "maximum<": "lt",
-        }
-        limits: dict[str, str] = {}
-        for key, arg in mapping.items():
-            val = field.get(key, [""])[0]
-            if val not in (None, ""):
-                limits[arg] = val
-        return limits
-
-    def _format_default(self, base_type: str, value: str) -> Optional[str]:
-        if value in (None, "", "none", "NONE", "None"):
-            return None
-        if base_type == "str" or base_type.startswith("Literal"):
-            return repr(value)
-        return value
+        return normalize_field_name(field_name)
 
     def get_field_type(self, field: dict[str, list[str]]) -> str:
-        field_type = field.get("type", ["alpha"])[0]
-        if field_type == "real":
-            return "float"
-        elif field_type == "integer":
-            return "int"
-        elif field_type == "choice":
-            choices = field.get("key", [])
-            if choices:
-                return f"Literal[{', '.join(map(repr, choices))}]"
-            else:
-                return "str"
-        else:
-            return "str"
+        return field_base_type(field)
 
-    def render_class_stub(self, obj: dict, fields: list[dict[str, list[str]]]) -> str:
-        classname = self.normalize_classname(obj["idfobj"])
-        class_memo = obj.get("memo", [""])[0]
-        stub_fields = []
-        for field in fields:
-            field_name = self.normalize_field_name(field["field"][0])
-            base_type = self.get_field_type(field)
-            limits = self._get_numeric_limits(field) if base_type in {"int", "float"} else {}
-            field_args = []
-            default_val = self._format_default(base_type, field.get("default", [""])[0])
-            field_args.extend(f"{k}={v}" for k, v in limits.items())
-            # If 'required-field' is present, always add a default (even if None)
-            require_field = "required-field" in field
-            if default_val is not None:
-                field_args.append(f"default={default_val}")
-            elif require_field:
-                field_args.insert(0, "default=...")
-            field_note = field.get("note", [""])[0]
-            stub_fields.append({
-                "name": field_name,
-                "type": f"Annotated[{base_type}, Field({', '.join(field_args)})]",
-                "note": field_note,
-            })
+    @property
+    def modules(self) -> dict[str, list[ObjectSpec]]:
+        """``{module: specs}`` of the class stub modules written in :attr:`layout`."""
+        # Objects colliding in the index would overwrite each other's classes or files
+        self.class_index  # noqa: B018
+        return layout_modules(self.object_specs, self.layout)
+
+    @property
+    def class_index(self) -> ClassIndex:
+        """The IDD key, class name and module of every object in :attr:`object_specs`, built on first access.
+
+        Raises:
+            ValueError: When two objects would share an IDF key, a class or a stub file.
+        """
+        if self._class_index is None:
+            self._class_index = ClassIndex.from_specs(self.object_specs, self.layout)
+        return self._class_index
+
+    @property
+    def aliases(self) -> dict[str, str]:
+        """``{annotation: alias}`` of the annotations slim stubs share through the ``_aliases`` stub."""
+        if self._aliases is None:
+            self._aliases = shared_aliases(
+                field_type(field, self.field_constraints)
+                for spec in self.object_specs
+                for field in spec.stub_fields(self.extensible_groups)
+            )
+        return self._aliases
+
+    @property
+    def _writes_aliases(self) -> bool:
+        # No shared annotation, no ``_aliases`` stub: it would hold an unused import
+        return self.slim and bool(self.aliases)
+
+    def _doc(self, text: str) -> str:
+        if not self.slim:
+            return text
+        return truncate_doc(text) if self.slim_docs == "truncate" and text.strip() else ""
+
+    def render_spec(self, spec: ObjectSpec) -> str:
+        """Render the class stub of one IDD object spec."""
         template = self.env.get_template("common/class_stub.pyi.jinja2")
-        return cast(
-            str,
-            template.render(
-                classname=classname,
-                class_memo=class_memo,
-                fields=stub_fields,
-            ),
+        context = self._class_context(spec)
+        return cast(str, template.render(**context, **self._import_context([context])))
+
+    def render_module(self, specs: list[ObjectSpec]) -> str:
+        """Render the class stubs of ``specs`` into one module, sharing its imports."""
+        template = self.env.get_template("common/module_stub.pyi.jinja2")
+        classes = [self._class_context(spec) for spec in specs]
+        return cast(str, template.render(classes=classes, **self._import_context(classes)))
+
+    def _class_context(self, spec: ObjectSpec) -> dict:
+        """Return the template context of the class stub of ``spec``.
+
+        Slim stubs get :class:`StubField` fields, their shared annotations
+        replaced by aliases and their notes shortened.
+        """
+        spec_fields = spec.stub_fields(self.extensible_groups)
+        fields: Union[tuple[FieldSpec, ...], list[StubField]] = spec_fields
+        if self.slim:
+            aliases = self.aliases
+            fields = [
+                StubField(field.name, aliases.get(type_, type_), self._doc(field.note))
+                for field in spec_fields
+                for type_ in [field_type(field, self.field_constraints)]
+            ]
+        return {
+            "classname": spec.classname,
+            "class_memo": self._doc(spec.memo),
+            "fields": fields,
+        }
+
+    def _import_context(self, classes: list[dict]) -> dict:
+        """Return the imports a module defining ``classes`` (class contexts) needs."""
+        types = {field.type for context in classes for field in context["fields"]}
+        alias_names = set(self.aliases.values()) if self.slim else set()
+        names, field_import = annotation_imports(types - alias_names)
+        used = sorted(types & alias_names, key=lambda name: int(name[1:]))
+        return {
+            "typing_imports": names,
+            "field_import": field_import,
+            "alias_import": import_statement(f".{ALIASES_MODULE}", used) if used else "",
+        }
+
+    def render_aliases(self) -> str:
+        """Render the ``_aliases`` stub defining the annotations shared by slim stubs."""
+        env = get_environment(self.template_dir, trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+        names, field_import = annotation_imports(self.aliases)
+        template = env.get_template("common/aliases.pyi.jinja2")
+        aliases = [(name, annotation) for annotation, name in self.aliases.items()]
+        return cast(str, template.render(aliases=aliases, typing_imports=names, field_import=field_import))
+
+    def full_stub_size(self) -> int:
+        """Return the size in bytes of the stubs rendered without slim mode, for comparison."""
+        full = EppyStubGenerator(
+            "",
+            "",
+            self.template_dir,
+            use_cache=False,
+            jobs=self.jobs,
+            extensible_groups=self.extensible_groups,
+            layout=self.layout,
         )
+        full._object_specs = self.object_specs
+        return sum(len(content.encode()) for content in full.render_files(list(full.modules.values())))
+
+    def _render_settings(self) -> dict:
+        """The settings render worker processes need to render stubs exactly like this generator."""
+        return {
+            "extensible_groups": self.extensible_groups,
+            "slim": self.slim,
+            "slim_docs": self.slim_docs,
+            "field_constraints": self.field_constraints,
+            "layout": self.layout,
+        }
+
+    def render_validator(self, eplus_version: str = "") -> str:
+        """Render the runtime validation module checking the objects of :attr:`object_specs`."""
+        with profiling.phase("render validator", classes=len(self.object_specs)):
+            env = get_environment(self.template_dir, trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+            objects = [
+                (
+                    spec.idf_key,
+                    [
+                        python_literal(rule)
+                        for position, field in enumerate(spec.fields, 1)
+                        if (rule := validation_rule(field, position)) is not None
+                    ],
+                )
+                for spec in self.object_specs
+            ]
+            template = env.get_template("common/validation.py.jinja2")
+            return cast(str, template.render(objects=objects, eplus_version=eplus_version))
+
+    def render_class_index(self, eplus_version: str = "") -> str:
+        """Render the runtime ``class_index`` module of :attr:`class_index`."""
+        env = get_environment(self.template_dir, trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+        objects = [(python_literal(entry.idf_key), python_literal(tuple(entry))) for entry in self.class_index]
+        template = env.get_template("common/class_index.py.jinja2")
+        return cast(str, template.render(objects=objects, eplus_version=eplus_version))
+
+    def render_class_stub(self, obj: dict, fields: list[dict[str, list[str]]]) -> str:
+        """Render the class stub of a raw ``obj``/``fields`` IDD record."""
+        return self.render_spec(object_spec([obj, *fields]))
+
+    def _template_fingerprint(self) -> str:
+        """Hash the class stub template sources together with the builder version and stub settings."""
+        sources = []
+        for name in STUB_TEMPLATES:
+            try:
+                sources.append((Path(self.template_dir) / name).read_text())
+            except OSError:
+                sources.append("")
+        source = "\n".join(sources)
+        settings = json.dumps(self._render_settings(), sort_keys=True)
+        aliases = json.dumps(self.aliases, sort_keys=True) if self.slim else ""
+        return hash_text(source, get_version(), settings, aliases)
+
+    def render_many(self, specs: list[ObjectSpec]) -> list[str]:
+        """Render object ``specs``, in order, using ``jobs`` worker processes.
+
+        Each worker compiles the class template once in its initializer, and
+        the output is identical to rendering the specs serially.  While
+        profiling, every object's render time and output size is recorded.
+        """
+        with profiling.phase("render stubs", classes=len(specs), jobs=self.jobs):
+            if not profiling.enabled():
+                return self._map_specs(specs, _render_in_worker)
+            timed = self._map_specs(specs, _render_timed_in_worker)
+            for spec, (content, start, end, pid) in zip(specs, timed):
+                profiling.record(spec.key, start, end, pid=pid, fields=len(spec.fields), bytes=len(content))
+            return [content for content, *_ in timed]
+
+    def render_files(self, modules: list[list[ObjectSpec]]) -> list[str]:
+        """Render the class stub module of each list of specs in ``modules`` (one spec each per class)."""
+        if self.layout == "per-class":
+            return self.render_many([spec for specs in modules for spec in specs])
+        with profiling.phase("render modules", modules=len(modules), jobs=self.jobs):
+            return self._map_specs(modules, _render_module_in_worker)
+
+    def _map_specs(self, specs: list[_S], worker: Callable[[_S, Optional["EppyStubGenerator"]], _T]) -> list[_T]:
+        """Map ``worker`` over ``specs``, in this process or in ``jobs`` initialized worker processes."""
+        if self.jobs <= 1 or len(specs) < 2:
+            return [worker(spec, self) for spec in specs]
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(specs) // (self.jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_render_worker,
+            initargs=(self.template_dir, self._render_settings(), self.aliases if self.slim else None),
+        ) as pool:
+            return list(pool.map(worker, specs, chunksize=chunksize))
+
+    def _write_many(self, writes: list[tuple[Path, str]]) -> list[bool]:
+        """Write ``(path, content)`` pairs through a thread pool, skipping identical files."""
+        with profiling.phase("write stubs", files=len(writes)):
+            if self.jobs <= 1:
+                return [write_if_changed(path, content) for path, content in writes]
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(32, self.jobs * 2)) as pool:
+                return list(pool.map(lambda item: write_if_changed(*item), writes))
+
+    def render_stubs(self) -> dict[str, str]:
+        """Return ``{file name: stub}`` for every class stub module without writing anything."""
+        modules = self.modules
+        contents = self.render_files(list(modules.values()))
+        stubs = {f"{module}.pyi": content for module, content in zip(modules, contents)}
+        if self._writes_aliases:
+            stubs[ALIASES_FILE] = self.render_aliases()
+        return stubs
 
     def generate_stubs(self) -> None:
         os.makedirs(self.output_dir, exist_ok=True)
-        idd_info: list[list[dict]] = self.idf.idd_info  # type: ignore[var-annotated]
-
-        for obj, *fields in idd_info[1:]:
-            stub_content = self.render_class_stub(obj, fields)
-            file_name = f"{self.normalize_classname(obj['idfobj'])}.pyi"
-            with open(os.path.join(self.output_dir, file_name), "w") as stub_file:
-                stub_file.write(stub_content)
+        if self.incremental:
+            self._generate_stubs_incremental()
+            return
+        modules = self.modules
+        output_dir = Path(self.output_dir)
+        contents = self.render_files(list(modules.values()))
+        paths = [output_dir / f"{module}.pyi" for module in modules]
+        if self._writes_aliases:
+            paths.append(output_dir / ALIASES_FILE)
+            contents.append(self.render_aliases())
+        self._write_many(list(zip(paths, contents)))
+        # Drop stubs of objects no longer generated, e.g. when switching to a subset
+        for stale in set(output_dir.glob("*.pyi")) - set(paths):
+            stale.unlink()
         print(f"Stubs generated successfully in {self.output_dir}")
 
+    def _generate_stubs_incremental(self) -> None:
+        """Re-render only stub modules whose IDD records or templates changed.
+
+        Files whose rendered content matches the manifest are not rewritten, and
+        stubs recorded in the manifest for modules no longer generated are
+        deleted.
+        """
+        output_dir = Path(self.output_dir)
+        manifest = Manifest.load(Path(self.manifest_path))
+        fingerprint = self._template_fingerprint()
+        records = {
+            id(spec): json.dumps(record, sort_keys=True)
+            for record, spec in zip(self.object_records(), self.object_specs)
+        }
+        current: set[str] = set()
+        pending: list[tuple[str, str, list[ObjectSpec]]] = []
+        for module, specs in self.modules.items():
+            file_name = f"{module}.pyi"
+            current.add(file_name)
+            input_hash = hash_text(fingerprint, *(records[id(spec)] for spec in specs))
+            if not (manifest.is_fresh(file_name, input_hash) and (output_dir / file_name).exists()):
+                pending.append((file_name, input_hash, specs))
+
+        contents = self.render_files([specs for _, _, specs in pending])
+        writes: list[tuple[Path, str]] = []
+        for (file_name, input_hash, _), stub_content in zip(pending, contents):
+            stub_path = output_dir / file_name
+            output_hash = hash_text(stub_content)
+            if not (manifest.has_output(file_name, output_hash) and stub_path.exists()):
+                writes.append((stub_path, stub_content))
+            manifest.record(file_name, input_hash, output_hash)
+        written = sum(self._write_many(writes))
+
+        stale = manifest.prune(current)
+        for file_name in stale:
+            (output_dir / file_name).unlink(missing_ok=True)
+        if self._writes_aliases:
+            written += write_if_changed(output_dir / ALIASES_FILE, self.render_aliases())
+        else:
+            (output_dir / ALIASES_FILE).unlink(missing_ok=True)
+        manifest.save()
+        print(f"Stubs updated in {self.output_dir}: {written} written, {len(stale)} removed")
+
+
+# Per-process generator used by ``render_many`` worker processes.
+_worker_generator: Optional[EppyStubGenerator] = None
+
+
+def _init_render_worker(template_dir: str, settings: dict, aliases: Optional[dict[str, str]]) -> None:
+    global _worker_generator
+    _worker_generator = EppyStubGenerator("", "", template_dir, use_cache=False, **settings)
+    _worker_generator._aliases = aliases
+    _worker_generator.env.get_template("common/class_stub.pyi.jinja2")
+    _worker_generator.env.get_template("common/module_stub.pyi.jinja2")
+
+
+def _render_in_worker(spec: ObjectSpec, generator: Optional[EppyStubGenerator] = None) -> str:
+    """Render ``spec`` with ``generator``, or with this worker process's generator."""
+    generator = generator or _worker_generator
+    assert generator is not None  # noqa: S101
+    return generator.render_spec(spec)
+
+
+def _render_module_in_worker(specs: list[ObjectSpec], generator: Optional[EppyStubGenerator] = None) -> str:
+    """Render the module of ``specs`` with ``generator``, or with this worker process's generator."""
+    generator = generator or _worker_generator
+    assert generator is not None  # noqa: S101
+    return generator.render_module(specs)
+
+
+def _render_timed_in_worker(
+    spec: ObjectSpec, generator: Optional[EppyStubGenerator] = None
+) -> tuple[str, int, int, int]:
+    """Like :func:`_render_in_worker`, also returning the render's start and end times and the process id."""
+    start = time.perf_counter_ns()
+    content = _render_in_worker(spec, generator)
+    return content, start, time.perf_counter_ns(), os.getpid()
+
+
+def python_literal(value: object) -> str:
+    """Return Python source for ``value`` (built of tuples, strings, numbers, booleans and ``None``) in ruff's style."""
+    if isinstance(value, str):
+        # JSON escapes are valid Python escapes, and JSON strings are double-quoted
+        return json.dumps(value)
+    if isinstance(value, tuple):
+        items = ", ".join(map(python_literal, value))
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
 
 def classname_to_key(classname: str) -> str:
+    """Guess the IDF key of ``classname`` from its name alone.
+
+    The guess is wrong for keys with spaces, hyphens or underscores (the
+    class ``Lead_Input`` is ``LEAD INPUT``, not ``LEAD:INPUT``), so it is only
+    used for stub directories without a ``class_index`` module.
+    """
     parts = classname.split("_")
     return ":".join(part.upper() for part in parts)
 
 
-def generate_overloads(stubs_dir: str, output_file: str, template_dir: Path = TEMPLATE_DIR) -> None:
-    env = Environment(
-        autoescape=True,
-        loader=FileSystemLoader(str(template_dir)),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-    classnames = []
-    for file in os.listdir(stubs_dir):
-        if file.endswith(".pyi"):
-            classname = file[:-4]
-            classnames.append(classname)
-    overloads = [{"classname": classname, "key": classname_to_key(classname)} for classname in classnames]
-    template = env.get_template("common/idf.pyi.jinja2")
-    rendered = cast(str, template.render(classnames=classnames, overloads=overloads))
-    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w") as f:
-        f.write(rendered)
+def generate_overloads(
+    stubs_dir: str,
+    output_file: str,
+    template_dir: Path = TEMPLATE_DIR,
+    overload_style: str = "full",
+    package: Optional[dict] = None,
+    index: Optional[ClassIndex] = None,
+) -> None:
+    """Render a standalone ``IDF`` stub with overloads for every class of ``stubs_dir``.
+
+    ``package`` supplies ``epbunch_path`` and ``data.pypi_stubs_name`` to the
+    template; by default the class stubs are imported from the package named
+    after ``stubs_dir``.  The classes, their IDF keys and their modules come
+    from the class ``index``, by default the ``class_index`` module of
+    ``stubs_dir``.  Only a directory without one is scanned for per-class
+    stubs, whose keys are then guessed from the file names.
+    """
+    with profiling.phase("generate_overloads", overload_style=overload_style):
+        env = get_environment(template_dir, autoescape=True, trim_blocks=True, lstrip_blocks=True)
+        index_file = Path(stubs_dir) / INDEX_FILE
+        if index is None and index_file.exists():
+            index = ClassIndex.load(index_file)
+        if index is not None:
+            overloads = index.overloads
+            class_modules = index.class_modules
+        else:
+            stub_files = (file for file in os.listdir(stubs_dir) if file.endswith(".pyi") and not file.startswith("_"))
+            classnames = sorted((file[:-4] for file in stub_files), key=isort_key)
+            overloads = [(classname, classname_to_key(classname)) for classname in classnames]
+            class_modules = [(classname, classname) for classname in classnames]
+        if package is None:
+            package = {"epbunch_path": "eppy.bunch_subclass", "data": {"pypi_stubs_name": Path(stubs_dir).name}}
+        template = env.get_template("common/idf.pyi.jinja2")
+        rendered = cast(
+            str,
+            template.render(
+                class_imports=class_imports(class_modules),
+                overloads=overloads,
+                overload_style=overload_style,
+                package=package,
+            ),
+        )
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            f.write(rendered)
 
 
 # --- Main usage example ---
@@ -171,4 +529,4 @@ if __name__ == "__main__":
 
     generator = EppyStubGenerator(idd_file, stubs_output_dir)
     generator.generate_stubs()
-    # generate_overloads(stubs_output_dir, "./typings/archetypal/idfclass/idf.pyi")
+    # generate_overloads(stubs_output_dir, "./typings/archetypal/idfclass/idf.pyi", index=generator.class_index)
@@ -2,137 +2,881 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
+import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
-from archetypal import EnergyPlusVersion
-from jinja2 import Environment, FileSystemLoader
+from mypy_eppy_builder import profiling
+from mypy_eppy_builder.archive import build_sdist, build_wheel, core_metadata, wheel_contents
+from mypy_eppy_builder.build_cache import BUILD_CACHE_ENV, BuildCache, backend_for
+from mypy_eppy_builder.class_index import INDEX_FILE
+from mypy_eppy_builder.corpus import subset_keys
+from mypy_eppy_builder.dedupe import COMMON_PACKAGE_NAME, COMMON_PACKAGE_SLUG, reexport_shared, shared_stubs
+from mypy_eppy_builder.eppy_stubs_generator import STUB_TEMPLATES, EppyStubGenerator
+from mypy_eppy_builder.idd_cache import IddCache
+from mypy_eppy_builder.layout import LAYOUTS, class_imports
+from mypy_eppy_builder.lint import (
+    changed_since,
+    dunder_all_key,
+    isort_key,
+    lint_sample,
+    ruff_fix,
+    verify_lint,
+)
+from mypy_eppy_builder.manifest import (
+    STUBS_MANIFEST_NAME,
+    TEMPLATES_MANIFEST_NAME,
+    Manifest,
+    hash_text,
+    write_if_changed,
+)
+from mypy_eppy_builder.templating import enable_bytecode_cache, get_environment, render_string
+from mypy_eppy_builder.version import get_version
+from mypy_eppy_builder.watch import poll
 
-from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator, classname_to_key
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 # Set up paths
 TEMPLATES_DIR = Path(__file__).parent / "templates"
+CLASS_STUB_TEMPLATES = tuple(TEMPLATES_DIR / name for name in STUB_TEMPLATES)
+VALIDATION_TEMPLATE = TEMPLATES_DIR / "common" / "validation.py.jinja2"
+# Runtime module of every version package checking IDF objects against the IDD
+VALIDATION_MODULE = "validation.py"
+VERSION_TEMPLATES_DIR = TEMPLATES_DIR / "version-package"
+# Wrapper packages, each rendered from the ``types-<package type>`` template tree
+PACKAGE_TYPES = ("archetypal", "eppy")
 OUTPUT_DIR = Path(__file__).parents[2] / "generated_package"
 
 
+def _template_environment(template_base: Path) -> Environment:
+    # Shared Jinja2 environment: templates and path patterns compile once per process
+    return get_environment(
+        template_base,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        autoescape=True,
+        keep_trailing_newline=True,
+    )
+
+
+def render_template_files(
+    template_files: list[Path],
+    context: dict | None = None,
+    *,
+    template_base: Path = TEMPLATES_DIR,
+) -> dict[str, str]:
+    """Render Jinja templates in memory.
+
+    Returns:
+        The rendered contents keyed by output path relative to ``template_base``
+        (path patterns rendered and the ``.jinja2`` extension removed).
+    """
+    group = Path(os.path.commonpath([path.parent for path in template_files])).name if template_files else ""
+    with profiling.phase("render templates", templates=group, files=len(template_files)):
+        env = _template_environment(template_base)
+        rendered: dict[str, str] = {}
+        for template_file in template_files:
+            rel_template_path = template_file.relative_to(template_base)
+            rendered_rel_path = render_string(env, str(rel_template_path.parent), context)
+            rendered_file_name = render_string(env, template_file.name.replace(".jinja2", ""), context)
+            template = env.get_template(rel_template_path.as_posix())
+            rendered[(Path(rendered_rel_path) / rendered_file_name).as_posix()] = template.render(context)
+    return rendered
+
+
 def render_templates(
     template_files: list[Path],
     context: dict | None = None,
     *,
     output_base: Path = OUTPUT_DIR,
     template_base: Path = TEMPLATES_DIR,
+    incremental: bool = False,
 ) -> None:
-    """Render Jinja templates to ``output_base`` preserving relative layout."""
-    # Jinja2 environment
-    env = Environment(
-        loader=FileSystemLoader(template_base),
-        trim_blocks=True,
-        lstrip_blocks=True,
-        autoescape=True,
-        keep_trailing_newline=True,
-    )
-    for template_file in template_files:
-        # Compute relative path and destination
-        rel_template_path = template_file.relative_to(template_base)
-        rendered_rel_path = env.from_string(str(rel_template_path.parent)).render(context)
+    """Render Jinja templates to ``output_base`` preserving relative layout.
 
-        # Render file name (remove '.jinja2' extension)
-        rendered_file_name = env.from_string(template_file.name.replace(".jinja2", "")).render(context)
+    With ``incremental`` set, files whose rendered content matches the
+    manifest kept in ``output_base`` are left untouched.
+    """
+    rendered = render_template_files(template_files, context, template_base=template_base)
+    with profiling.phase("write templates", files=len(rendered)):
+        manifest = Manifest.load(Path(output_base) / TEMPLATES_MANIFEST_NAME) if incremental else None
+        for name, rendered_content in rendered.items():
+            output_path = Path(output_base) / name
+            if manifest is None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, "w") as f:
+                    f.write(rendered_content)
+                continue
+            output_hash = hash_text(rendered_content)
+            if not (manifest.has_output(name, output_hash) and output_path.exists()):
+                write_if_changed(output_path, rendered_content)
+            manifest.record(name, output_hash, output_hash)
+        if manifest is not None:
+            manifest.save()
 
-        output_path = Path(output_base) / rendered_rel_path / rendered_file_name
-        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Render and write file content
-        template = env.get_template(str(rel_template_path))
-        rendered_content = template.render(context)
+# Version and trove classifiers of the generated packages, kept in sync with
+# the pyproject.toml templates for archives built without a build backend.
+VERSION_PACKAGE_VERSION = "0.1.0"
+STUB_CLASSIFIERS = ["Typing :: Stubs Only", "Programming Language :: Python :: 3"]
 
-        with open(output_path, "w") as f:
-            f.write(rendered_content)
+# EnergyPlus releases a version range can expand to, in order; extend it with each new release.
+ENERGYPLUS_RELEASES = [
+    "8.9",
+    "9.0",
+    "9.1",
+    "9.2",
+    "9.3",
+    "9.4",
+    "9.5",
+    "9.6",
+    "22.1",
+    "22.2",
+    "23.1",
+    "23.2",
+    "24.1",
+    "24.2",
+    "25.1",
+]
+_VERSION_RE = re.compile(r"\d+(\.\d+)*")
 
 
-def get_version() -> str:
-    import importlib.metadata
+def _version_key(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in version.split("."))
 
-    try:
-        return importlib.metadata.version("mypy_eppy_builder")
-    except importlib.metadata.PackageNotFoundError:
-        return "0.0.0"
 
+def requested_versions(specs: list[str]) -> list[str]:
+    """Expand ``--version`` values into versions, in the order they are given and with any repeats.
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Generate typing package")
-    parser.add_argument(
-        "--version",
-        default="23.1",
-        help="EnergyPlus version (e.g. 23.1)",
+    Each value may be a single version (``23.1``), a comma separated list
+    (``23.1,24.1``) or an inclusive range (``22.1-24.1``) which is expanded
+    to every known EnergyPlus release in between, in ascending order.  A
+    bare year bound covers that year's releases, so ``22.1-24`` ends with
+    ``24.2``.
+
+    Raises:
+        ValueError: When a value is not a version or a range of versions, or a
+            range ends after the newest known release.
+    """
+    versions: list[str] = []
+    for spec in specs:
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            start, sep, end = item.partition("-")
+            bounds = [start, end] if sep else [start]
+            if not all(_VERSION_RE.fullmatch(bound) for bound in bounds):
+                raise ValueError(f"Invalid EnergyPlus version {item!r}; expected e.g. 23.1 or 22.1-24.1")  # noqa: TRY003
+            if not sep:
+                versions.append(start)
+                continue
+            lo, hi = _version_key(start), _version_key(end)
+            newest, newest_key = ENERGYPLUS_RELEASES[-1], _version_key(ENERGYPLUS_RELEASES[-1])
+            # Bounds compare on as many parts as they have, so a bare year takes in its last release
+            if hi[: len(newest_key)] > newest_key[: len(hi)]:
+                raise ValueError(f"Version range {item!r} ends after {newest}, the newest known EnergyPlus release")  # noqa: TRY003
+            in_range = [r for r in ENERGYPLUS_RELEASES if lo <= _version_key(r) and _version_key(r)[: len(hi)] <= hi]
+            if not in_range:
+                raise ValueError(f"Version range {item!r} contains no EnergyPlus release")  # noqa: TRY003
+            versions.extend(in_range)
+    return versions
+
+
+def expand_versions(specs: list[str]) -> list[str]:
+    """Expand ``--version`` values, as :func:`requested_versions` does, into a sorted list of unique versions."""
+    return sorted(set(requested_versions(specs)), key=_version_key)
+
+
+def _write_dists(
+    files: dict[str, str], name: str, version: str, metadata: str, output_dir: Path, sdist: bool
+) -> list[Path]:
+    """Write the wheel (and with ``sdist`` the sdist) of a rendered package to ``output_dir``."""
+    dists = [build_wheel(wheel_contents(files), name, version, metadata, output_dir)]
+    if sdist:
+        dists.append(build_sdist(files, name, version, metadata, output_dir))
+    for dist in dists:
+        print(f"Built {dist}")
+    return dists
+
+
+def _write_stub_files(stubs_dir: Path, stubs: dict[str, str]) -> None:
+    """Write pre-rendered ``stubs`` to ``stubs_dir``, skipping unchanged files and removing stale stubs."""
+    with profiling.phase("write stubs", files=len(stubs)):
+        stubs_dir.mkdir(parents=True, exist_ok=True)
+        for stale in {path.name for path in stubs_dir.glob("*.pyi")} - set(stubs):
+            (stubs_dir / stale).unlink()
+        for name, content in stubs.items():
+            write_if_changed(stubs_dir / name, content)
+
+
+def _emit_package(
+    pkg_root: Path,
+    context: dict,
+    stubs: dict[str, str] | None,
+    *,
+    output_dir: Path,
+    output_format: str,
+    sdist: bool,
+    incremental: bool,
+    summary: str,
+    requires: list[str],
+    modules: dict[str, str] | None = None,
+) -> list[Path]:
+    """Render the version-package templates with ``context`` and write the package.
+
+    ``stubs`` holds the class stubs when they are not already on disk and
+    ``modules`` any other generated modules of the package.  Returns the dists
+    written in wheel mode.
+    """
+    template_dir = VERSION_TEMPLATES_DIR
+    templates = list(template_dir.rglob("*.jinja2"))
+    package_slug = context["package_slug"]
+    if output_format != "wheel":
+        if stubs is not None:
+            _write_stub_files(pkg_root / "src" / package_slug, stubs)
+        for name, content in (modules or {}).items():
+            write_if_changed(pkg_root / "src" / package_slug / name, content)
+        render_templates(templates, context, output_base=pkg_root, template_base=template_dir, incremental=incremental)
+        return []
+    files = render_template_files(templates, context, template_base=template_dir)
+    for name, content in {**(stubs or {}), **(modules or {})}.items():
+        files[f"src/{package_slug}/{name}"] = content
+    metadata = core_metadata(
+        package_slug,
+        VERSION_PACKAGE_VERSION,
+        summary=summary,
+        requires_python=">=3.9",
+        classifiers=STUB_CLASSIFIERS,
+        requires=requires,
+        readme=files.get("README.md"),
     )
-    parser.add_argument(
-        "--idd-file",
-        help="Path to Energy+.idd file to use",
+    return _write_dists(files, package_slug, VERSION_PACKAGE_VERSION, metadata, output_dir, sdist)
+
+
+def _package_context(
+    package_slug: str,
+    eplus_version: str,
+    classnames: list[str],
+    class_modules: list[tuple[str, str]] | None = None,
+    **extra: Any,
+) -> dict:
+    """Return the version-package template context; ``class_modules`` pairs default to one module per class."""
+    return {
+        "package_name": package_slug,
+        "package_slug": package_slug,
+        "version": VERSION_PACKAGE_VERSION,
+        "classnames": classnames,
+        "class_modules": class_modules or [(classname, classname) for classname in classnames],
+        "exported_names": sorted(["IDF", *classnames], key=dunder_all_key),
+        "eplus_version": eplus_version,
+        "builder_package_name": "mypy_eppy_builder",
+        "builder_version": get_version(),
+        "builder_repo_url": "https://github.com/samuelduchesne/mypy-eppy-builder",
+        **extra,
+    }
+
+
+def _version_package_names(eplus_version: str) -> tuple[str, str]:
+    """Return the distribution name and import name of the package for ``eplus_version``."""
+    version_digits = "".join(ch for ch in eplus_version if ch.isdigit())
+    return f"types-eplus{version_digits}", f"types_eplus{version_digits}"
+
+
+def version_stub_generator(
+    eplus_version: str,
+    idd_file: str,
+    *,
+    output_dir: Path = OUTPUT_DIR,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    incremental: bool = False,
+    jobs: int = 1,
+    subset: frozenset[str] | None = None,
+    extensible_groups: int | None = 1,
+    slim: bool = False,
+    slim_docs: str = "truncate",
+    field_constraints: bool = True,
+    layout: str = "per-class",
+    **_options: Any,
+) -> EppyStubGenerator:
+    """Return the stub generator writing the class stubs of the ``eplus_version`` package."""
+    package_name, package_slug = _version_package_names(eplus_version)
+    pkg_root = output_dir / package_name
+    return EppyStubGenerator(
+        idd_file,
+        str(pkg_root / "src" / package_slug),
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+        incremental=incremental,
+        manifest_path=str(pkg_root / STUBS_MANIFEST_NAME),
+        jobs=jobs,
+        subset=subset,
+        extensible_groups=extensible_groups,
+        slim=slim,
+        slim_docs=slim_docs,
+        field_constraints=field_constraints,
+        layout=layout,
     )
-    parser.add_argument(
-        "--package-type",
-        choices=["archetypal", "eppy"],
-        default="archetypal",
-        help="Which package templates to render",
+
+
+def render_version_stubs(
+    idd_file: str,
+    *,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    jobs: int = 1,
+    subset: frozenset[str] | None = None,
+    extensible_groups: int | None = 1,
+) -> dict[str, str]:
+    """Render the class stubs of ``idd_file`` (those in ``subset``, if set) in memory.
+
+    This is a worker-process entry point.
+    """
+    generator = EppyStubGenerator(
+        idd_file,
+        "",
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+        jobs=jobs,
+        subset=subset,
+        extensible_groups=extensible_groups,
     )
-    args = parser.parse_args()
+    return generator.render_stubs()
 
-    extras: list[dict[str, str]] = []
 
-    classnames: list[str] = []
-    overloads: list[tuple[str, str]] = []
-    eplus_version = args.version
-    version_classname = f"IDF_{eplus_version.replace('.', '_')}"
-    last_package_slug = ""
-    last_stubs_output_dir = Path()
+def build_version_package(
+    eplus_version: str,
+    idd_file: str,
+    *,
+    output_dir: Path = OUTPUT_DIR,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    incremental: bool = False,
+    jobs: int = 1,
+    output_format: str = "directory",
+    sdist: bool = False,
+    stubs: dict[str, str] | None = None,
+    common_package: str | None = None,
+    generator: EppyStubGenerator | None = None,
+    reuse_stubs: bool = False,
+    subset: frozenset[str] | None = None,
+    extensible_groups: int | None = 1,
+    slim: bool = False,
+    slim_docs: str = "truncate",
+    field_constraints: bool = True,
+    layout: str = "per-class",
+) -> dict:
+    """Generate the ``types-eplusXX`` package for one EnergyPlus version.
 
-    version_pkg_template_dir = TEMPLATES_DIR / "version-package"
-    version_pkg_templates = list(version_pkg_template_dir.rglob("*.jinja2"))
+    This is a module-level function so it can run in a worker process.  With
+    ``output_format="wheel"`` the package is rendered in memory and only its
+    wheel (plus its sdist when ``sdist`` is set) is written to ``output_dir``.
+    Pre-rendered ``stubs`` replace the stubs generated from ``idd_file``, and
+    ``common_package`` names the shared package they re-export from.  A
+    long-lived ``generator`` (see :func:`version_stub_generator`) keeps the
+    parsed IDD in memory between builds, and ``reuse_stubs`` keeps the class
+    stubs already in the package tree instead of regenerating them.  With a
+    ``subset`` of upper-cased IDD object keys, only those objects get stubs,
+    and ``extensible_groups`` sets how many extensible groups each stub
+    spells out (all when ``None``).  ``slim``, ``slim_docs`` and
+    ``field_constraints`` select slim stubs (see :mod:`mypy_eppy_builder.slim`),
+    whose size is reported against the full stubs, and ``layout`` (see
+    :mod:`mypy_eppy_builder.layout`) the modules the classes are written to.
+    The package also gets a runtime ``validation`` module built from the same
+    IDD objects, and a ``class_index`` module mapping their keys to their
+    classes and modules (see :mod:`mypy_eppy_builder.class_index`), which
+    the ``classnames`` and ``overloads`` come from too.
 
-    version_digits = "".join(ch for ch in eplus_version if ch.isdigit())
-    package_name = f"types-eplus{version_digits}"
-    package_slug = f"types_eplus{version_digits}"
-    extras.append({
-        "name": f"eplus{eplus_version.replace('.', '')}",
-        "package": package_name,
-        "path": f"../{package_name}",
-    })
-
-    idd_file = args.idd_file or os.environ.get("EPPY_IDD_FILE") or EnergyPlusVersion(eplus_version).current_idd_path
-
-    pkg_root = OUTPUT_DIR / package_name
-    stubs_output_dir = pkg_root / "src" / package_slug
-    stubs_output_dir.mkdir(parents=True, exist_ok=True)
-
-    generator = EppyStubGenerator(idd_file, str(stubs_output_dir))
-    generator.generate_stubs()
-
-    render_templates(
-        version_pkg_templates,
-        {
-            "package_name": package_slug,
-            "eplus_version": eplus_version,
-            "builder_package_name": "mypy_eppy_builder",
-            "builder_version": get_version(),
-            "builder_repo_url": "https://github.com/samuelduchesne/mypy-eppy-builder",
+    Returns:
+        The package names, the wrapper ``extra`` entry, the ``classnames``
+        and ``overloads`` needed to render the wrapper templates and the
+        paths of any ``dists`` built.
+    """
+    with profiling.phase("build version package", version=eplus_version):
+        package_name, package_slug = _version_package_names(eplus_version)
+        pkg_root = output_dir / package_name
+        stubs_output_dir = pkg_root / "src" / package_slug
+
+        if generator is None:
+            generator = version_stub_generator(
+                eplus_version,
+                idd_file,
+                output_dir=output_dir,
+                use_cache=use_cache,
+                cache_dir=cache_dir,
+                incremental=incremental,
+                jobs=jobs,
+                subset=subset,
+                extensible_groups=extensible_groups,
+                slim=slim,
+                slim_docs=slim_docs,
+                field_constraints=field_constraints,
+                layout=layout,
+            )
+        if stubs is None and output_format == "wheel":
+            stubs = generator.render_stubs()
+        elif stubs is None and not reuse_stubs:
+            stubs_output_dir.mkdir(parents=True, exist_ok=True)
+            generator.generate_stubs()
+        if generator.slim and not reuse_stubs:
+            _report_slim_size(eplus_version, generator, stubs, stubs_output_dir)
+        # Classes, keys and modules come from the IDD objects: file names do not spell the keys
+        index = generator.class_index
+        modules = {
+            VALIDATION_MODULE: generator.render_validator(eplus_version),
+            INDEX_FILE: generator.render_class_index(eplus_version),
+        }
+        classnames = index.classnames
+        class_modules = index.class_modules
+
+        context = _package_context(
+            package_slug, eplus_version, classnames, class_modules, common_package=common_package, class_index=True
+        )
+        requires = [f"{common_package}=={VERSION_PACKAGE_VERSION}"] if common_package else []
+        dists = _emit_package(
+            pkg_root,
+            context,
+            stubs,
+            output_dir=output_dir,
+            output_format=output_format,
+            sdist=sdist,
+            incremental=incremental,
+            summary=f"Type stubs for EnergyPlusV{eplus_version}",
+            requires=requires,
+            modules=modules,
+        )
+
+    return {
+        "eplus_version": eplus_version,
+        "package_name": package_name,
+        "package_slug": package_slug,
+        "pkg_root": pkg_root,
+        "stubs_output_dir": stubs_output_dir,
+        "extra": {
+            "name": f"eplus{eplus_version.replace('.', '')}",
+            "package": package_name,
+            "path": f"../{package_name}",
         },
-        output_base=pkg_root,
-        template_base=version_pkg_template_dir,
+        "classnames": classnames,
+        "class_modules": class_modules,
+        "overloads": index.overloads,
+        "dists": dists,
+    }
+
+
+def _report_slim_size(
+    eplus_version: str, generator: EppyStubGenerator, stubs: dict[str, str] | None, stubs_dir: Path
+) -> None:
+    """Print the size of the slim class stubs of ``eplus_version`` next to that of the full stubs."""
+    with profiling.phase("measure full stubs", version=eplus_version):
+        full_size = generator.full_stub_size()
+    if stubs is not None:
+        slim_size = sum(len(content.encode()) for content in stubs.values())
+    else:
+        slim_size = sum(path.stat().st_size for path in stubs_dir.glob("*.pyi"))
+    saved = 1 - slim_size / full_size if full_size else 0.0
+    print(
+        f"Slim stubs for EnergyPlus {eplus_version}: {slim_size / 1024:.1f} KiB "
+        f"instead of {full_size / 1024:.1f} KiB ({abs(saved):.0%} {'smaller' if saved >= 0 else 'larger'})"
+    )
+
+
+# Build options that change the files of a version package; the others only change how it is built
+CACHED_OPTIONS = (
+    "output_format",
+    "sdist",
+    "subset",
+    "extensible_groups",
+    "slim",
+    "slim_docs",
+    "field_constraints",
+    "layout",
+)
+# Description of a version build stored with its files in the build cache, next to its paths
+_CACHED_BUILD_KEYS = ("eplus_version", "package_name", "package_slug", "extra", "classnames")
+
+
+def _cache_options(options: dict[str, Any]) -> dict[str, Any]:
+    """Return the :data:`CACHED_OPTIONS` of ``options`` as JSON-ready values."""
+    cached = {}
+    for name in CACHED_OPTIONS:
+        value = options.get(name)
+        cached[name] = sorted(value) if isinstance(value, frozenset) else value
+    return cached
+
+
+def _package_files(pkg_root: Path) -> list[Path]:
+    """Return the generated files of the package tree at ``pkg_root``.
+
+    The incremental manifests and hidden or ``__pycache__`` directories,
+    which describe or come from this machine's runs, are left out.
+    """
+    manifests = {STUBS_MANIFEST_NAME, TEMPLATES_MANIFEST_NAME}
+    return sorted(
+        path
+        for path in pkg_root.rglob("*")
+        if path.is_file()
+        and path.name not in manifests
+        and not any(part.startswith(".") or part == "__pycache__" for part in path.relative_to(pkg_root).parts[:-1])
+    )
+
+
+def _build_artifact(build: dict, output_dir: Path) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """Return the description and files (the dists, or the package tree) the build cache keeps of ``build``."""
+    paths = build["dists"] or _package_files(build["pkg_root"])
+    files = {path.relative_to(output_dir).as_posix(): path.read_bytes() for path in paths}
+    description = {key: build[key] for key in _CACHED_BUILD_KEYS}
+    description.update(
+        class_modules=build["class_modules"],
+        overloads=build["overloads"],
+        pkg_root=build["pkg_root"].relative_to(output_dir).as_posix(),
+        stubs_output_dir=build["stubs_output_dir"].relative_to(output_dir).as_posix(),
+        dists=[dist.relative_to(output_dir).as_posix() for dist in build["dists"]],
+    )
+    return description, files
+
+
+def _restore_build(description: dict[str, Any], files: dict[str, bytes], output_dir: Path) -> dict:
+    """Write the cached ``files`` under ``output_dir`` and return the build ``description`` stands for.
+
+    Unchanged files are not rewritten, stale class stubs are removed and the
+    incremental manifests are dropped, since they describe the files replaced.
+    """
+    build = {key: description[key] for key in _CACHED_BUILD_KEYS}
+    build.update(
+        class_modules=[tuple(pair) for pair in description["class_modules"]],
+        overloads=[tuple(pair) for pair in description["overloads"]],
+        pkg_root=output_dir / description["pkg_root"],
+        stubs_output_dir=output_dir / description["stubs_output_dir"],
+        dists=[output_dir / dist for dist in description["dists"]],
+    )
+    for name, data in files.items():
+        write_if_changed(output_dir / name, data)
+    if not build["dists"]:
+        stubs = {output_dir / name for name in files}
+        for stale in set(build["stubs_output_dir"].glob("*.pyi")) - stubs:
+            stale.unlink()
+        for manifest in (STUBS_MANIFEST_NAME, TEMPLATES_MANIFEST_NAME):
+            (build["pkg_root"] / manifest).unlink(missing_ok=True)
+    return build
+
+
+def cached_build_version_package(
+    eplus_version: str, idd_file: str, *, build_cache: BuildCache, output_dir: Path = OUTPUT_DIR, **options: Any
+) -> dict:
+    """Restore the ``types-eplusXX`` package of ``eplus_version`` from ``build_cache``, or build and store it.
+
+    The cache key covers the IDD file, the templates, the builder version and
+    the :data:`CACHED_OPTIONS`; ``options`` are passed to
+    :func:`build_version_package` on a miss.  Returns the build either way.
+    """
+    key = build_cache.key(idd_file, eplus_version, _cache_options(options))
+    with profiling.phase("load cached build", version=eplus_version):
+        cached = build_cache.load(key)
+        if cached is not None:
+            build = _restore_build(*cached, output_dir)
+            print(f"Restored {build['package_name']} from the build cache ({key[:12]})")
+            return build
+    build = build_version_package(eplus_version, idd_file, output_dir=output_dir, **options)
+    with profiling.phase("store build", version=eplus_version):
+        build_cache.store(key, *_build_artifact(build, output_dir))
+    return build
+
+
+def build_common_package(
+    shared: dict[str, str],
+    versions: list[str],
+    *,
+    output_dir: Path = OUTPUT_DIR,
+    incremental: bool = False,
+    output_format: str = "directory",
+    sdist: bool = False,
+    **_options: Any,
+) -> dict:
+    """Generate the ``types-eplus-common`` package holding the ``shared`` class stubs of ``versions``."""
+    pkg_root = output_dir / COMMON_PACKAGE_NAME
+    classnames = sorted((name[: -len(".pyi")] for name in shared), key=isort_key)
+    summary = f"Type stubs shared by EnergyPlusV{', V'.join(versions)}"
+    context = _package_context(COMMON_PACKAGE_SLUG, ", ".join(versions), classnames, description=summary)
+    dists = _emit_package(
+        pkg_root,
+        context,
+        shared,
+        output_dir=output_dir,
+        output_format=output_format,
+        sdist=sdist,
+        incremental=incremental,
+        summary=summary,
+        requires=[],
+    )
+    return {"package_name": COMMON_PACKAGE_NAME, "pkg_root": pkg_root, "classnames": classnames, "dists": dists}
+
+
+def _version_workers(count: int) -> int:
+    """Return how many worker processes :func:`_map_versions` starts for ``count`` calls."""
+    return min(count, os.cpu_count() or 1)
+
+
+def _split_jobs(jobs: int, count: int) -> int:
+    """Return the ``--jobs`` of each of ``count`` version builds, so that together they start at most ``jobs``."""
+    if count == 1:
+        return jobs
+    return max(1, jobs // _version_workers(count))
+
+
+def _map_versions(func: Callable[..., Any], calls: list[tuple[tuple, dict]]) -> list[Any]:
+    """Run ``func(*args, **kwargs)`` for every call, one worker process per call when there are several.
+
+    While profiling, each worker profiles its call and its events are merged into this process's profile.
+    """
+    if len(calls) == 1:
+        args, kwargs = calls[0]
+        return [func(*args, **kwargs)]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=_version_workers(len(calls))) as pool:
+        if not profiling.enabled():
+            futures = [pool.submit(func, *args, **kwargs) for args, kwargs in calls]
+            return [future.result() for future in futures]
+        futures = [pool.submit(profiling.run_profiled, func, *args, **kwargs) for args, kwargs in calls]
+        results = []
+        for future in futures:
+            result, events = future.result()
+            profiling.merge(events)
+            results.append(result)
+        return results
+
+
+def build_version_packages(
+    versions: list[str],
+    idd_files: list[str],
+    *,
+    dedupe: bool = False,
+    build_cache: BuildCache | None = None,
+    **options: Any,
+) -> tuple[list[dict], dict | None]:
+    """Build every version package, one worker process per version when there are several.
+
+    ``options`` are passed to :func:`build_version_package`; builds are
+    returned in ``versions`` order.  With a ``build_cache``, packages built
+    before with the same inputs are restored from it instead.  With
+    ``dedupe`` the class stubs of all versions are rendered first, stubs
+    shared by several versions go to the ``types-eplus-common`` package,
+    whose build is returned as well, and the version packages re-export
+    them; those builds depend on every version, so they bypass the cache.
+    The ``jobs`` of ``options`` are split between the version workers.
+    """
+    if "jobs" in options:
+        options = {**options, "jobs": _split_jobs(options["jobs"], len(versions))}
+    if not dedupe:
+        calls = [((version, idd_file), options) for version, idd_file in zip(versions, idd_files)]
+        if build_cache is None:
+            return _map_versions(build_version_package, calls), None
+        cached_calls = [(args, {**kwargs, "build_cache": build_cache}) for args, kwargs in calls]
+        return _map_versions(cached_build_version_package, cached_calls), None
+
+    stub_options = {
+        key: options[key] for key in ("use_cache", "cache_dir", "jobs", "subset", "extensible_groups") if key in options
+    }
+    rendered = _map_versions(render_version_stubs, [((idd_file,), stub_options) for idd_file in idd_files])
+    stubs_by_version = dict(zip(versions, rendered))
+    shared = shared_stubs(stubs_by_version)
+    if not shared:
+        calls = [
+            ((version, idd_file), {**options, "stubs": stubs_by_version[version]})
+            for version, idd_file in zip(versions, idd_files)
+        ]
+        return _map_versions(build_version_package, calls), None
+
+    common = build_common_package(shared, versions, **options)
+    split = reexport_shared(stubs_by_version, shared)
+    calls = [
+        ((version, idd_file), {**options, "stubs": split[version], "common_package": COMMON_PACKAGE_NAME})
+        for version, idd_file in zip(versions, idd_files)
+    ]
+    return _map_versions(build_version_package, calls), common
+
+
+def watch_packages(
+    versions: list[str],
+    idd_files: list[str],
+    builds: list[dict],
+    *,
+    package_types: list[str] | None = None,
+    overload_style: str = "full",
+    interval: float = 0.5,
+    max_rebuilds: int | None = None,
+    **options: Any,
+) -> int:
+    """Rebuild the generated packages in place whenever an IDD file or template changes.
+
+    The parsed IDD of every version and the compiled templates stay in memory
+    between changes, and only the outputs a change affects are re-rendered:
+    an IDD change rebuilds that version's stubs, a class stub template change
+    every version's stubs, a version-package or validation template change
+    the version packages around their existing stubs and a wrapper template change only
+    the wrappers.  ``builds`` are the initial builds of ``versions``,
+    ``package_types`` the wrappers to keep up to date (``archetypal`` by
+    default) and ``options`` are passed to :func:`build_version_package`.  Returns the
+    number of rebuilds once ``max_rebuilds`` is reached or on Ctrl+C.
+    """
+    options = {**options, "incremental": True}
+    generators = {
+        version: version_stub_generator(version, idd_file, **options) for version, idd_file in zip(versions, idd_files)
+    }
+    for generator in generators.values():
+        generator.idd_info  # noqa: B018  # load every IDD up front so the first change is as fast as the rest
+    builds_by_version = {build["eplus_version"]: build for build in builds}
+    package_types = package_types or ["archetypal"]
+    wrapper_dirs = [
+        *(TEMPLATES_DIR / f"types-{package_type}" for package_type in package_types),
+        TEMPLATES_DIR / "common",
+    ]
+
+    def rebuild(changed: list[Path]) -> None:
+        changed_set = {path.resolve() for path in changed}
+        stub_templates = {path.resolve() for path in CLASS_STUB_TEMPLATES}
+        stubs_changed = bool(stub_templates & changed_set)
+        packages_changed = VALIDATION_TEMPLATE.resolve() in changed_set or any(
+            VERSION_TEMPLATES_DIR.resolve() in path.parents for path in changed_set
+        )
+        # The wrapper depends on its own and the shared templates, and on the classes in the IDDs
+        wrapper_changed = any(
+            directory.resolve() in path.parents
+            for directory in wrapper_dirs
+            for path in changed_set - {*stub_templates, VALIDATION_TEMPLATE.resolve()}
+        )
+        for version, idd_file in zip(versions, idd_files):
+            idd_changed = Path(idd_file).resolve() in changed_set
+            if idd_changed:
+                generators[version].reload()
+            if idd_changed or stubs_changed or packages_changed:
+                builds_by_version[version] = build_version_package(
+                    version,
+                    idd_file,
+                    generator=generators[version],
+                    reuse_stubs=not (idd_changed or stubs_changed),
+                    **options,
+                )
+            wrapper_changed = wrapper_changed or idd_changed
+        if wrapper_changed:
+            render_wrappers(
+                package_types,
+                [builds_by_version[v] for v in versions],
+                overload_style,
+                output_dir=options["output_dir"],
+                incremental=True,
+                generic_fallback=options.get("subset") is not None,
+            )
+
+    watched = [TEMPLATES_DIR, *(Path(idd_file) for idd_file in idd_files)]
+    return poll(watched, rebuild, interval=interval, max_rebuilds=max_rebuilds)
+
+
+def _resolve_idd_files(requested: list[str], idd_files: list[str] | None) -> tuple[list[str], list[str]]:
+    """Return the sorted unique ``requested`` versions and the IDD path of each.
+
+    ``--idd-file`` paths pair with the versions in the order ``--version``
+    gives them, before sorting; without them the IDD comes from
+    ``$EPPY_IDD_FILE`` or archetypal.
+    """
+    if idd_files:
+        if len(idd_files) != len(requested):
+            raise ValueError(  # noqa: TRY003
+                f"--idd-file was given {len(idd_files)} path(s) for {len(requested)} version(s); "
+                "pass one IDD file per version, in the order --version lists them"
+            )
+        paired: dict[str, str] = {}
+        for version, idd_file in zip(requested, idd_files):
+            if paired.setdefault(version, idd_file) != idd_file:
+                raise ValueError(  # noqa: TRY003
+                    f"--idd-file gives version {version} two IDD files: {paired[version]} and {idd_file}"
+                )
+        versions = sorted(paired, key=_version_key)
+        return versions, [paired[version] for version in versions]
+    versions = sorted(set(requested), key=_version_key)
+    env_idd = os.environ.get("EPPY_IDD_FILE")
+    if env_idd and len(versions) == 1:
+        return versions, [env_idd]
+    # archetypal pulls in its whole scientific stack, so it is only imported to locate an IDD
+    from archetypal import EnergyPlusVersion
+
+    return versions, [EnergyPlusVersion(version).current_idd_path for version in versions]
+
+
+def _write_wrapper_dists(
+    template_files: list[Path], context: dict, template_dir: Path, output_dir: Path, sdist: bool
+) -> list[Path]:
+    """Render the wrapper package in memory and write its dists to ``output_dir``."""
+    package_ctx = context["package"]
+    prefix = f"{template_dir.name}/"
+    files = {
+        name[len(prefix) :]: content
+        for name, content in render_template_files(template_files, context).items()
+        if name.startswith(prefix)
+    }
+    metadata = core_metadata(
+        package_ctx["data"]["pypi_name"],
+        package_ctx["version"],
+        summary=package_ctx["description"],
+        requires_python=">=3.9, <4.0",
+        classifiers=STUB_CLASSIFIERS,
+        extras={extra["name"]: [extra["package"]] for extra in package_ctx["extras"]},
+        readme=files.get("README.md"),
     )
+    return _write_dists(files, package_ctx["data"]["pypi_name"], package_ctx["version"], metadata, output_dir, sdist)
+
+
+def render_wrappers(
+    package_types: list[str],
+    builds: list[dict],
+    overload_style: str = "full",
+    *,
+    output_dir: Path = OUTPUT_DIR,
+    output_format: str = "directory",
+    sdist: bool = False,
+    incremental: bool = False,
+    generic_fallback: bool = False,
+) -> list[Path]:
+    """Render the ``types-{package_type}`` wrapper of each of ``package_types`` over the version ``builds``.
+
+    All wrappers share the builds' ``classnames`` and ``overloads`` and the
+    compiled common templates.  Returns the root directory of every wrapper
+    written in directory mode.
+    """
+    roots = []
+    for package_type in package_types:
+        template_dir = TEMPLATES_DIR / f"types-{package_type}"
+        template_files = list(template_dir.rglob("*.jinja2"))
+        context = wrapper_context(package_type, builds, overload_style, generic_fallback=generic_fallback)
+        if output_format == "wheel":
+            _write_wrapper_dists(template_files, context, template_dir, output_dir, sdist)
+            continue
+        render_templates(template_files, context, output_base=output_dir, incremental=incremental)
+        roots.append(output_dir / template_dir.name)
+    return roots
 
-    last_package_slug = package_slug
-    last_stubs_output_dir = stubs_output_dir
-    for stub_file in sorted(stubs_output_dir.glob("*.pyi")):
-        classname = stub_file.stem
-        classnames.append(classname)
-        ep_key = classname_to_key(classname)
-        overloads.append((classname, ep_key))
 
-    template_dir = TEMPLATES_DIR / f"types-{args.package_type}"
-    template_files = list(template_dir.rglob("*.jinja2"))
+def wrapper_context(
+    package_type: str, builds: list[dict], overload_style: str = "full", *, generic_fallback: bool = False
+) -> dict:
+    """Return the template context of the ``types-{package_type}`` wrapper package over the version ``builds``.
 
-    # --- 3. Prepare context for templates ---
-    if args.package_type == "archetypal":
+    ``generic_fallback`` lets ``idfobjects`` and compact-style methods take
+    any ``str`` key, for version packages built for a subset of the IDD.
+    """
+    extras = [build["extra"] for build in builds]
+    # The wrapper stubs are typed against the newest version package.
+    latest = builds[-1]
+    eplus_version = latest["eplus_version"]
+    version_classname = f"IDF_{eplus_version.replace('.', '_')}"
+    last_package_slug = latest["package_slug"]
+    last_stubs_output_dir = latest["stubs_output_dir"]
+    classnames = latest["classnames"]
+    overloads = latest["overloads"]
+
+    if package_type == "archetypal":
         package_ctx = {
             "epbunch_path": "eppy.bunch_subclass",
             "package_slug": last_package_slug,
@@ -183,29 +927,331 @@ def main() -> None:
             },
         }
 
-    context = {
+    return {
         "package": package_ctx,
         "builder_repo_url": "https://github.com/samuelduchesne/mypy-eppy-builder",
         "classnames": classnames,
+        "class_imports": class_imports(latest.get("class_modules") or [(name, name) for name in classnames]),
         "overloads": overloads,
         "stubs_output_dir": str(last_stubs_output_dir),
         "builder_package_name": "mypy_eppy_builder",
         "builder_version": get_version(),
         "eplus_version": eplus_version,
         "version_classname": version_classname,
+        "overload_style": overload_style,
+        "generic_fallback": generic_fallback,
     }
-    render_templates(template_files, context)
 
-    # Lint/fix the generated packages (requires ruff installed)
+
+def _package_types(values: list[str]) -> list[str]:
+    """Return the ``--package-type`` values in order, without repeats and with ``all`` expanded."""
+    if "all" in values:
+        return list(PACKAGE_TYPES)
+    return list(dict.fromkeys(values))
+
+
+def _extensible_groups(value: str) -> int | None:
+    """Parse ``--extensible-groups``: a non-negative count, or ``all`` (``None``)."""
+    if value == "all":
+        return None
+    groups = int(value)
+    if groups < 0:
+        raise argparse.ArgumentTypeError("must be a non-negative count or 'all'")  # noqa: TRY003
+    return groups
+
+
+def _resolve_subset(args: argparse.Namespace) -> frozenset[str] | None:
+    """Return the object keys selected by ``--subset-from`` and ``--subset-allow``, or ``None`` for every object."""
+    if not (args.subset_from or args.subset_allow):
+        return None
+    with profiling.phase("scan corpus"):
+        return subset_keys(args.subset_from or [], args.subset_allow or [], jobs=args.jobs or os.cpu_count() or 1)
+
+
+def _lint_packages(roots: list[Path], args: argparse.Namespace, started: float) -> None:
+    """Apply ``--ruff-fix`` and ``--verify-lint`` to the generated package ``roots``."""
+    if args.ruff_fix:
+        ruff_fix(roots)
+    if args.verify_lint and not verify_lint(_lint_targets(roots, args.verify_lint, args.lint_sample_size, started)):
+        sys.exit("Generated files failed lint verification")
+
+
+def _lint_targets(roots: list[Path], mode: str, sample_size: int, started: float) -> list[Path]:
+    """Return the files under ``roots`` that ``--verify-lint mode`` checks."""
+    if mode == "changed":
+        return [path for root in roots for path in changed_since(root, started)]
+    paths_by_root = [[path for path in root.rglob("*") if path.is_file()] for root in roots]
+    if mode == "sample":
+        paths_by_root = [lint_sample(paths, sample_size) for paths in paths_by_root]
+    return [path for paths in paths_by_root for path in paths]
+
+
+def _check_options(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject option combinations that cannot work together."""
+    if args.sdist and args.output_format != "wheel":
+        parser.error("--sdist requires --output-format wheel")
+    if args.output_format == "wheel" and (args.ruff_fix or args.verify_lint or args.watch):
+        parser.error("--ruff-fix, --verify-lint and --watch need --output-format directory")
+    if args.watch and args.dedupe:
+        parser.error("--watch cannot be combined with --dedupe")
+    if (args.slim_docs or args.drop_constraints) and not args.slim:
+        parser.error("--slim-docs and --drop-constraints require --slim")
+    if args.slim and args.dedupe:
+        parser.error("--slim cannot be combined with --dedupe")
+    if args.layout != "per-class" and args.dedupe:
+        parser.error("--layout single and by-group cannot be combined with --dedupe")
+    if args.build_cache:
+        try:
+            backend_for(args.build_cache)
+        except ValueError as e:
+            parser.error(f"--build-cache: {e}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate typing package")
+    parser.add_argument(
+        "--version",
+        nargs="+",
+        default=["23.1"],
+        help="EnergyPlus version(s): e.g. 23.1, a list (23.1 24.1 or 23.1,24.1) or a range of known releases "
+        "(22.1-24.1, or 22.1-24 up to 24's last release)",
+    )
+    parser.add_argument(
+        "--idd-file",
+        nargs="+",
+        help="Path to Energy+.idd file to use (one per version when building several versions)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=str(OUTPUT_DIR),
+        help="Directory receiving the generated packages (default: generated_package/)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the parsed IDD cache (defaults to $MYPY_EPPY_BUILDER_CACHE_DIR or ~/.cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse the IDD file without reading or writing the parse cache, and skip the build cache",
+    )
+    parser.add_argument(
+        "--build-cache",
+        metavar="LOCATION",
+        default=os.environ.get(BUILD_CACHE_ENV),
+        help="Directory or http(s):// URL of a cache of finished version packages, shareable between machines: "
+        f"packages built before from the same inputs are restored from it (defaults to ${BUILD_CACHE_ENV})",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Remove all cached IDD parses before generating",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-render outputs whose inputs changed and skip identical writes",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes used to render class stubs for each version (0 uses every CPU)",
+    )
+    parser.add_argument(
+        "--overload-style",
+        choices=["full", "compact"],
+        default="full",
+        help="IDF keyed methods: 'full' overloads them per class, 'compact' declares each once "
+        "over an IDFKey literal alias and returns EpBunch for every key, faster to check but without "
+        "the class of the key",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["directory", "wheel"],
+        default="directory",
+        help="Write package source trees, or render in memory and write only wheels to --output-dir",
+    )
+    parser.add_argument(
+        "--sdist",
+        action="store_true",
+        help="With --output-format wheel, also write an sdist for every package",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help=f"Move class stubs identical across the built versions to a shared {COMMON_PACKAGE_NAME} package",
+    )
+    parser.add_argument(
+        "--ruff-fix",
+        action="store_true",
+        help="Run 'ruff check --fix-only' over every generated package (the output is already lint-clean)",
+    )
+    parser.add_argument(
+        "--verify-lint",
+        choices=["sample", "changed", "all"],
+        help="Check generated files with ruff: a sample of the stubs, the files written by this run, or all",
+    )
+    parser.add_argument(
+        "--lint-sample-size",
+        type=int,
+        default=25,
+        help="Class stubs checked per package by '--verify-lint sample' (default: 25)",
+    )
+    parser.add_argument(
+        "--package-type",
+        nargs="+",
+        choices=[*PACKAGE_TYPES, "all"],
+        default=["archetypal"],
+        help="Wrapper package(s) to render around the version packages, or 'all'; "
+        "the version packages are built once for every wrapper",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After building, keep the IDD and templates in memory and rebuild affected outputs on every change",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.5,
+        help="Seconds between checks for changed files in --watch mode (default: 0.5)",
+    )
+    parser.add_argument(
+        "--subset-from",
+        nargs="+",
+        metavar="PATH",
+        help="Only generate stubs for the object types used by the .idf/.epJSON files in these files or directories",
+    )
+    parser.add_argument(
+        "--subset-allow",
+        nargs="+",
+        metavar="KEY",
+        help="IDD object keys to generate stubs for in addition to those found by --subset-from",
+    )
+    parser.add_argument(
+        "--extensible-groups",
+        type=_extensible_groups,
+        default=1,
+        metavar="N",
+        help="Extensible field groups (e.g. vertices) spelled out in each class stub, type checkers report "
+        "numbered fields of later groups; 'all' keeps every numbered field (default: 1)",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="per-class",
+        help="Class stub modules of each version package: one per class, a single module, "
+        "or one per IDD group (default: per-class)",
+    )
+    parser.add_argument(
+        "--slim",
+        action="store_true",
+        help="Emit slim class stubs: repeated annotations become aliases in a shared _aliases stub "
+        "and docstrings are truncated; the size saved is reported",
+    )
+    parser.add_argument(
+        "--slim-docs",
+        choices=["truncate", "drop"],
+        help="With --slim, cut docstrings to their first sentence or drop them (default: truncate)",
+    )
+    parser.add_argument(
+        "--drop-constraints",
+        action="store_true",
+        help="With --slim, annotate fields with their bare types, without the pydantic.Field constraints",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write per-phase timings, peak memory and per-class render times to PATH (JSON) "
+        "and a Chrome trace next to it (PATH with a .trace.json suffix)",
+    )
+    args = parser.parse_args(argv)
+    _check_options(parser, args)
     try:
-        import subprocess
-
-        # Apply auto-fixes, but do not error on remaining violations
-        subprocess.run(["ruff", "check", str(pkg_root), "--fix-only"], check=True)  # noqa: S603, S607
-        wrapper_dir = OUTPUT_DIR / package_ctx["pypi_name"]
-        subprocess.run(["ruff", "check", str(wrapper_dir), "--fix-only"], check=True)  # noqa: S603, S607
-    except FileNotFoundError:
-        print("Warning: ruff not found; skipping lint on generated packages.")
+        versions, idd_files = _resolve_idd_files(requested_versions(args.version), args.idd_file)
+    except ValueError as e:
+        parser.error(str(e))
+    if not args.profile:
+        generate(args, versions, idd_files)
+        return
+    profiling.enable()
+    try:
+        with profiling.phase("generate"):
+            generate(args, versions, idd_files)
+    finally:
+        profile = Path(args.profile)
+        profiling.write_profile(profile, profiling.disable())
+        print(f"Profile written to {profile} and {profiling.trace_path(profile)}")
+
+
+def generate(args: argparse.Namespace, versions: list[str], idd_files: list[str]) -> None:
+    """Build the packages of ``versions`` from their ``idd_files`` as the parsed command line ``args`` asks."""
+    # Whole seconds, so files written this run count as changed on coarse file system clocks
+    started = int(time.time())
+    output_dir = Path(args.output_dir)
+
+    idd_cache = IddCache(args.cache_dir)
+    if args.clear_cache:
+        removed = idd_cache.clear()
+        print(f"Removed {removed} cached IDD parse(s)")
+    if not args.no_cache:
+        enable_bytecode_cache(idd_cache.cache_dir / "templates")
+
+    build_options = {
+        "output_dir": output_dir,
+        "use_cache": not args.no_cache,
+        "cache_dir": args.cache_dir,
+        "incremental": args.incremental,
+        "jobs": args.jobs or os.cpu_count() or 1,
+        "output_format": args.output_format,
+        "sdist": args.sdist,
+        "subset": _resolve_subset(args),
+        "extensible_groups": args.extensible_groups,
+        "slim": args.slim,
+        "slim_docs": args.slim_docs or "truncate",
+        "field_constraints": not args.drop_constraints,
+        "layout": args.layout,
+    }
+    build_cache = None
+    if args.build_cache and not args.no_cache:
+        if args.dedupe:
+            print("Note: --dedupe builds do not use the build cache")
+        else:
+            build_cache = BuildCache(backend_for(args.build_cache), TEMPLATES_DIR)
+    builds, common = build_version_packages(
+        versions, idd_files, dedupe=args.dedupe, build_cache=build_cache, **build_options
+    )
+
+    package_types = _package_types(args.package_type)
+    wrapper_roots = render_wrappers(
+        package_types,
+        builds,
+        args.overload_style,
+        output_dir=output_dir,
+        output_format=args.output_format,
+        sdist=args.sdist,
+        incremental=args.incremental,
+        generic_fallback=build_options["subset"] is not None,
+    )
+    if args.output_format == "wheel":
+        return
+
+    # Templates render lint-clean output; the full ruff pass is opt-in (requires ruff installed)
+    package_roots = [build["pkg_root"] for build in [*builds, *([common] if common else [])]]
+    _lint_packages([*package_roots, *wrapper_roots], args, started)
+
+    if args.watch:
+        watch_packages(
+            versions,
+            idd_files,
+            builds,
+            package_types=package_types,
+            overload_style=args.overload_style,
+            interval=args.watch_interval,
+            **build_options,
+        )
 
 
 if __name__ == "__main__":
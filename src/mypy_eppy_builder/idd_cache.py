@@ -0,0 +1,90 @@
+"""Persistent cache of parsed IDD data.
+
+Parsing a full ``Energy+.idd`` takes noticeably longer than loading the
+resulting records from a pickle, and the same handful of IDD files are
+rebuilt over and over while templates evolve.  Entries are keyed by the
+SHA-256 of the IDD file contents, the builder version and the cache format,
+so an edited IDD or a new builder release never reuses stale records.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from mypy_eppy_builder.idd_parser import IddRecord, parse_idd
+from mypy_eppy_builder.manifest import write_atomic
+from mypy_eppy_builder.version import get_version
+
+CACHE_DIR_ENV = "MYPY_EPPY_BUILDER_CACHE_DIR"
+# Bump whenever the layout of the cached records changes.
+CACHE_FORMAT = 1
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory from ``$MYPY_EPPY_BUILDER_CACHE_DIR`` or the XDG cache home."""
+    env_dir = os.environ.get(CACHE_DIR_ENV)
+    if env_dir:
+        return Path(env_dir)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "mypy-eppy-builder"
+
+
+def hash_file(path: str | Path) -> str:
+    """Return the hex SHA-256 digest of the file at ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IddCache:
+    """Store parsed ``idd_info`` records under ``cache_dir/idd``."""
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.idd_dir = self.cache_dir / "idd"
+
+    def key(self, idd_path: str | Path) -> str:
+        """Return the cache key for the IDD file at ``idd_path``."""
+        payload = f"{hash_file(idd_path)}:{get_version()}:{CACHE_FORMAT}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.idd_dir / f"{key}.pickle"
+
+    def load(self, idd_path: str | Path) -> list[IddRecord] | None:
+        """Return cached records for ``idd_path`` or ``None`` on a miss."""
+        entry = self.path_for(self.key(idd_path))
+        try:
+            with open(entry, "rb") as f:
+                return pickle.load(f)  # type: ignore[no-any-return]  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def store(self, idd_path: str | Path, idd_info: list[IddRecord]) -> Path:
+        """Write ``idd_info`` for ``idd_path`` atomically and return the entry path."""
+        entry = self.path_for(self.key(idd_path))
+        write_atomic(entry, pickle.dumps(idd_info, protocol=pickle.HIGHEST_PROTOCOL))
+        return entry
+
+    def get_or_parse(self, idd_path: str | Path) -> list[IddRecord]:
+        """Return records for ``idd_path``, parsing and caching them on a miss."""
+        idd_info = self.load(idd_path)
+        if idd_info is None:
+            idd_info = parse_idd(idd_path)
+            self.store(idd_path, idd_info)
+        return idd_info
+
+    def clear(self) -> int:
+        """Delete every cached entry and return how many were removed."""
+        removed = 0
+        if self.idd_dir.is_dir():
+            for entry in self.idd_dir.glob("*.pickle"):
+                entry.unlink()
+                removed += 1
+        return removed
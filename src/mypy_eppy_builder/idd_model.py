@@ -0,0 +1,276 @@
+"""Typed intermediate model of IDD objects and fields.
+
+:func:`~mypy_eppy_builder.idd_parser.parse_idd` yields raw records whose
+comments are ``dict[str, list[str]]``.  Deriving a stub from them means
+repeating ``.get(key, [""])[0]`` lookups, name normalization, type mapping
+and limit extraction for every field, in every consumer.
+:func:`build_object_specs` does that work once per IDD and returns compact
+``__slots__`` records with every fact the templates need precomputed.
+Identical fields (the ``Name`` field of hundreds of objects, say) share one
+:class:`FieldSpec`, and the repeated strings are interned.  The records
+pickle cheaply, so they are also what render worker processes receive.
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+import re
+import sys
+from collections.abc import Iterable
+
+from mypy_eppy_builder.idd_parser import IddComments, IddRecord
+
+_CLASSNAME_RE = re.compile(r"[^0-9a-zA-Z]+")
+_EXTENSIBLE_RE = re.compile(r"extensible:(\d+)")
+# eppy keeps only ASCII letters, digits and spaces in field names
+_FIELD_NAME_RE = re.compile(r"[^0-9a-zA-Z ]")
+
+# IDD numeric limit comments and the pydantic ``Field`` constraints they map to
+NUMERIC_LIMITS = {"minimum": "ge", "minimum>": "gt", "maximum": "le", "maximum<": "lt"}
+_NO_DEFAULT = {"", "none", "NONE", "None"}
+
+
+def _first(comments: IddComments, key: str, default: str = "") -> str:
+    values = comments.get(key)
+    return values[0] if values else default
+
+
+def normalize_classname(obj_name: str) -> str:
+    """Return a valid Python class name for an IDD object.
+
+    EnergyPlus object names can contain characters such as spaces or colons
+    (e.g. ``BuildingSurface:Detailed``).  Applying :py:meth:`str.title`
+    would lower-case characters following an existing capital, producing
+    names like ``Buildingsurface_Detailed``, so instead any run of non
+    alpha-numeric characters is replaced with an underscore while the casing
+    of the remaining characters is preserved: ``BuildingSurface_Detailed``.
+    """
+    return _CLASSNAME_RE.sub("_", obj_name.strip())
+
+
+def normalize_field_name(field_name: str) -> str:
+    """Return the attribute name eppy gives an IDD field."""
+    return _FIELD_NAME_RE.sub("", field_name).replace(" ", "_")
+
+
+def field_base_type(field: IddComments) -> str:
+    """Return the Python type of an IDD field, a ``Literal`` of its keys for choice fields."""
+    field_type = _first(field, "type", "alpha")
+    if field_type == "real":
+        return "float"
+    if field_type == "integer":
+        return "int"
+    if field_type == "choice" and field.get("key"):
+        return f"Literal[{', '.join(map(repr, field['key']))}]"
+    return "str"
+
+
+def typing_imports(fields: Iterable[FieldSpec]) -> tuple[str, ...]:
+    """Return the ``typing`` names a stub with ``fields`` imports, in isort order."""
+    literal = any(field.base_type.startswith("Literal[") for field in fields)
+    return ("Annotated", "Literal") if literal else ("Annotated",)
+
+
+def extensible_group(obj: IddComments, fields: list[IddComments]) -> tuple[int, int]:
+    """Return the size of the extensible group of an object and the index of its first field.
+
+    The size comes from the object's ``\\extensible:N`` comment and the first
+    field is the one marked ``\\begin-extensible``; ``(0, 0)`` when either is
+    missing.
+    """
+    size = next((int(match[1]) for key in obj if (match := _EXTENSIBLE_RE.fullmatch(key))), 0)
+    start = next((index for index, field in enumerate(fields) if "begin-extensible" in field), None)
+    if not size or start is None:
+        return 0, 0
+    return size, start
+
+
+def numeric_limits(field: IddComments) -> dict[str, str]:
+    """Return pydantic ``Field`` constraints from an IDD field definition."""
+    return {arg: value for key, arg in NUMERIC_LIMITS.items() if (value := _first(field, key))}
+
+
+def format_default(base_type: str, value: str) -> str | None:
+    """Return ``value`` as a Python literal of ``base_type``, or ``None`` when there is no default."""
+    if value in _NO_DEFAULT:
+        return None
+    if base_type == "str" or base_type.startswith("Literal"):
+        return repr(value)
+    return value
+
+
+class FieldSpec:
+    """One IDD field with its name, type, constraints and default resolved."""
+
+    __slots__ = ("base_type", "constraints", "default", "name", "note", "required", "type")
+
+    def __init__(
+        self,
+        name: str,
+        base_type: str,
+        constraints: tuple[str, ...] = (),
+        default: str | None = None,
+        required: bool = False,
+        note: str = "",
+    ) -> None:
+        self.name = name
+        self.base_type = base_type
+        self.constraints = constraints
+        self.default = default
+        self.required = required
+        self.note = note
+        field_args = list(constraints)
+        # Required fields always get a default, even if it is only ``...``
+        if default is not None:
+            field_args.append(f"default={default}")
+        elif required:
+            field_args.insert(0, "default=...")
+        self.type = sys.intern(f"Annotated[{base_type}, Field({', '.join(field_args)})]")
+
+    @property
+    def choices(self) -> tuple[str, ...]:
+        """The keys of a choice field, empty for other fields."""
+        if not self.base_type.startswith("Literal["):
+            return ()
+        return tuple(ast.literal_eval(f"[{self.base_type[len('Literal[') : -1]}]"))
+
+    @property
+    def limits(self) -> dict[str, float]:
+        """The finite numeric limits of the field, keyed by ``Field`` argument (``ge``, ``gt``, ``le``, ``lt``)."""
+        limits = {}
+        for constraint in self.constraints:
+            arg, _, value = constraint.partition("=")
+            try:
+                number = float(value)
+            except ValueError:
+                continue
+            if math.isfinite(number):
+                limits[arg] = number
+        return limits
+
+    @classmethod
+    def from_comments(cls, field: IddComments) -> FieldSpec:
+        """Build the spec of a raw IDD field record."""
+        base_type = field_base_type(field)
+        limits = numeric_limits(field) if base_type in {"int", "float"} else {}
+        return cls(
+            sys.intern(normalize_field_name(field["field"][0])),
+            sys.intern(base_type),
+            tuple(f"{arg}={value}" for arg, value in limits.items()),
+            format_default(base_type, _first(field, "default")),
+            "required-field" in field,
+            _first(field, "note"),
+        )
+
+    def _key(self) -> tuple:
+        return (self.name, self.base_type, self.constraints, self.default, self.required, self.note)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FieldSpec) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"FieldSpec({self.name!r}, {self.type!r})"
+
+
+class ObjectSpec:
+    """One IDD object: its key, class name, memo and fields, ready to render."""
+
+    __slots__ = ("classname", "extensible_size", "extensible_start", "fields", "group", "key", "memo", "typing_imports")
+
+    def __init__(
+        self,
+        key: str,
+        fields: tuple[FieldSpec, ...] = (),
+        memo: str = "",
+        group: str = "",
+        extensible: tuple[int, int] = (0, 0),
+    ) -> None:
+        self.key = key
+        self.classname = sys.intern(normalize_classname(key))
+        self.fields = fields
+        self.memo = memo
+        self.group = group
+        # Fields per extensible group, and the index of the first group's first field
+        self.extensible_size, self.extensible_start = extensible
+        # Import only what the fields use, in isort order, so the stub is lint-clean as rendered
+        self.typing_imports = typing_imports(fields)
+
+    @property
+    def idf_key(self) -> str:
+        """The key eppy files this object under in ``IDF.idfobjects``."""
+        return self.key.upper()
+
+    def stub_fields(self, extensible_groups: int | None = None) -> tuple[FieldSpec, ...]:
+        """The fields the stub spells out.
+
+        Those are the fields before the extensible groups and the first
+        ``extensible_groups`` groups, or every group when it is ``None``.
+        """
+        if extensible_groups is None or not self.extensible_size:
+            return self.fields
+        return self.fields[: self.extensible_start + extensible_groups * self.extensible_size]
+
+    def _key(self) -> tuple:
+        return (self.key, self.fields, self.memo, self.group, self.extensible_size, self.extensible_start)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ObjectSpec) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"ObjectSpec({self.key!r}, {len(self.fields)} fields)"
+
+
+def validation_rule(field: FieldSpec, position: int) -> tuple | None:
+    """Return the runtime validation rule of ``field``, or ``None`` when nothing about it can be checked.
+
+    Rules are ``(name, position, kind, required, choices, ge, gt, le, lt)``
+    tuples, where ``position`` indexes the field in an EpBunch's values (the
+    object key comes first) and ``kind`` is ``"int"``, ``"float"`` or ``""``.
+    """
+    kind = field.base_type if field.base_type in {"int", "float"} else ""
+    choices = field.choices
+    if not (kind or choices or field.required):
+        return None
+    limits = field.limits
+    return (
+        field.name,
+        position,
+        kind,
+        field.required,
+        choices or None,
+        *(limits.get(arg) for arg in ("ge", "gt", "le", "lt")),
+    )
+
+
+def object_spec(record: IddRecord, fields: dict[FieldSpec, FieldSpec] | None = None) -> ObjectSpec:
+    """Build the spec of one ``[object_comments, *field_comments]`` record.
+
+    ``fields`` interns field specs: an equal spec already in it is reused.
+    """
+    obj, *field_records = record
+    specs = []
+    for field in field_records:
+        spec = FieldSpec.from_comments(field)
+        if fields is not None:
+            spec = fields.setdefault(spec, spec)
+        specs.append(spec)
+    return ObjectSpec(
+        obj["idfobj"],
+        tuple(specs),
+        _first(obj, "memo"),
+        obj.get("group", ""),
+        extensible_group(obj, field_records),
+    )
+
+
+def build_object_specs(records: Iterable[IddRecord]) -> list[ObjectSpec]:
+    """Build the specs of IDD object ``records`` (``idd_info[1:]``), sharing equal field specs."""
+    fields: dict[FieldSpec, FieldSpec] = {}
+    return [object_spec(record, fields) for record in records]
@@ -0,0 +1,122 @@
+"""Lightweight streaming parser for EnergyPlus ``Energy+.idd`` files.
+
+The parser produces the same nested structure exposed by eppy/archetypal as
+``IDF.idd_info``: a list of object records where each record is a list whose
+first element holds the object-level comments (``memo``, ``unique-object``,
+...) along with the ``idfobj`` and ``group`` names, and the remaining elements
+hold one dictionary per field (``field``, ``type``, ``key``, ``default``, ...).
+Every comment value is a list of strings, so ``\\key`` and multi-line
+``\\memo`` entries accumulate.
+
+The file is read line by line and records are yielded as soon as an object is
+complete, so building stubs never requires archetypal, eppy or an EnergyPlus
+installation beyond the IDD file itself.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+IddComments = dict[str, list[str]]
+IddRecord = list[dict[str, Any]]
+
+_DIRECTIVE_RE = re.compile(r"\\(?P<key>[A-Za-z][\w\-]*(?::\d+)?[<>]?)\s*(?P<value>.*)")
+_HEADER_RE = re.compile(r"!\s*(?P<key>IDD_\w+)\s+(?P<value>.*)")
+
+
+def _split_tokens(code: str) -> Iterator[tuple[str, str]]:
+    """Yield ``(token, terminator)`` pairs from the code part of an IDD line."""
+    token: list[str] = []
+    for char in code:
+        if char in ",;":
+            yield "".join(token).strip(), char
+            token = []
+        else:
+            token.append(char)
+    rest = "".join(token).strip()
+    if rest:
+        yield rest, ""
+
+
+class _RecordBuilder:
+    """Accumulate IDD tokens and comments into object records."""
+
+    def __init__(self) -> None:
+        self.group = ""
+        self.record: IddRecord | None = None
+        self.target: dict[str, Any] | None = None
+        self.expecting_name = True
+
+    def add_token(self, token: str, terminator: str) -> IddRecord | None:
+        """Consume one code token, returning the previous record once it is complete."""
+        finished = None
+        if self.expecting_name:
+            finished = self.record
+            obj: dict[str, Any] = {"idfobj": token}
+            if self.group:
+                obj["group"] = self.group
+            self.record = [obj]
+            self.target = obj
+        elif self.record is not None:
+            field: IddComments = {}
+            self.record.append(field)
+            self.target = field
+        self.expecting_name = terminator == ";"
+        return finished
+
+    def add_comment(self, key: str, value: str) -> None:
+        if key == "group":
+            self.group = value
+        elif self.target is not None:
+            self.target.setdefault(key, []).append(value)
+
+
+def iter_idd_records(lines: Iterable[str], header: IddComments | None = None) -> Iterator[IddRecord]:
+    """Yield one record per IDD object from an iterable of IDD lines.
+
+    Args:
+        lines: Lines of an ``Energy+.idd`` file.
+        header: Optional dictionary receiving the ``!IDD_Version`` and
+            ``!IDD_BUILD`` header comments (keys are lower-cased).
+
+    Yields:
+        ``[object_comments, field_1, field_2, ...]`` for each IDD object.
+    """
+    builder = _RecordBuilder()
+    for raw_line in lines:
+        line = raw_line.strip()
+        if line.startswith("!"):
+            match = _HEADER_RE.match(line)
+            if match and header is not None:
+                header.setdefault(match["key"].lower(), []).append(match["value"].strip())
+            continue
+
+        code, sep, directive = line.partition("\\")
+        for token, terminator in _split_tokens(code.split("!", 1)[0]):
+            if token:
+                finished = builder.add_token(token, terminator)
+                if finished is not None:
+                    yield finished
+
+        match = _DIRECTIVE_RE.match(sep + directive) if sep else None
+        if match is not None:
+            builder.add_comment(match["key"], match["value"].strip())
+
+    if builder.record is not None:
+        yield builder.record
+
+
+def parse_idd(idd_path: str | Path) -> list[IddRecord]:
+    """Parse ``idd_path`` into an ``idd_info`` compatible list.
+
+    The first element is a single-item record holding the file header
+    comments (e.g. ``{"idd_version": ["23.1.0"]}``); IDD objects follow in
+    file order, mirroring the layout consumers iterate with ``idd_info[1:]``.
+    """
+    header: IddComments = {}
+    with open(idd_path, encoding="latin-1") as idd_file:
+        records = list(iter_idd_records(idd_file, header))
+    return [[header], *records]
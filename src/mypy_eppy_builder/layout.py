@@ -0,0 +1,58 @@
+"""Module layouts of the class stubs in a version package.
+
+``per-class`` (the default) writes one module per IDD class, named after
+the class.  ``single`` writes every class into one ``objects`` module, and
+``by-group`` writes one module per IDD ``\\group``, named after the group.
+Fewer modules mean fewer files for a type checker to find, open and parse
+before it can resolve ``IDF``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from mypy_eppy_builder.idd_model import ObjectSpec
+from mypy_eppy_builder.lint import isort_key, member_key
+
+LAYOUTS = ("per-class", "single", "by-group")
+# Module holding every class in the ``single`` layout
+SINGLE_MODULE = "objects"
+# Module of the classes outside any ``\group`` in the ``by-group`` layout
+UNGROUPED_MODULE = "ungrouped"
+
+
+def group_module(group: str) -> str:
+    """Return the module name of an IDD ``\\group``: ``Thermal Zones and Surfaces`` -> ``thermal_zones_and_surfaces``."""
+    name = re.sub(r"[^0-9a-z]+", "_", group.lower()).strip("_")
+    if not name:
+        return UNGROUPED_MODULE
+    return f"group_{name}" if name[0].isdigit() else name
+
+
+def module_name(spec: ObjectSpec, layout: str) -> str:
+    """Return the module the class stub of ``spec`` is written to in ``layout``."""
+    if layout == "single":
+        return SINGLE_MODULE
+    if layout == "by-group":
+        return group_module(spec.group)
+    return spec.classname
+
+
+def layout_modules(specs: Iterable[ObjectSpec], layout: str) -> dict[str, list[ObjectSpec]]:
+    """Return ``{module: specs}`` for ``layout``, modules in isort order and classes sorted within each."""
+    modules: dict[str, list[ObjectSpec]] = {}
+    for spec in specs:
+        modules.setdefault(module_name(spec, layout), []).append(spec)
+    return {
+        module: sorted(modules[module], key=lambda spec: isort_key(spec.classname))
+        for module in sorted(modules, key=isort_key)
+    }
+
+
+def class_imports(class_modules: Iterable[tuple[str, str]]) -> list[tuple[str, list[str]]]:
+    """Group ``(module, classname)`` pairs into ``(module, classnames)`` imports, sorted as ruff's isort does."""
+    imports: dict[str, list[str]] = {}
+    for module, classname in class_modules:
+        imports.setdefault(module, []).append(classname)
+    return [(module, sorted(imports[module], key=member_key)) for module in sorted(imports, key=isort_key)]
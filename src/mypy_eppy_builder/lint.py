@@ -0,0 +1,107 @@
+"""Lint helpers for the generated packages.
+
+The templates render output that already satisfies the generated packages'
+ruff configuration, so a full ``ruff check --fix`` pass over thousands of
+stubs is no longer needed on every build.  Import blocks and ``__all__``
+lists are emitted in the order ruff's isort (``I001``) and ``RUF022`` rules
+expect, using the sort keys below.  :func:`verify_lint` spot-checks the
+output, and :func:`ruff_fix` keeps the old fix-everything pass available.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import subprocess
+from pathlib import Path
+
+from mypy_eppy_builder import profiling
+
+_CHUNK_RE = re.compile(r"(\d+)")
+
+
+def _natural(name: str) -> tuple:
+    return tuple(int(chunk) if chunk.isdigit() else chunk for chunk in _CHUNK_RE.split(name))
+
+
+def isort_key(module: str) -> tuple:
+    """Sort key matching the order ruff's isort gives to module names.
+
+    Names compare case-insensitively with natural ordering of numbers
+    (``Object9`` before ``Object10``), falling back to the exact name.
+    """
+    return (_natural(module.lower()), module)
+
+
+def dunder_all_key(name: str) -> tuple:
+    """Sort key matching ruff's ``RUF022`` "isort-style" order for ``__all__``.
+
+    ``SCREAMING_CASE`` names come first, then ``CamelCase`` names, then the
+    rest, each group in natural order.
+    """
+    if name.isupper():
+        category = 0
+    elif name[:1].isupper():
+        category = 1
+    else:
+        category = 2
+    return (category, _natural(name))
+
+
+def member_key(name: str) -> tuple:
+    """Sort key matching the order ruff's isort gives to the names imported by one ``from`` import.
+
+    Like ``__all__``, constants come before classes and the rest, but each
+    group compares case-insensitively first.
+    """
+    if len(name) > 1 and name.isupper():
+        category = 0
+    elif name[:1].isupper():
+        category = 1
+    else:
+        category = 2
+    return (category, _natural(name.lower()), _natural(name))
+
+
+def lint_sample(paths: list[Path], size: int, seed: int = 0) -> list[Path]:
+    """Return every non-stub file plus a reproducible sample of ``size`` ``.pyi`` stubs from ``paths``."""
+    stubs = sorted(path for path in paths if path.suffix == ".pyi")
+    others = sorted(path for path in paths if path.suffix != ".pyi")
+    sample = random.Random(seed).sample(stubs, min(size, len(stubs)))  # noqa: S311
+    return others + sorted(sample)
+
+
+def changed_since(root: Path, timestamp: float) -> list[Path]:
+    """Return the files under ``root`` modified at or after ``timestamp``."""
+    return sorted(path for path in root.rglob("*") if path.is_file() and path.stat().st_mtime >= timestamp)
+
+
+def _python_files(paths: list[Path]) -> list[str]:
+    return [str(path) for path in paths if path.suffix in {".py", ".pyi"}]
+
+
+def verify_lint(paths: list[Path]) -> bool:
+    """Run ``ruff check`` without fixing on ``paths`` and return whether it passed.
+
+    Returns ``True`` when there is nothing to check or ruff is not installed.
+    """
+    files = _python_files(paths)
+    if not files:
+        return True
+    try:
+        with profiling.phase("ruff check", files=len(files)):
+            result = subprocess.run(["ruff", "check", "--no-fix", *files], check=False)  # noqa: S603, S607
+    except FileNotFoundError:
+        print("Warning: ruff not found; skipping lint verification.")
+        return True
+    return result.returncode == 0
+
+
+def ruff_fix(roots: list[Path]) -> None:
+    """Apply ruff auto-fixes under ``roots`` without failing on remaining violations."""
+    try:
+        for root in roots:
+            with profiling.phase("ruff fix", root=str(root)):
+                subprocess.run(["ruff", "check", str(root), "--fix-only"], check=True)  # noqa: S603, S607
+    except FileNotFoundError:
+        print("Warning: ruff not found; skipping lint on generated packages.")
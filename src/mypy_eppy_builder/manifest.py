@@ -0,0 +1,104 @@
+"""Content manifests used for incremental regeneration.
+
+A manifest records, for every generated file, a hash of the inputs it was
+rendered from and a hash of the rendered output.  On the next run unchanged
+inputs are not re-rendered at all, and re-rendered files whose output did not
+change are not rewritten, so file modification times (and the mypy/pyright and
+wheel build caches keyed on them) are left untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+STUBS_MANIFEST_NAME = ".stubs-manifest.json"
+TEMPLATES_MANIFEST_NAME = ".templates-manifest.json"
+
+
+def hash_text(*parts: str) -> str:
+    """Return the hex SHA-256 digest of ``parts`` joined with NUL separators."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def write_if_changed(path: Path, content: str | bytes) -> bool:
+    """Write ``content``, text or bytes, to ``path`` unless the file already holds it.
+
+    Returns:
+        ``True`` when the file was written.
+    """
+    try:
+        if (path.read_bytes() if isinstance(content, bytes) else path.read_text()) == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content)
+    return True
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a temporary file, so readers see the old or the new file, never a part.
+
+    Concurrent writers of the same path each replace it whole; the last one wins.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # Temporary files are private; the result is as readable as any other written file
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class Manifest:
+    """Map generated file names to their input and output hashes."""
+
+    def __init__(self, path: Path, entries: dict[str, dict[str, str]] | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, str]] = entries or {}
+
+    @classmethod
+    def load(cls, path: Path) -> Manifest:
+        """Read ``path``, returning an empty manifest if it is missing or invalid."""
+        try:
+            entries = json.loads(path.read_text())
+        except (OSError, ValueError):
+            entries = {}
+        return cls(path, entries if isinstance(entries, dict) else {})
+
+    def is_fresh(self, name: str, input_hash: str) -> bool:
+        """Return whether ``name`` was last rendered from ``input_hash``."""
+        return self.entries.get(name, {}).get("input") == input_hash
+
+    def has_output(self, name: str, output_hash: str) -> bool:
+        """Return whether the last recorded output of ``name`` hashes to ``output_hash``."""
+        return self.entries.get(name, {}).get("output") == output_hash
+
+    def record(self, name: str, input_hash: str, output_hash: str) -> None:
+        self.entries[name] = {"input": input_hash, "output": output_hash}
+
+    def prune(self, keep: set[str]) -> list[str]:
+        """Forget every entry not in ``keep`` and return the removed names."""
+        stale = sorted(set(self.entries) - keep)
+        for name in stale:
+            del self.entries[name]
+        return stale
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=1, sort_keys=True) + "\n")
@@ -0,0 +1,206 @@
+"""Per-phase timings and peak memory of a generator run.
+
+``generate_package --profile`` enables a process-wide :class:`Profiler`.  The
+pipeline wraps its phases (IDD load, class stub rendering, file writes,
+template rendering and the ruff subprocess) in :func:`phase`, which costs
+nothing while profiling is disabled, and records one event per rendered
+class with its render time and output size.  Peak memory per phase comes from
+:mod:`tracemalloc`, which slows rendering down noticeably, so absolute times
+are best compared between profiled runs only.
+
+Work done in worker processes is profiled there through :func:`run_profiled`
+and merged back with :func:`merge`.  :func:`write_profile` writes a JSON
+report (phases plus the slowest classes) and a Chrome trace-event file that
+``chrome://tracing`` or https://ui.perfetto.dev can open.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+# Event categories
+PHASE = "phase"
+RENDER = "render"
+
+
+class Profiler:
+    """Collect timed events and per-phase peak traced memory for one process."""
+
+    def __init__(self, *, trace_memory: bool = True) -> None:
+        self.trace_memory = trace_memory
+        self.events: list[dict[str, Any]] = []
+        # Highest traced memory seen by each open phase, innermost last
+        self._peaks: list[int] = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _fold_peak(self) -> int:
+        """Fold the traced peak since the last reset into every open phase and reset it."""
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+        tracemalloc.reset_peak()
+        self._peaks = [max(open_peak, peak) for open_peak in self._peaks]
+        return peak
+
+    @contextmanager
+    def phase(self, name: str, **args: Any) -> Iterator[None]:
+        """Record the time and peak traced memory of the enclosed block as a phase event."""
+        if self.trace_memory:
+            self._fold_peak()
+            self._peaks.append(0)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            if self.trace_memory:
+                self._fold_peak()
+                args = {**args, "peak_memory": self._peaks.pop()}
+            self.add(name, start, end, category=PHASE, **args)
+
+    def add(self, name: str, start: int, end: int, *, category: str, pid: int | None = None, **args: Any) -> None:
+        """Record an event spanning ``start`` to ``end`` (``time.perf_counter_ns`` values)."""
+        self.events.append({
+            "name": name,
+            "category": category,
+            "start": start,
+            "end": end,
+            "pid": os.getpid() if pid is None else pid,
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+    def close(self) -> None:
+        """Stop tracing memory if this profiler started it."""
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+_profiler: Profiler | None = None
+
+
+def enable(*, trace_memory: bool = True) -> Profiler:
+    """Start profiling this process and return the active profiler."""
+    global _profiler
+    _profiler = Profiler(trace_memory=trace_memory)
+    return _profiler
+
+
+def disable() -> list[dict[str, Any]]:
+    """Stop profiling and return the events recorded so far."""
+    global _profiler
+    if _profiler is None:
+        return []
+    events = _profiler.events
+    _profiler.close()
+    _profiler = None
+    return events
+
+
+def enabled() -> bool:
+    """Return whether profiling is active in this process."""
+    return _profiler is not None
+
+
+@contextmanager
+def phase(name: str, **args: Any) -> Iterator[None]:
+    """Record the enclosed block as a phase when profiling is enabled."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name, **args):
+        yield
+
+
+def record(name: str, start: int, end: int, *, category: str = RENDER, pid: int | None = None, **args: Any) -> None:
+    """Record an event when profiling is enabled."""
+    if _profiler is not None:
+        _profiler.add(name, start, end, category=category, pid=pid, **args)
+
+
+def merge(events: list[dict[str, Any]]) -> None:
+    """Add events recorded in another process to the active profiler."""
+    if _profiler is not None:
+        _profiler.events.extend(events)
+
+
+def run_profiled(func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, list[dict[str, Any]]]:
+    """Call ``func`` with profiling enabled and return its result and events (a worker-process entry point)."""
+    enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        events = disable()
+    return result, events
+
+
+def _ms(nanoseconds: int) -> float:
+    return round(nanoseconds / 1e6, 3)
+
+
+def report(events: list[dict[str, Any]], slowest: int = 50) -> dict[str, Any]:
+    """Summarise ``events``: every phase in start order and the ``slowest`` class renders."""
+    origin = min((event["start"] for event in events), default=0)
+    phases = [
+        {
+            "name": event["name"],
+            "start_ms": _ms(event["start"] - origin),
+            "duration_ms": _ms(event["end"] - event["start"]),
+            "pid": event["pid"],
+            **event["args"],
+        }
+        for event in sorted(events, key=lambda event: event["start"])
+        if event["category"] == PHASE
+    ]
+    renders = [event for event in events if event["category"] == RENDER]
+    renders.sort(key=lambda event: event["end"] - event["start"], reverse=True)
+    return {
+        "wall_time_ms": _ms(max((event["end"] for event in events), default=0) - origin),
+        "phases": phases,
+        "classes_rendered": len(renders),
+        "render_time_ms": _ms(sum(event["end"] - event["start"] for event in renders)),
+        "slowest_classes": [
+            {"name": event["name"], "duration_ms": _ms(event["end"] - event["start"]), **event["args"]}
+            for event in renders[:slowest]
+        ],
+    }
+
+
+def chrome_trace(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return ``events`` in the Chrome trace-event format, as complete (``"X"``) events."""
+    origin = min((event["start"] for event in events), default=0)
+    return {
+        "displayTimeUnit": "ms",
+        "traceEvents": [
+            {
+                "name": event["name"],
+                "cat": event["category"],
+                "ph": "X",
+                "ts": (event["start"] - origin) / 1000,
+                "dur": (event["end"] - event["start"]) / 1000,
+                "pid": event["pid"],
+                "tid": event["tid"],
+                "args": event["args"],
+            }
+            for event in sorted(events, key=lambda event: event["start"])
+        ],
+    }
+
+
+def trace_path(path: Path) -> Path:
+    """Return where the Chrome trace of the report at ``path`` is written."""
+    return path.with_name(f"{path.stem}.trace.json")
+
+
+def write_profile(path: Path, events: list[dict[str, Any]]) -> None:
+    """Write the JSON report of ``events`` to ``path`` and their Chrome trace next to it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report(events), indent=2) + "\n")
+    trace_path(path).write_text(json.dumps(chrome_trace(events)) + "\n")
@@ -0,0 +1,67 @@
+"""Slim class stubs: shared annotation aliases, short docs and optional bare types.
+
+A full version package spells out every field annotation in place, so the
+same ``Annotated[float, Field(ge=0.0)]`` or long ``Literal[...]`` of choice
+keys is repeated thousands of times, and every IDD memo and note becomes a
+docstring.  In slim mode each annotation used by more than one field is
+defined once, as a type alias in the package's ``_aliases`` stub, and the
+class stubs import it from there.  Docstrings are cut to their first
+sentence or dropped, and the ``pydantic.Field`` constraints can be dropped
+too, leaving the bare field types.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from mypy_eppy_builder.idd_model import FieldSpec
+
+ALIASES_MODULE = "_aliases"
+ALIASES_FILE = f"{ALIASES_MODULE}.pyi"
+# Slim docstrings keep their first sentence, cut to this many characters
+DOC_LIMIT = 80
+# Line length the rendered stubs are wrapped to, as ruff would
+LINE_LENGTH = 120
+
+
+def field_type(field: FieldSpec, constraints: bool = True) -> str:
+    """Return the annotation of ``field``: with its ``Field`` constraints, or the bare type without."""
+    return field.type if constraints else field.base_type
+
+
+def truncate_doc(text: str, limit: int = DOC_LIMIT) -> str:
+    """Return the first sentence of ``text``, cut on a word boundary to at most ``limit`` characters."""
+    text = " ".join(text.split())
+    sentence, period, _ = text.partition(". ")
+    sentence += period.strip()
+    if len(sentence) <= limit:
+        return sentence
+    return sentence[: limit - 3].rsplit(" ", 1)[0].rstrip(",;:") + "..."
+
+
+def shared_aliases(types: Iterable[str]) -> dict[str, str]:
+    """Return ``{annotation: alias name}`` for the subscripted annotations in ``types`` used more than once.
+
+    Aliases are numbered from the most used annotation down (``A0``, ``A1``,
+    ...), ties broken by the annotation text, so the names are stable for a
+    given IDD.
+    """
+    counts = Counter(type_ for type_ in types if "[" in type_)
+    shared = sorted((type_ for type_, count in counts.items() if count > 1), key=lambda type_: (-counts[type_], type_))
+    return {type_: f"A{index}" for index, type_ in enumerate(shared)}
+
+
+def import_statement(module: str, names: list[str]) -> str:
+    """Return ``from module import names``, wrapped one name per line as ruff's isort does past the line length."""
+    line = f"from {module} import {', '.join(names)}"
+    if len(line) <= LINE_LENGTH:
+        return line
+    return "\n".join([f"from {module} import (", *(f"    {name}," for name in names), ")"])
+
+
+def annotation_imports(types: Iterable[str]) -> tuple[tuple[str, ...], bool]:
+    """Return the ``typing`` names (isort order) and whether ``pydantic.Field`` is needed to spell ``types``."""
+    types = list(types)
+    names = [name for name in ("Annotated", "Literal") if any(f"{name}[" in type_ for type_ in types)]
+    return tuple(names), any("Field(" in type_ for type_ in types)
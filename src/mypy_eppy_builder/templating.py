@@ -0,0 +1,91 @@
+"""Process-wide registry of Jinja environments and compiled templates.
+
+The stub generator, the overload generator and the package renderer all load
+templates from the same directories.  Sharing one :class:`jinja2.Environment`
+per directory and option set means each template file is compiled once per
+process, and small templates built from strings (such as the directory and
+file name patterns in the template tree) are compiled once and reused.
+
+Compiled template bytecode can additionally be persisted with
+:func:`enable_bytecode_cache` so a cold CLI run does not recompile templates
+that have not changed since the previous run.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache, Environment, Template
+
+_environments: dict[tuple[str, bool, bool, bool, bool], Environment] = {}
+_string_templates: dict[tuple[int, str], Template] = {}
+_bytecode_cache: BytecodeCache | None = None
+
+
+def get_environment(
+    template_dir: str | Path,
+    *,
+    autoescape: bool = False,
+    trim_blocks: bool = False,
+    lstrip_blocks: bool = False,
+    keep_trailing_newline: bool = False,
+) -> Environment:
+    """Return the shared environment loading from ``template_dir`` with the given options."""
+    key = (str(template_dir), autoescape, trim_blocks, lstrip_blocks, keep_trailing_newline)
+    env = _environments.get(key)
+    if env is None:
+        # Imported on first use so that commands which render nothing start quickly
+        from jinja2 import Environment, FileSystemLoader
+
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=autoescape,  # noqa: S701
+            trim_blocks=trim_blocks,
+            lstrip_blocks=lstrip_blocks,
+            keep_trailing_newline=keep_trailing_newline,
+        )
+        if _bytecode_cache is not None:
+            env.bytecode_cache = _bytecode_cache
+        _environments[key] = env
+    return env
+
+
+def from_string(env: Environment, source: str) -> Template:
+    """Return ``env.from_string(source)``, compiling each source once per environment."""
+    key = (id(env), source)
+    template = _string_templates.get(key)
+    if template is None:
+        template = env.from_string(source)
+        _string_templates[key] = template
+    return template
+
+
+def render_string(env: Environment, source: str, context: dict | None = None) -> str:
+    """Render the template ``source`` compiled in ``env`` with ``context``."""
+    return str(from_string(env, source).render(context or {}))
+
+
+def enable_bytecode_cache(directory: str | Path | None) -> None:
+    """Persist compiled template bytecode under ``directory`` (``None`` disables it).
+
+    The setting applies to environments already in the registry and to any
+    created afterwards.
+    """
+    global _bytecode_cache
+    if directory is None:
+        _bytecode_cache = None
+    else:
+        from jinja2 import FileSystemBytecodeCache
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        _bytecode_cache = FileSystemBytecodeCache(str(directory))
+    for env in _environments.values():
+        env.bytecode_cache = _bytecode_cache
+
+
+def clear() -> None:
+    """Forget every registered environment and compiled string template."""
+    _environments.clear()
+    _string_templates.clear()
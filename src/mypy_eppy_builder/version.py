@@ -0,0 +1,8 @@
+def get_version() -> str:
+    """Return the installed ``mypy_eppy_builder`` version (``0.0.0`` when not installed)."""
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("mypy_eppy_builder")
+    except importlib.metadata.PackageNotFoundError:
+        return "0.0.0"
@@ -0,0 +1,65 @@
+import base64
+import hashlib
+import tarfile
+import zipfile
+from pathlib import Path
+
+from mypy_eppy_builder.archive import build_sdist, build_wheel, core_metadata, wheel_contents
+
+FILES = {
+    "pyproject.toml": '[project]\nname = "types-eplus231"\n',
+    "README.md": "# types-eplus231\n",
+    "src/types_eplus231/__init__.py": "",
+    "src/types_eplus231/Zone.pyi": "class Zone: ...\n",
+}
+
+
+def test_core_metadata() -> None:
+    metadata = core_metadata(
+        "archetypal-stubs",
+        "0.1.0",
+        summary="Stubs",
+        requires_python=">=3.9",
+        classifiers=["Typing :: Stubs Only"],
+        extras={"eplus231": ["types-eplus231"]},
+        readme="# Title\n",
+    )
+    assert metadata.startswith("Metadata-Version: 2.1\nName: archetypal-stubs\nVersion: 0.1.0\n")
+    assert "Classifier: Typing :: Stubs Only\n" in metadata
+    assert 'Requires-Dist: types-eplus231; extra == "eplus231"\n' in metadata
+    assert metadata.endswith("Description-Content-Type: text/markdown\n\n# Title\n")
+
+
+def test_build_wheel(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    metadata = core_metadata("types_eplus231", "0.1.0")
+
+    wheel = build_wheel(wheel_contents(FILES), "types_eplus231", "0.1.0", metadata, tmp_path / "a")
+
+    assert wheel.name == "types_eplus231-0.1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel) as archive:
+        names = archive.namelist()
+        assert "types_eplus231/Zone.pyi" in names
+        assert "pyproject.toml" not in names
+        record = archive.read("types_eplus231-0.1.0.dist-info/RECORD").decode().splitlines()
+        for line in record[:-1]:
+            path, digest, size = line.split(",")
+            data = archive.read(path)
+            expected = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=").decode()
+            assert digest == f"sha256={expected}"
+            assert int(size) == len(data)
+        assert record[-1] == "types_eplus231-0.1.0.dist-info/RECORD,,"
+    # Identical inputs give byte-identical archives.
+    again = build_wheel(wheel_contents(FILES), "types_eplus231", "0.1.0", metadata, tmp_path / "b")
+    assert again.read_bytes() == wheel.read_bytes()
+
+
+def test_build_sdist(tmp_path: Path) -> None:
+    sdist = build_sdist(FILES, "types-eplus231", "0.1.0", core_metadata("types-eplus231", "0.1.0"), tmp_path)
+
+    assert sdist.name == "types_eplus231-0.1.0.tar.gz"
+    with tarfile.open(sdist) as archive:
+        names = archive.getnames()
+    assert "types_eplus231-0.1.0/PKG-INFO" in names
+    assert "types_eplus231-0.1.0/src/types_eplus231/Zone.pyi" in names
+    assert "types_eplus231-0.1.0/pyproject.toml" in names
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from mypy_eppy_builder import generate_package
+from mypy_eppy_builder.build_cache import (
+    BuildCache,
+    HttpBackend,
+    LocalBackend,
+    backend_for,
+    make_server,
+    pack_artifact,
+    unpack_artifact,
+)
+
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+Zone,
+  A1 ; \\field Name
+      \\required-field
+Lead Input;
+"""
+KEY = "ab" * 32
+
+
+def _template_dir(tmp_path: Path) -> Path:
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "stub.jinja2").write_text("{{ classname }}")
+    return template_dir
+
+
+def test_local_backend_replaces_entries_whole(tmp_path: Path) -> None:
+    backend = LocalBackend(tmp_path / "cache")
+    payloads = [bytes([n]) * (n + 1) * 10_000 for n in range(8)]
+    assert backend.get(KEY) is None
+
+    def write_and_read(payload: bytes) -> bytes | None:
+        backend.put(KEY, payload)
+        return backend.get(KEY)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        reads = list(pool.map(write_and_read, payloads * 4))
+
+    assert all(read in payloads for read in reads)
+    assert [path.name for path in (tmp_path / "cache").rglob("*") if path.is_file()] == [f"{KEY}.zip"]
+    assert backend.path_for(KEY).stat().st_mode & 0o777 == 0o644
+
+
+def test_artifacts_round_trip_and_stay_inside_their_root() -> None:
+    files = {"types-eplus231/pyproject.toml": b"[project]\n", "types_eplus231-0.1.0-py3-none-any.whl": b"PK"}
+    assert unpack_artifact(pack_artifact({"classnames": ["Zone"]}, files)) == ({"classnames": ["Zone"]}, files)
+    assert pack_artifact({}, files) == pack_artifact({}, dict(reversed(files.items())))
+
+    with pytest.raises(ValueError, match="outside its root"):
+        unpack_artifact(pack_artifact({}, {"../escape.py": b""}))
+    with pytest.raises(ValueError, match="Not a build artifact"):
+        unpack_artifact(b"not a zip")
+
+
+def test_key_covers_idd_templates_and_options(tmp_path: Path) -> None:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    template_dir = _template_dir(tmp_path)
+    cache = BuildCache(LocalBackend(tmp_path / "cache"), template_dir)
+    key = cache.key(idd_file, "23.1", {"layout": "per-class"})
+
+    assert key == BuildCache(LocalBackend(tmp_path / "other"), template_dir).key(
+        idd_file, "23.1", {"layout": "per-class"}
+    )
+    assert key != cache.key(idd_file, "23.1", {"layout": "single"})
+    assert key != cache.key(idd_file, "23.2", {"layout": "per-class"})
+    idd_file.write_text(IDD_TEXT + "Material;\n")
+    assert key != cache.key(idd_file, "23.1", {"layout": "per-class"})
+    (template_dir / "stub.jinja2").write_text("class {{ classname }}")
+    assert cache.key(idd_file, "23.1", {}) != BuildCache(cache.backend, template_dir).key(idd_file, "23.1", {})
+
+
+def test_corrupt_entries_are_misses(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    cache = BuildCache(LocalBackend(tmp_path / "cache"), _template_dir(tmp_path))
+    cache.backend.put(KEY, b"truncated")
+
+    assert cache.load(KEY) is None
+    assert "ignoring build cache entry" in capsys.readouterr().out
+
+
+def test_http_backend_talks_to_the_stand_in_server(tmp_path: Path) -> None:
+    server = make_server(tmp_path / "served")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        backend = backend_for(url)
+        assert isinstance(backend, HttpBackend)
+        assert backend.get(KEY) is None
+        backend.put(KEY, b"artifact")
+        assert backend.get(KEY) == b"artifact"
+        assert LocalBackend(tmp_path / "served").get(KEY) == b"artifact"
+        with pytest.raises(OSError, match="400"):
+            backend.get("../escape")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("output_format", ["directory", "wheel"])
+def test_main_restores_cached_packages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, output_format: str) -> None:
+    monkeypatch.setenv("MYPY_EPPY_BUILDER_CACHE_DIR", str(tmp_path / "idd-cache"))
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+
+    def build(output_dir: Path) -> dict[str, bytes]:
+        generate_package.main([
+            "--idd-file",
+            str(idd_file),
+            "--output-dir",
+            str(output_dir),
+            "--output-format",
+            output_format,
+            "--build-cache",
+            str(tmp_path / "cache"),
+        ])
+        return {
+            str(path.relative_to(output_dir)): path.read_bytes() for path in output_dir.rglob("*") if path.is_file()
+        }
+
+    first = build(tmp_path / "first")
+
+    def no_build(*args: object, **kwargs: object) -> dict:
+        pytest.fail("the version package should come from the build cache")
+
+    monkeypatch.setattr(generate_package, "build_version_package", no_build)
+    second = build(tmp_path / "second")
+
+    manifests = {name for name in first if Path(name).name.startswith(".")}
+    assert second == {name: data for name, data in first.items() if name not in manifests}
+    if output_format == "wheel":
+        assert "types_eplus231-0.1.0-py3-none-any.whl" in second
+    else:
+        assert 'key: Literal["LEAD INPUT"]' in second["types-archetypal/src/archetypal-stubs/idfclass/idf.pyi"].decode()
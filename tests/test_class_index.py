@@ -0,0 +1,97 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from mypy_eppy_builder.class_index import INDEX_FILE, ClassIndex, IndexEntry
+from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator, generate_overloads
+from mypy_eppy_builder.idd_model import ObjectSpec
+
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+\\group Simulation Parameters
+Lead Input;
+Zone_X;
+\\group Thermal Zones and Surfaces
+Zone,
+  A1 ; \\field Name
+BuildingSurface:Detailed,
+  A1 ; \\field Name
+AirLoopHVAC:Heat-Pump,
+  A1 ; \\field Name
+"""
+
+
+def _generator(tmp_path: Path, layout: str = "per-class") -> EppyStubGenerator:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    return EppyStubGenerator(str(idd_file), str(tmp_path / "stubs"), use_cache=False, layout=layout)
+
+
+def test_index_keeps_the_idd_keys(tmp_path: Path) -> None:
+    index = _generator(tmp_path).class_index
+
+    assert index.overloads == [
+        ("AirLoopHVAC_Heat_Pump", "AIRLOOPHVAC:HEAT-PUMP"),
+        ("BuildingSurface_Detailed", "BUILDINGSURFACE:DETAILED"),
+        ("Lead_Input", "LEAD INPUT"),
+        ("Zone", "ZONE"),
+        ("Zone_X", "ZONE_X"),
+    ]
+    assert index.by_key("lead input") == IndexEntry("Lead Input", "Lead_Input", "Lead_Input")
+    assert index.by_classname("Zone_X").idf_key == "ZONE_X"
+
+
+def test_index_records_layout_modules(tmp_path: Path) -> None:
+    index = _generator(tmp_path, "by-group").class_index
+
+    assert index.class_modules == [
+        ("simulation_parameters", "Lead_Input"),
+        ("simulation_parameters", "Zone_X"),
+        ("thermal_zones_and_surfaces", "AirLoopHVAC_Heat_Pump"),
+        ("thermal_zones_and_surfaces", "BuildingSurface_Detailed"),
+        ("thermal_zones_and_surfaces", "Zone"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("keys", "layout", "claim"),
+    [
+        (["Lead Input", "Lead:Input"], "per-class", "class 'Lead_Input'"),
+        (["Zone", "ZONE"], "single", "IDF key 'ZONE'"),
+        (["Zone", "Zone"], "single", "class 'Zone'"),
+        (["Zone:A", "ZONE A"], "per-class", "module file 'zone_a'"),
+    ],
+)
+def test_index_rejects_collisions(keys: list[str], layout: str, claim: str) -> None:
+    with pytest.raises(ValueError, match=claim):
+        ClassIndex.from_specs([ObjectSpec(key) for key in keys], layout)
+
+
+def test_rendered_index_module_round_trips(tmp_path: Path) -> None:
+    generator = _generator(tmp_path, "single")
+    module_path = tmp_path / INDEX_FILE
+    module_path.write_text(generator.render_class_index("23.1"))
+    spec = importlib.util.spec_from_file_location("class_index", module_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.class_name("Lead Input") == "Lead_Input"
+    assert module.idf_key("AirLoopHVAC_Heat_Pump") == "AIRLOOPHVAC:HEAT-PUMP"
+    assert module.idd_key("BuildingSurface_Detailed") == "BuildingSurface:Detailed"
+    assert module.stub_module("Zone") == "objects"
+    assert list(ClassIndex.load(module_path)) == list(generator.class_index)
+
+
+def test_overloads_read_the_shipped_index(tmp_path: Path) -> None:
+    stubs_dir = tmp_path / "types_eplus231"
+    stubs_dir.mkdir()
+    (stubs_dir / INDEX_FILE).write_text(_generator(tmp_path, "by-group").render_class_index())
+    output = tmp_path / "idf.pyi"
+
+    generate_overloads(str(stubs_dir), str(output))
+
+    idf_stub = output.read_text()
+    assert 'key: Literal["LEAD INPUT"]' in idf_stub
+    assert "from types_eplus231.simulation_parameters import Lead_Input, Zone_X" in idf_stub
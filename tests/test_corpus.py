@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+from mypy_eppy_builder.corpus import corpus_files, scan_corpus, scan_epjson, scan_idf, subset_keys
+
+IDF_TEXT = """\
+!-Generator IDFEditor 1.51
+! A comment, with separators; that must be ignored
+  Version,23.1;
+
+Zone,
+    Core,                    !- Name
+    0;                       !- Direction of Relative North {deg}
+
+BuildingSurface:Detailed,Wall 1,Wall,  !- Name and type on one line
+    Construction;
+Lead Input;  Simulation Data;
+"""
+
+
+def _write_corpus(root: Path) -> None:
+    (root / "nested").mkdir(parents=True)
+    (root / "model.idf").write_text(IDF_TEXT)
+    (root / "nested" / "model.epJSON").write_text(
+        json.dumps({"Version": {"Version 1": {"version_identifier": "23.1"}}, "Material": {"Brick": {}}})
+    )
+    (root / "notes.txt").write_text("Zone,")
+
+
+def test_scan_idf_reads_the_first_token_of_every_object(tmp_path: Path) -> None:
+    idf = tmp_path / "model.idf"
+    idf.write_text(IDF_TEXT)
+    assert scan_idf(idf) == {"VERSION", "ZONE", "BUILDINGSURFACE:DETAILED", "LEAD INPUT", "SIMULATION DATA"}
+
+
+def test_scan_epjson_reads_object_types(tmp_path: Path) -> None:
+    _write_corpus(tmp_path)
+    assert scan_epjson(tmp_path / "nested" / "model.epJSON") == {"VERSION", "MATERIAL"}
+
+
+def test_corpus_files_finds_models_recursively(tmp_path: Path) -> None:
+    _write_corpus(tmp_path)
+    assert corpus_files([tmp_path]) == [tmp_path / "model.idf", tmp_path / "nested" / "model.epJSON"]
+
+
+def test_scan_corpus_counts_files_per_key(tmp_path: Path) -> None:
+    _write_corpus(tmp_path)
+    files = corpus_files([tmp_path])
+    usage = scan_corpus(files)
+    assert usage["VERSION"] == 2
+    assert usage["MATERIAL"] == 1
+    assert scan_corpus(files, jobs=2) == usage
+
+
+def test_subset_keys_adds_the_allowlist(tmp_path: Path) -> None:
+    _write_corpus(tmp_path)
+    keys = subset_keys([tmp_path], allow=["Site:Location"])
+    assert "SITE:LOCATION" in keys
+    assert "ZONE" in keys
@@ -0,0 +1,36 @@
+from mypy_eppy_builder.dedupe import reexport_shared, reexport_stub, shared_stubs
+
+
+def test_shared_stubs_picks_content_rendered_by_most_versions() -> None:
+    stubs_by_version = {
+        "22.1": {"Zone.pyi": "old zone", "Version.pyi": "version", "Legacy.pyi": "legacy"},
+        "23.1": {"Zone.pyi": "new zone", "Version.pyi": "version"},
+        "24.1": {"Zone.pyi": "new zone", "Version.pyi": "version", "Added.pyi": "added"},
+    }
+
+    shared = shared_stubs(stubs_by_version)
+
+    assert shared == {"Version.pyi": "version", "Zone.pyi": "new zone"}
+    split = reexport_shared(stubs_by_version, shared)
+    assert split["22.1"]["Zone.pyi"] == "old zone"
+    assert split["22.1"]["Legacy.pyi"] == "legacy"
+    assert split["23.1"]["Zone.pyi"] == reexport_stub("Zone")
+    assert split["24.1"]["Version.pyi"] == reexport_stub("Version")
+    assert split["24.1"]["Added.pyi"] == "added"
+
+
+def test_shared_stubs_ties_prefer_newest_version() -> None:
+    stubs_by_version = {
+        "22.1": {"Zone.pyi": "a"},
+        "22.2": {"Zone.pyi": "a"},
+        "23.1": {"Zone.pyi": "b"},
+        "23.2": {"Zone.pyi": "b"},
+    }
+    assert shared_stubs(stubs_by_version) == {"Zone.pyi": "b"}
+    assert shared_stubs({"23.1": {"Zone.pyi": "a"}}) == {}
+
+
+def test_reexport_stub_wraps_long_lines() -> None:
+    assert reexport_stub("Zone") == "from types_eplus_common.Zone import Zone as Zone\n"
+    name = "AirConditioner_VariableRefrigerantFlow_FluidTemperatureControl_HR"
+    assert reexport_stub(name) == f"from types_eplus_common.{name} import (\n    {name} as {name},\n)\n"
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic_idd import write_synthetic_idd
+from mypy_eppy_builder.class_index import INDEX_FILE, ClassIndex
+from mypy_eppy_builder.generate_package import _package_types, _split_jobs, expand_versions, main, render_wrappers
+
+
+def test_expand_versions_lists_and_ranges() -> None:
+    assert expand_versions(["23.1"]) == ["23.1"]
+    assert expand_versions(["24.1,23.1", "23.1"]) == ["23.1", "24.1"]
+    assert expand_versions(["22.1-24.1"]) == ["22.1", "22.2", "23.1", "23.2", "24.1"]
+    assert expand_versions(["9.5-22.1"]) == ["9.5", "9.6", "22.1"]
+    # A bare year bound takes in every release of that year
+    assert expand_versions(["23.2-24"]) == ["23.2", "24.1", "24.2"]
+
+
+@pytest.mark.parametrize("version", ["22.1-30.2", "22.1-30"])
+def test_ranges_stop_at_the_newest_release(version: str) -> None:
+    with pytest.raises(ValueError, match="newest known EnergyPlus release"):
+        expand_versions([version])
+
+
+@pytest.mark.parametrize("version", ["latest", "23.x", "24.1-22.1"])
+def test_malformed_versions_are_reported(version: str, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit):
+        main(["--version", version, "--idd-file", "Energy+.idd"])
+    assert version in capsys.readouterr().err
+
+
+def test_versions_build_from_their_own_idd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MYPY_EPPY_BUILDER_CACHE_DIR", str(tmp_path / "cache"))
+    idd_24 = write_synthetic_idd(tmp_path / "24.idd", classes=5, fields=2)
+    idd_23 = write_synthetic_idd(tmp_path / "23.idd", classes=3, fields=2)
+    output_dir = tmp_path / "out"
+
+    # Listed newest first: the IDD files pair with the versions as given, and the builds run in a pool
+    main([
+        "--version",
+        "24.1",
+        "23.1",
+        "--idd-file",
+        str(idd_24),
+        str(idd_23),
+        "--output-dir",
+        str(output_dir),
+        "-j",
+        "0",
+    ])
+
+    for slug, classes in (("types_eplus231", 3), ("types_eplus241", 5)):
+        index = ClassIndex.load(output_dir / f"types-eplus{slug[-3:]}" / "src" / slug / INDEX_FILE)
+        assert len(index) == classes
+    wrapper = (output_dir / "types-archetypal" / "pyproject.toml").read_text()
+    assert "eplus231" in wrapper
+    assert "eplus241" in wrapper
+
+
+def test_split_jobs_caps_the_processes_of_a_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("os.cpu_count", lambda: 16)
+    assert _split_jobs(8, 1) == 8
+    assert _split_jobs(8, 2) == 4
+    assert _split_jobs(1, 2) == 1
+    assert _split_jobs(3, 64) == 1
+    assert _split_jobs(16, 64) == 1
+
+
+def test_package_types_expand_all_and_drop_repeats() -> None:
+    assert _package_types(["all"]) == ["archetypal", "eppy"]
+    assert _package_types(["eppy", "archetypal", "eppy"]) == ["eppy", "archetypal"]
+
+
+def test_render_wrappers_shares_one_build(tmp_path: Path) -> None:
+    build = {
+        "eplus_version": "23.1",
+        "package_slug": "types_eplus231",
+        "stubs_output_dir": tmp_path / "types-eplus231" / "src" / "types_eplus231",
+        "extra": {"name": "eplus231", "package": "types-eplus231", "path": "../types-eplus231"},
+        "classnames": ["Zone"],
+        "overloads": [("Zone", "ZONE")],
+    }
+    roots = render_wrappers(["archetypal", "eppy"], [build], output_dir=tmp_path)
+    assert roots == [tmp_path / "types-archetypal", tmp_path / "types-eppy"]
+    for stub in (
+        "types-archetypal/src/archetypal-stubs/idfclass/idf.pyi",
+        "types-eppy/src/eppy-stubs/eppy/modeleditor.pyi",
+    ):
+        assert 'key: Literal["ZONE"]' in (tmp_path / stub).read_text()
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--slim", "--dedupe"],
+        ["--slim-docs", "drop"],
+        ["--drop-constraints"],
+        ["--layout", "single", "--dedupe"],
+        ["--build-cache", "s3://bucket"],
+    ],
+)
+def test_option_conflicts(argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit):
+        main(["--idd-file", "Energy+.idd", *argv])
+    assert argv[0] in capsys.readouterr().err
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from mypy_eppy_builder import idd_cache
+from mypy_eppy_builder.idd_cache import IddCache
+
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+Zone,
+  A1 ; \\field Name
+"""
+
+
+def test_warm_cache_skips_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    cache = IddCache(tmp_path / "cache")
+
+    assert cache.load(idd_file) is None
+    cold = cache.get_or_parse(idd_file)
+    assert cold[1] == [{"idfobj": "Zone"}, {"field": ["Name"]}]
+
+    def fail_parse(path: Path) -> None:
+        pytest.fail("warm cache should not parse")
+
+    monkeypatch.setattr(idd_cache, "parse_idd", fail_parse)
+    assert cache.get_or_parse(idd_file) == cold
+
+
+def test_cache_key_tracks_content_and_clear(tmp_path: Path) -> None:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    cache = IddCache(tmp_path / "cache")
+    first_key = cache.key(idd_file)
+    cache.get_or_parse(idd_file)
+
+    idd_file.write_text(IDD_TEXT + "Material,\n  A1 ; \\field Name\n")
+    assert cache.key(idd_file) != first_key
+    assert cache.load(idd_file) is None
+    assert len(cache.get_or_parse(idd_file)) == 3
+
+    assert cache.clear() == 2
+    assert cache.load(idd_file) is None
@@ -0,0 +1,116 @@
+import pickle
+from pathlib import Path
+
+from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+from mypy_eppy_builder.idd_model import FieldSpec, ObjectSpec, build_object_specs, normalize_field_name
+from mypy_eppy_builder.idd_parser import iter_idd_records
+
+IDD_TEXT = """\
+\\group Thermal Zones and Surfaces
+Zone,
+      \\memo Zone object
+      \\memo spanning two lines
+  A1 , \\field Name
+      \\required-field
+  N1 , \\field Multiplier
+      \\type integer
+      \\minimum 1
+      \\default 1
+  A2 ; \\field Zone Type (Legacy)
+      \\type choice
+      \\key Standard
+      \\key None
+      \\default None
+
+Lead Input,
+  A1 ; \\field Name
+      \\required-field
+"""
+
+
+def _specs() -> list[ObjectSpec]:
+    return build_object_specs(iter_idd_records(IDD_TEXT.splitlines()))
+
+
+def test_specs_resolve_names_types_and_constraints() -> None:
+    zone, lead_input = _specs()
+    assert (zone.key, zone.classname, zone.group, zone.memo) == (
+        "Zone",
+        "Zone",
+        "Thermal Zones and Surfaces",
+        "Zone object",
+    )
+    assert zone.typing_imports == ("Annotated", "Literal")
+    assert [(field.name, field.type) for field in zone.fields] == [
+        ("Name", "Annotated[str, Field(default=...)]"),
+        ("Multiplier", "Annotated[int, Field(ge=1, default=1)]"),
+        ("Zone_Type_Legacy", "Annotated[Literal['Standard', 'None'], Field()]"),
+    ]
+    assert (lead_input.classname, lead_input.idf_key) == ("Lead_Input", "LEAD INPUT")
+    assert lead_input.typing_imports == ("Annotated",)
+
+
+def test_equal_fields_are_shared() -> None:
+    zone, lead_input = _specs()
+    assert zone.fields[0] is lead_input.fields[0]
+    assert zone.fields[0] == FieldSpec("Name", "str", required=True)
+
+
+def test_specs_pickle_round_trip() -> None:
+    specs = _specs()
+    restored = pickle.loads(pickle.dumps(specs))  # noqa: S301
+    assert restored == specs
+    assert restored[0].fields[0] is restored[1].fields[0]
+    assert restored[1].classname == "Lead_Input"
+
+
+def test_normalize_field_name_matches_eppy() -> None:
+    assert normalize_field_name("Zone Type (Legacy)") == "Zone_Type_Legacy"
+    assert normalize_field_name("Vertex 1 X-coordinate") == "Vertex_1_Xcoordinate"
+
+
+SURFACE_IDD = """\
+BuildingSurface:Detailed,
+      \\extensible:3 -- duplicate last set of x,y,z coordinates (last 3 fields)
+  A1 , \\field Name
+  N1 , \\field Vertex 1 X-coordinate
+      \\begin-extensible
+      \\type real
+  N2 , \\field Vertex 1 Y-coordinate
+      \\type real
+  A2 , \\field Vertex 1 Label
+      \\type choice
+      \\key A
+  N3 , \\field Vertex 2 X-coordinate
+      \\type real
+  N4 , \\field Vertex 2 Y-coordinate
+      \\type real
+  A3 ; \\field Vertex 2 Label
+      \\type choice
+      \\key A
+"""
+
+
+def test_extensible_groups_collapse() -> None:
+    (surface,) = build_object_specs(iter_idd_records(SURFACE_IDD.splitlines()))
+    assert (surface.extensible_size, surface.extensible_start) == (3, 1)
+    assert [field.name for field in surface.stub_fields(1)] == [
+        "Name",
+        "Vertex_1_Xcoordinate",
+        "Vertex_1_Ycoordinate",
+        "Vertex_1_Label",
+    ]
+    assert [field.name for field in surface.stub_fields(0)] == ["Name"]
+    assert surface.stub_fields(None) == surface.stub_fields(2) == surface.fields
+
+
+def test_stubs_declare_only_the_kept_extensible_fields(tmp_path: Path) -> None:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(SURFACE_IDD)
+    generator = EppyStubGenerator(str(idd_file), str(tmp_path / "stubs"), use_cache=False)
+    (stub,) = generator.render_stubs().values()
+
+    assert "    Vertex_1_Label: " in stub
+    # Later numbered fields are left undeclared rather than caught by a __getattr__ that hides typos
+    assert "Vertex_2" not in stub
+    assert "__getattr__" not in stub
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from mypy_eppy_builder.idd_parser import iter_idd_records, parse_idd
+
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+!IDD_BUILD 87ed9199d4
+! comment lines are ignored
+
+Lead Input;
+
+\\group Simulation Parameters
+
+Version,
+      \\memo Specifies the EnergyPlus version of the IDF file.
+      \\unique-object
+      \\format singleLine
+  A1 ; \\field Version Identifier
+      \\required-field
+      \\default 23.1
+
+\\group Thermal Zones and Surfaces
+
+BuildingSurface:Detailed,
+      \\memo Allows for detailed entry of building heat transfer surfaces.
+      \\memo Does not include subsurfaces such as windows or doors.
+      \\extensible:3 -- duplicate last set of x,y,z coordinates (last 3 fields)
+  A1 , \\field Name
+      \\required-field
+      \\type alpha
+  N1 , \\field Number of Vertices
+      \\minimum>2
+      \\autocalculatable
+  N2 , \\field Vertex 1 X-coordinate
+      \\begin-extensible
+      \\units m
+  N3 , \\field Vertex 1 Y-coordinate
+  N4 ; \\field Vertex 1 Z-coordinate
+"""
+
+
+def test_parse_idd_records(tmp_path: Path) -> None:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+
+    idd_info = parse_idd(idd_file)
+
+    assert idd_info[0] == [{"idd_version": ["23.1.0"], "idd_build": ["87ed9199d4"]}]
+    names = [record[0]["idfobj"] for record in idd_info[1:]]
+    assert names == ["Lead Input", "Version", "BuildingSurface:Detailed"]
+
+    lead, version, surface = idd_info[1:]
+    assert lead == [{"idfobj": "Lead Input"}]
+
+    obj, field = version
+    assert obj["group"] == "Simulation Parameters"
+    assert obj["unique-object"] == [""]
+    assert field == {"field": ["Version Identifier"], "required-field": [""], "default": ["23.1"]}
+
+    obj, *fields = surface
+    assert obj["group"] == "Thermal Zones and Surfaces"
+    assert len(obj["memo"]) == 2
+    assert "extensible:3" in obj
+    assert [f["field"][0] for f in fields][:3] == ["Name", "Number of Vertices", "Vertex 1 X-coordinate"]
+    assert fields[1]["minimum>"] == ["2"]
+    assert fields[2]["begin-extensible"] == [""]
+    assert len(fields) == 5
+
+
+def test_iter_idd_records_streams_lines() -> None:
+    lines = iter(["Zone,\n", "  A1 ; \\field Name\n", "Material,\n", "  A1 ; \\field Name\n", "  \\key A\n"])
+    records = iter_idd_records(lines)
+    first = next(records)
+    assert first == [{"idfobj": "Zone"}, {"field": ["Name"]}]
+    assert next(records) == [{"idfobj": "Material"}, {"field": ["Name"], "key": ["A"]}]
@@ -0,0 +1,88 @@
+import ast
+from pathlib import Path
+
+from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+from mypy_eppy_builder.layout import class_imports, group_module
+
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+\\group Simulation Parameters
+Version,
+  A1 ; \\field Version Identifier
+Timestep,
+  N1 ; \\field Number of Timesteps per Hour
+      \\type integer
+\\group Thermal Zones and Surfaces
+Zone,
+  A1 ; \\field Name
+      \\required-field
+Material,
+  A1 , \\field Name
+  A2 ; \\field Roughness
+      \\type choice
+      \\key Rough
+      \\key Smooth
+"""
+
+
+def _generator(tmp_path: Path, layout: str, **options: object) -> EppyStubGenerator:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    return EppyStubGenerator(
+        str(idd_file),
+        str(tmp_path / "stubs"),
+        use_cache=False,
+        layout=layout,
+        **options,  # type: ignore[arg-type]
+    )
+
+
+def test_group_module_names() -> None:
+    assert group_module("Thermal Zones and Surfaces") == "thermal_zones_and_surfaces"
+    assert group_module("Energy Management System (EMS)") == "energy_management_system_ems"
+    assert group_module("2D Objects") == "group_2d_objects"
+    assert group_module("") == "ungrouped"
+
+
+def test_class_imports_group_and_sort() -> None:
+    pairs = [("zones", "ZoneList"), ("objects", "Zone"), ("zones", "EMS"), ("Objects10", "A"), ("Objects9", "B")]
+    assert class_imports(pairs) == [
+        ("objects", ["Zone"]),
+        ("Objects9", ["B"]),
+        ("Objects10", ["A"]),
+        ("zones", ["EMS", "ZoneList"]),
+    ]
+
+
+def test_by_group_layout_writes_one_module_per_group(tmp_path: Path) -> None:
+    stubs = _generator(tmp_path, "by-group").render_stubs()
+
+    assert sorted(stubs) == ["simulation_parameters.pyi", "thermal_zones_and_surfaces.pyi"]
+    zones = stubs["thermal_zones_and_surfaces.pyi"]
+    assert zones.startswith("from typing import Annotated, Literal\n\nfrom geomeppy.patches import EpBunch\n")
+    assert zones.count("from pydantic import Field") == 1
+    assert zones.index("class Material(EpBunch):") < zones.index("class Zone(EpBunch):")
+    assert zones.endswith("    Name: Annotated[str, Field(default=...)]\n")
+    assert "Literal" not in stubs["simulation_parameters.pyi"].splitlines()[0]
+    for stub in stubs.values():
+        ast.parse(stub)
+
+
+def test_single_layout_writes_every_class_to_one_module(tmp_path: Path) -> None:
+    per_class = _generator(tmp_path, "per-class").render_stubs()
+    single = _generator(tmp_path, "single", slim=True).render_stubs()
+
+    assert sorted(per_class) == ["Material.pyi", "Timestep.pyi", "Version.pyi", "Zone.pyi"]
+    assert sorted(single) == ["_aliases.pyi", "objects.pyi"]
+    for name in ("Material", "Timestep", "Version", "Zone"):
+        assert f"class {name}(EpBunch):" in single["objects.pyi"]
+
+
+def test_incremental_layout_switch_removes_old_modules(tmp_path: Path) -> None:
+    _generator(tmp_path, "per-class", incremental=True).generate_stubs()
+    _generator(tmp_path, "by-group", incremental=True).generate_stubs()
+
+    assert sorted(path.name for path in (tmp_path / "stubs").glob("*.pyi")) == [
+        "simulation_parameters.pyi",
+        "thermal_zones_and_surfaces.pyi",
+    ]
@@ -0,0 +1,84 @@
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mypy_eppy_builder.lint import changed_since, dunder_all_key, isort_key, lint_sample, member_key
+
+NAMES = ["ZoneList", "Zone_X", "Object10", "EMS", "Zone", "Object9", "zone_lower", "IDF", "OUTPUT_SQLITE"]
+
+
+def test_isort_key_orders_case_insensitively_and_naturally() -> None:
+    assert sorted(NAMES, key=isort_key) == [
+        "EMS",
+        "IDF",
+        "Object9",
+        "Object10",
+        "OUTPUT_SQLITE",
+        "Zone",
+        "zone_lower",
+        "Zone_X",
+        "ZoneList",
+    ]
+
+
+def test_dunder_all_key_groups_constants_first() -> None:
+    assert sorted(NAMES, key=dunder_all_key) == [
+        "EMS",
+        "IDF",
+        "OUTPUT_SQLITE",
+        "Object9",
+        "Object10",
+        "Zone",
+        "ZoneList",
+        "Zone_X",
+        "zone_lower",
+    ]
+
+
+def test_member_key_groups_constants_first_case_insensitively() -> None:
+    assert sorted(NAMES, key=member_key) == [
+        "EMS",
+        "IDF",
+        "OUTPUT_SQLITE",
+        "Object9",
+        "Object10",
+        "Zone",
+        "Zone_X",
+        "ZoneList",
+        "zone_lower",
+    ]
+
+
+@pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff is not installed")
+def test_sort_keys_match_ruff(tmp_path: Path) -> None:
+    imports = "".join(f"from pkg.{name} import {name}\n" for name in sorted(NAMES, key=isort_key))
+    members = "".join(f"    {name},\n" for name in sorted(NAMES, key=member_key))
+    names = "".join(f'    "{name}",\n' for name in sorted(NAMES, key=dunder_all_key))
+    module = tmp_path / "module.py"
+    module.write_text(f"{imports}from zzz import (\n{members})\n\n__all__ = [\n{names}]\n")
+    result = subprocess.run(  # noqa: S603
+        ["ruff", "check", "--no-fix", "--isolated", "--select", "I001,RUF022", str(module)],  # noqa: S607
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout
+
+
+def test_lint_sample_keeps_non_stub_files() -> None:
+    paths = [Path(f"pkg/Class{i}.pyi") for i in range(10)] + [Path("pkg/__init__.py"), Path("README.md")]
+    sample = lint_sample(paths, 3)
+    assert sample[:2] == [Path("README.md"), Path("pkg/__init__.py")]
+    assert len(sample) == 5
+    assert sample == lint_sample(paths, 3)
+
+
+def test_changed_since(tmp_path: Path) -> None:
+    old, new = tmp_path / "old.pyi", tmp_path / "new.pyi"
+    old.write_text("")
+    new.write_text("")
+    os.utime(old, (1_000, 1_000))
+    assert changed_since(tmp_path, 2_000) == [new]
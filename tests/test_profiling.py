@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+from mypy_eppy_builder import profiling
+
+
+def _profile(trace_memory: bool = True) -> list[dict]:
+    profiling.enable(trace_memory=trace_memory)
+    try:
+        with profiling.phase("outer"):
+            with profiling.phase("inner", files=2):
+                buffer = bytearray(2_000_000)
+            del buffer
+            profiling.record("ZONE", 0, 5_000_000, fields=3, bytes=120)
+            profiling.record("MATERIAL", 0, 1_000_000, fields=9, bytes=300)
+    finally:
+        events = profiling.disable()
+    return events
+
+
+def test_phase_is_a_no_op_when_disabled() -> None:
+    assert not profiling.enabled()
+    with profiling.phase("ignored"):
+        profiling.record("ZONE", 0, 1)
+    assert profiling.disable() == []
+
+
+def test_nested_phases_report_peak_memory() -> None:
+    events = {event["name"]: event for event in _profile()}
+    inner, outer = events["inner"], events["outer"]
+    assert inner["args"]["files"] == 2
+    assert inner["args"]["peak_memory"] >= 2_000_000
+    # The outer phase's peak includes the peak reached inside the inner one
+    assert outer["args"]["peak_memory"] >= inner["args"]["peak_memory"]
+    assert outer["start"] <= inner["start"] <= inner["end"] <= outer["end"]
+
+
+def test_report_lists_phases_and_slowest_classes() -> None:
+    result = profiling.report(_profile(trace_memory=False), slowest=1)
+    assert [phase["name"] for phase in result["phases"]] == ["outer", "inner"]
+    assert result["classes_rendered"] == 2
+    assert result["render_time_ms"] == 6.0
+    assert result["slowest_classes"] == [{"name": "ZONE", "duration_ms": 5.0, "fields": 3, "bytes": 120}]
+
+
+def test_run_profiled_returns_events_for_merging() -> None:
+    result, events = profiling.run_profiled(lambda x: x * 2, 21)
+    assert result == 42
+    assert events == []
+    assert not profiling.enabled()
+
+
+def test_write_profile_writes_json_and_chrome_trace(tmp_path: Path) -> None:
+    path = tmp_path / "out" / "profile.json"
+    profiling.write_profile(path, _profile(trace_memory=False))
+
+    assert json.loads(path.read_text())["classes_rendered"] == 2
+    trace = json.loads(profiling.trace_path(path).read_text())
+    assert profiling.trace_path(path).name == "profile.trace.json"
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert [event["name"] for event in trace["traceEvents"]][:2] == ["ZONE", "MATERIAL"]
+    assert all(event["ts"] >= 0 for event in trace["traceEvents"])
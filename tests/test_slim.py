@@ -0,0 +1,122 @@
+import ast
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+from mypy_eppy_builder.slim import import_statement, shared_aliases, truncate_doc
+
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+Zone,
+      \\memo Defines a thermal zone of the building. Zones hold the surfaces and loads.
+  A1 , \\field Name
+      \\required-field
+  N1 , \\field Direction of Relative North
+      \\units deg
+      \\type real
+      \\default 0
+  A2 ; \\field Type
+      \\type choice
+      \\key Standard
+      \\key Plenum
+Material,
+  A1 , \\field Name
+      \\required-field
+  N1 , \\field Thickness
+      \\type real
+      \\minimum> 0
+  A2 ; \\field Roughness
+      \\note A long note that keeps going well past the limit of a slim docstring, so it gets cut on a word.
+      \\type choice
+      \\key Standard
+      \\key Plenum
+"""
+
+
+def _generator(tmp_path: Path, **options: object) -> EppyStubGenerator:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    return EppyStubGenerator(str(idd_file), str(tmp_path / "stubs"), use_cache=False, **options)  # type: ignore[arg-type]
+
+
+def test_truncate_doc_keeps_first_sentence() -> None:
+    assert truncate_doc("Zone object.  Spanning\ntwo lines.") == "Zone object."
+    assert truncate_doc("one two three four", limit=12) == "one two..."
+
+
+def test_shared_aliases_number_repeated_subscripted_types() -> None:
+    types = ["float", "float", "Literal['A']", "Annotated[str, Field()]", "Literal['A']", "Annotated[str, Field()]"]
+    types.append("Literal['A']")
+    assert shared_aliases(types) == {"Literal['A']": "A0", "Annotated[str, Field()]": "A1"}
+
+
+def test_import_statement_wraps_past_line_length() -> None:
+    assert import_statement("._aliases", ["A0", "A1"]) == "from ._aliases import A0, A1"
+    names = [f"A{index}" for index in range(30)]
+    assert import_statement("._aliases", names).splitlines()[:2] == ["from ._aliases import (", "    A0,"]
+
+
+def test_slim_stubs_import_shared_aliases(tmp_path: Path) -> None:
+    generator = _generator(tmp_path, slim=True)
+    stubs = generator.render_stubs()
+
+    assert sorted(stubs) == ["Material.pyi", "Zone.pyi", "_aliases.pyi"]
+    assert stubs["_aliases.pyi"] == (
+        "from typing import Annotated, Literal\n\n"
+        "from pydantic import Field\n"
+        "from typing_extensions import TypeAlias\n\n"
+        "A0: TypeAlias = Annotated[Literal['Standard', 'Plenum'], Field()]\n"
+        "A1: TypeAlias = Annotated[str, Field(default=...)]\n"
+    )
+    zone = stubs["Zone.pyi"]
+    assert "from ._aliases import A0, A1\n" in zone
+    assert "    Name: A1\n" in zone
+    assert "    Type: A0\n" in zone
+    assert '"""Defines a thermal zone of the building."""' in zone
+    assert "Zones hold" not in zone
+    assert "cut on a word" not in stubs["Material.pyi"]
+    for stub in stubs.values():
+        ast.parse(stub)
+    assert generator.full_stub_size() == sum(map(len, _generator(tmp_path).render_stubs().values()))
+
+
+def test_slim_stubs_drop_docs_and_constraints(tmp_path: Path) -> None:
+    stubs = _generator(tmp_path, slim=True, slim_docs="drop", field_constraints=False).render_stubs()
+
+    assert stubs["_aliases.pyi"].endswith("A0: TypeAlias = Literal['Standard', 'Plenum']\n")
+    assert "pydantic" not in stubs["_aliases.pyi"]
+    material = stubs["Material.pyi"]
+    assert '"""' not in material
+    assert "Field" not in material
+    assert "    Thickness: float\n" in material
+
+
+def test_full_stubs_leave_no_aliases(tmp_path: Path) -> None:
+    generator = _generator(tmp_path, slim=True)
+    generator.generate_stubs()
+    assert (tmp_path / "stubs" / "_aliases.pyi").exists()
+
+    _generator(tmp_path).generate_stubs()
+    assert sorted(path.name for path in (tmp_path / "stubs").glob("*.pyi")) == ["Material.pyi", "Zone.pyi"]
+
+
+@pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff is not installed")
+def test_slim_stubs_without_shared_annotations_pass_ruff(tmp_path: Path) -> None:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT.split("Material,")[0])
+    generator = EppyStubGenerator(
+        str(idd_file), str(tmp_path / "stubs"), use_cache=False, slim=True, slim_docs="drop", field_constraints=False
+    )
+    generator.generate_stubs()
+
+    assert sorted(path.name for path in (tmp_path / "stubs").glob("*.pyi")) == ["Zone.pyi"]
+    result = subprocess.run(  # noqa: S603
+        ["ruff", "check", "--no-fix", "--isolated", str(tmp_path / "stubs")],  # noqa: S607
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout
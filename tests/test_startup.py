@@ -0,0 +1,46 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parents[1] / "src"
+
+# Cumulative import time allowed for the CLI module, in microseconds, with bytecode cached.
+IMPORT_TIME_BUDGET_US = 150_000
+# Only needed once an IDD must be located, a template rendered or an archive or worker pool built
+DEFERRED_MODULES = {"archetypal", "geomeppy", "eppy", "jinja2", "multiprocessing", "tarfile", "zipfile"}
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S.*)$")
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Return the cumulative import time of every module imported by ``python -X importtime *args``."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            times[match[3].strip()] = int(match[2])
+    return times
+
+
+def test_help_defers_heavy_imports() -> None:
+    times = _import_times("-m", "mypy_eppy_builder", "--help")
+    assert "mypy_eppy_builder.generate_package" in times
+    assert not {name.split(".")[0] for name in times} & DEFERRED_MODULES
+
+
+def test_cli_import_time_within_budget() -> None:
+    statement = "import mypy_eppy_builder.generate_package"
+    _import_times("-c", statement)  # write the bytecode cache
+    best = min(_import_times("-c", statement)["mypy_eppy_builder.generate_package"] for _ in range(3))
+    assert best < IMPORT_TIME_BUDGET_US
@@ -1,3 +1,4 @@
+import os
 import sys
 import types
 from pathlib import Path
@@ -21,12 +22,9 @@ def _render_class_stub(ctx: dict) -> str:
     fields = ctx.get("fields", [])
     if fields:
         for field in fields:
-            line = f"    {field['name']}: {field['type']}"
-            field_call = field.get("field_call")
-            if field_call:
-                line += f" = {field_call}"
+            line = f"    {field.name}: {field.type}"
             lines.append(line)
-            note = field.get("note")
+            note = field.note
             if note:
                 lines.append(f'    """{note.strip()}"""')
     else:
@@ -100,38 +98,48 @@ class DummyEnv:
         return DummyTemplate(name)
 
 
-# Dummy archetypal.idfclass.IDF implementation
-class DummyIDF:
-    def __init__(self) -> None:
-        pass
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+!IDD_BUILD 87ed9199d4
+\\group Thermal Zones and Surfaces
+
+Zone,
+      \\memo Zone object
+  A1 , \\field Name
+      \\type alpha
+      \\note Zone name
+  N1 ; \\field Multiplier
+      \\type real
+      \\default 1.0
+
+Material,
+      \\memo Material object
+  A1 , \\field Name
+      \\type alpha
+  A2 , \\field Roughness
+      \\type choice
+      \\key Smooth
+      \\key Rough
+  N1 ; \\field Thickness
+      \\type real
+      \\default 0.1
+      \\minimum> 0
+      \\maximum< 10
+"""
+
 
-    @property
-    def idd_info(self):
-        return [
-            [],
-            [
-                {"idfobj": "Zone", "memo": ["Zone object"]},
-                {"field": ["Name"], "type": ["alpha"], "note": ["Zone name"]},
-                {"field": ["Multiplier"], "type": ["real"], "default": ["1.0"]},
-            ],
-            [
-                {"idfobj": "Material", "memo": ["Material object"]},
-                {"field": ["Name"], "type": ["alpha"]},
-                {"field": ["Roughness"], "type": ["choice"], "key": ["Smooth", "Rough"]},
-                {"field": ["Thickness"], "type": ["real"], "default": ["0.1"], "minimum>": ["0"], "maximum<": ["10"]},
-            ],
-        ]
+def write_idd(tmp_path: Path) -> Path:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    return idd_file
+
+
+_preloaded_modules: set[str] = set()
 
 
 def setup_module(module) -> None:
     """Insert dummy dependencies for tests."""
-    # archetypal stub
-    archetypal = types.ModuleType("archetypal")
-    idfclass = types.ModuleType("archetypal.idfclass")
-    idfclass.IDF = DummyIDF
-    archetypal.idfclass = idfclass
-    sys.modules["archetypal"] = archetypal
-    sys.modules["archetypal.idfclass"] = idfclass
+    _preloaded_modules.update(sys.modules)
 
     # jinja2 stub
     class DummyLoader:
@@ -145,21 +153,27 @@ def setup_module(module) -> None:
 
 
 def teardown_module(module) -> None:
-    for mod in ["archetypal.idfclass", "archetypal", "jinja2"]:
+    for mod in ["jinja2"]:
         sys.modules.pop(mod, None)
+    # Drop builder modules imported against the dummy jinja2 so later tests get the real one
+    for mod in [name for name in sys.modules if name.startswith("mypy_eppy_builder.")]:
+        if mod not in _preloaded_modules:
+            sys.modules.pop(mod)
 
 
-def test_generate_stubs_and_overloads(tmp_path: Path) -> None:
+def test_generate_stubs_and_overloads(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("MYPY_EPPY_BUILDER_CACHE_DIR", str(tmp_path / "cache"))
     from mypy_eppy_builder.eppy_stubs_generator import (
         EppyStubGenerator,
     )
 
-    generator = EppyStubGenerator("dummy.idd", str(tmp_path))
+    output_dir = tmp_path / "stubs"
+    generator = EppyStubGenerator(str(write_idd(tmp_path)), str(output_dir))
     generator.env = DummyEnv()
     generator.generate_stubs()
 
-    zone_stub = (tmp_path / "Zone.pyi").read_text()
-    material_stub = (tmp_path / "Material.pyi").read_text()
+    zone_stub = (output_dir / "Zone.pyi").read_text()
+    material_stub = (output_dir / "Material.pyi").read_text()
 
     assert "class Zone(EpBunch)" in zone_stub
     assert "Name: Annotated[str, Field()]" in zone_stub
@@ -194,3 +208,81 @@ def test_normalize_classname_preserves_camel_case() -> None:
     name = "BuildingSurface:Detailed"
     assert generator.normalize_classname(name) == "BuildingSurface_Detailed"
     assert classname_to_key("BuildingSurface_Detailed") == "BUILDINGSURFACE:DETAILED"
+
+
+def test_incremental_generation_skips_unchanged(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("MYPY_EPPY_BUILDER_CACHE_DIR", str(tmp_path / "cache"))
+    from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+
+    idd_file = write_idd(tmp_path)
+    output_dir = tmp_path / "stubs"
+
+    def generate() -> None:
+        generator = EppyStubGenerator(str(idd_file), str(output_dir), incremental=True)
+        generator.env = DummyEnv()
+        generator.generate_stubs()
+
+    generate()
+    zone_stub = output_dir / "Zone.pyi"
+    material_stub = output_dir / "Material.pyi"
+    os.utime(zone_stub, ns=(0, 0))
+    os.utime(material_stub, ns=(0, 0))
+
+    generate()
+    assert zone_stub.stat().st_mtime_ns == 0
+    assert material_stub.stat().st_mtime_ns == 0
+
+    # Changing one object re-renders only that stub; dropped objects are removed.
+    idd_file.write_text(IDD_TEXT.replace("Zone object", "Thermal zone").split("Material,")[0])
+    generate()
+    assert "Thermal zone" in zone_stub.read_text()
+    assert zone_stub.stat().st_mtime_ns != 0
+    assert not material_stub.exists()
+
+
+def test_parallel_rendering_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("MYPY_EPPY_BUILDER_CACHE_DIR", str(tmp_path / "cache"))
+    from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+
+    idd_file = write_idd(tmp_path)
+    outputs = {}
+    for jobs in (1, 2):
+        output_dir = tmp_path / f"jobs{jobs}"
+        EppyStubGenerator(str(idd_file), str(output_dir), jobs=jobs).generate_stubs()
+        outputs[jobs] = {path.name: path.read_bytes() for path in output_dir.glob("*.pyi")}
+
+    assert sorted(outputs[2]) == ["Material.pyi", "Zone.pyi"]
+    assert outputs[1] == outputs[2]
+
+
+def test_profiling_records_phases_and_classes(tmp_path: Path) -> None:
+    from mypy_eppy_builder import profiling
+    from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+
+    generator = EppyStubGenerator(str(write_idd(tmp_path)), str(tmp_path / "stubs"), use_cache=False)
+    generator.env = DummyEnv()
+    profiling.enable(trace_memory=False)
+    try:
+        generator.generate_stubs()
+    finally:
+        events = profiling.disable()
+
+    phases = [event["name"] for event in events if event["category"] == profiling.PHASE]
+    assert phases == ["load IDD", "build object specs", "render stubs", "write stubs"]
+    renders = {event["name"]: event["args"] for event in events if event["category"] == profiling.RENDER}
+    assert sorted(renders) == ["Material", "Zone"]
+    assert renders["Zone"]["bytes"] == len((tmp_path / "stubs" / "Zone.pyi").read_text())
+
+
+def test_subset_limits_stubs_and_prunes_the_rest(tmp_path: Path) -> None:
+    from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+
+    idd_file = write_idd(tmp_path)
+    output_dir = tmp_path / "stubs"
+    for subset in (None, frozenset({"ZONE"})):
+        generator = EppyStubGenerator(str(idd_file), str(output_dir), use_cache=False, subset=subset)
+        generator.env = DummyEnv()
+        generator.generate_stubs()
+
+    assert [spec.key for spec in generator.object_specs] == ["Zone"]
+    assert sorted(path.name for path in output_dir.glob("*.pyi")) == ["Zone.pyi"]
@@ -0,0 +1,19 @@
+from benchmarks.synthetic_idd import object_key, synthetic_idd
+from mypy_eppy_builder.idd_parser import iter_idd_records
+
+
+def test_synthetic_idd_shape() -> None:
+    text = synthetic_idd(5, fields=6, choice_keys=7, memo_lines=3)
+    records = list(iter_idd_records(text.splitlines()))
+
+    assert [record[0]["idfobj"] for record in records] == [object_key(i) for i in range(5)]
+    obj, *fields = records[0]
+    assert len(obj["memo"]) == 3
+    assert len(fields) == 6
+    assert fields[1]["type"] == ["real"]
+    assert fields[2]["key"] == [f"Choice{i}" for i in range(7)]
+
+
+def test_synthetic_idd_without_choices() -> None:
+    records = list(iter_idd_records(synthetic_idd(2, fields=3, choice_keys=0).splitlines()))
+    assert "key" not in records[0][3]
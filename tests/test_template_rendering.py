@@ -1,4 +1,8 @@
+import shutil
+import subprocess
+import sys
 from pathlib import Path
+from types import ModuleType
 
 import pytest
 
@@ -68,9 +72,10 @@ def test_modeleditor_template() -> None:
     )
     rendered = template.render(
         package={"epbunch_path": "geomeppy.patches", "data": {"pypi_stubs_name": "pkg"}},
-        classnames=["Zone"],
+        class_imports=[("Zone", ["Zone"])],
         overloads=[("Zone", "ZONE")],
     )
+    assert "from pkg.Zone import Zone\n" in rendered
     assert 'def popidfobject(self, key: Literal["ZONE"], index: int) -> Zone' in rendered
 
 
@@ -88,7 +93,7 @@ def test_archetypal_idf_extra_methods() -> None:
     )
     rendered = template.render(
         package={"epbunch_path": "geomeppy.patches", "data": {"pypi_stubs_name": "pkg"}},
-        classnames=["Zone"],
+        class_imports=[("Zone", ["Zone"])],
         overloads=[("Zone", "ZONE")],
     )
     assert "from geomeppy import IDF as GeomIDF" in rendered
@@ -101,9 +106,181 @@ def test_version_package_pyproject() -> None:
     template = env.get_template("version-package/pyproject.toml.jinja2")
     rendered = template.render(
         package_name="types-eppy-eplusv231",
+        version="0.1.0",
         eplus_version="23.1",
         builder_package_name="builder",
         builder_version="0.0",
         builder_repo_url="https://example.com",
     )
     assert 'name = "types-eppy-eplusv231"' in rendered
+    assert 'version = "0.1.0"' in rendered
+
+
+def test_version_package_init_is_lazy() -> None:
+    env = _env()
+    template = env.get_template("version-package/src/{{ package_slug }}/__init__.py.jinja2")
+    rendered = template.render(
+        package_slug="types_eplus231",
+        eplus_version="23.1",
+        classnames=["Zone"],
+        class_modules=[("Zone", "Zone")],
+        exported_names=["IDF", "Zone"],
+    )
+    assert "    from .Zone import Zone as Zone" in rendered
+    assert "if not TYPE_CHECKING:\n\n    def __getattr__(name: str) -> Any:" in rendered
+    namespace: dict = {"__name__": "types_eplus231"}
+    exec(compile(rendered, "__init__.py", "exec"), namespace)  # noqa: S102
+    assert "Zone" in namespace["__all__"]
+    assert "geomeppy" not in namespace
+    assert "_ObjectType" not in namespace
+    assert callable(namespace["__getattr__"])
+
+
+@pytest.mark.skipif(shutil.which("mypy") is None, reason="mypy is not installed")
+def test_version_package_names_are_checked(tmp_path: Path) -> None:
+    package = tmp_path / "types_eplus231"
+    package.mkdir()
+    (package / "Zone.pyi").write_text("class Zone: ...\n")
+    (package / "__init__.py").write_text(
+        _env()
+        .get_template("version-package/src/{{ package_slug }}/__init__.py.jinja2")
+        .render(
+            package_slug="types_eplus231",
+            eplus_version="23.1",
+            classnames=["Zone"],
+            class_modules=[("Zone", "Zone")],
+            exported_names=["IDF", "Zone"],
+            class_index=True,
+        )
+    )
+    (tmp_path / "usage.py").write_text("import types_eplus231\n\nzone = types_eplus231.Zone()\ntypes_eplus231.Zonee\n")
+    result = subprocess.run(
+        ["mypy", "--ignore-missing-imports", "--no-incremental", "usage.py"],  # noqa: S607
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.stdout.splitlines()[:-1] == [
+        'usage.py:4: error: Module has no attribute "Zonee"; maybe "Zone"?  [attr-defined]'
+    ]
+
+
+def test_version_package_classes_match_objects_by_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+
+    class EpBunch:
+        def __init__(self, key: str) -> None:
+            self.key = key
+
+    patches = ModuleType("geomeppy.patches")
+    patches.EpBunch = EpBunch  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "geomeppy", ModuleType("geomeppy"))
+    monkeypatch.setitem(sys.modules, "geomeppy.patches", patches)
+    package = tmp_path / "types_eplus231"
+    package.mkdir()
+    template = _env().get_template("version-package/src/{{ package_slug }}/__init__.py.jinja2")
+    (package / "__init__.py").write_text(
+        template.render(
+            package_slug="types_eplus231",
+            eplus_version="23.1",
+            exported_names=["IDF", "Material", "Zone"],
+            class_index=True,
+        )
+    )
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text("Zone,\n  A1 ; \\field Name\nMaterial,\n  A1 ; \\field Name\n")
+    generator = EppyStubGenerator(str(idd_file), str(package), use_cache=False)
+    (package / "class_index.py").write_text(generator.render_class_index("23.1"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        import types_eplus231
+
+        zone = EpBunch("Zone")
+        assert issubclass(types_eplus231.Zone, EpBunch)
+        assert types_eplus231.Zone is not types_eplus231.Material
+        assert isinstance(zone, types_eplus231.Zone)
+        assert not isinstance(zone, types_eplus231.Material)
+        assert isinstance(types_eplus231.Material("MATERIAL"), types_eplus231.Material)
+        assert not isinstance(object(), types_eplus231.Zone)
+    finally:
+        sys.modules.pop("types_eplus231", None)
+        sys.modules.pop("types_eplus231.class_index", None)
+
+
+def test_idf_overload_styles() -> None:
+    env = _env()
+    template = env.get_template("types-archetypal/src/archetypal-stubs/idfclass/idf.pyi.jinja2")
+    context = {
+        "package": {"epbunch_path": "geomeppy.patches", "data": {"pypi_stubs_name": "pkg"}},
+        "class_imports": [("Material", ["Material"]), ("Zone", ["Zone"])],
+        "overloads": [("Zone", "ZONE"), ("Material", "MATERIAL")],
+    }
+    full = template.render(**context, overload_style="full")
+    compact = template.render(**context, overload_style="compact")
+
+    assert full.count("@overload") == 12
+    # Overloads of one method stay contiguous and end with the generic fallback.
+    newidfobject_lines = [line for line in full.splitlines() if "def newidfobject" in line]
+    assert newidfobject_lines[-1] == "    def newidfobject(self, key: str, **kwargs) -> EpBunch: ..."
+    assert "overload" not in compact
+    assert 'IDFKey = Literal[\n    "ZONE",\n    "MATERIAL",\n]\n' in compact
+    assert "    def newidfobject(self, key: IDFKey, **kwargs) -> EpBunch: ..." in compact
+    assert "    def getobject(self, key: IDFKey, name: str) -> EpBunch: ..." in compact
+    assert "'ZONE': list[Zone]," in compact
+
+
+def test_class_stub_imports_only_what_it_uses() -> None:
+    # Class stubs render with the stub generator's default environment options
+    env = Environment(loader=FileSystemLoader("src/mypy_eppy_builder/templates"), autoescape=False)
+    template = env.get_template("common/class_stub.pyi.jinja2")
+    empty = template.render(classname="Lead_Input", class_memo="", fields=[])
+    assert empty.startswith("from geomeppy.patches import EpBunch\n\nclass Lead_Input(EpBunch):")
+    assert "typing" not in empty
+    assert "pydantic" not in empty
+
+    fields = [{"name": "Name", "type": "Annotated[str, Field()]", "note": ""}]
+    stub = template.render(classname="Zone", class_memo="", fields=fields, typing_imports=["Annotated"])
+    assert stub.startswith(
+        "from typing import Annotated\n\nfrom geomeppy.patches import EpBunch\nfrom pydantic import Field\n"
+    )
+
+
+def test_subset_overloads_fall_back_to_epbunch() -> None:
+    env = _env()
+    template = env.get_template("types-archetypal/src/archetypal-stubs/idfclass/idf.pyi.jinja2")
+    rendered = template.render(
+        package={"epbunch_path": "geomeppy.patches", "data": {"pypi_stubs_name": "pkg"}},
+        class_imports=[("Zone", ["Zone"])],
+        overloads=[("Zone", "ZONE")],
+        generic_fallback=True,
+    )
+    assert "from typing import Literal, overload\n" in rendered
+    assert "TypedDict" not in rendered
+    assert "class IDFObjectsDict(dict[str, list[EpBunch]]):" in rendered
+    assert "    def __getitem__(self, key: str) -> list[EpBunch]: ..." in rendered
+    assert rendered.count("@overload") == 10
+    assert "    def getobject(self, key: str, name: str) -> EpBunch: ..." in rendered
+
+    compact = template.render(
+        package={"epbunch_path": "geomeppy.patches", "data": {"pypi_stubs_name": "pkg"}},
+        class_imports=[("Zone", ["Zone"])],
+        overloads=[("Zone", "ZONE")],
+        generic_fallback=True,
+        overload_style="compact",
+    )
+    assert "IDFKey" not in compact
+    assert "    def getobject(self, key: str, name: str) -> EpBunch: ..." in compact
+
+
+def test_idf_imports_classes_by_module() -> None:
+    template = _env().get_template("types-eppy/src/eppy-stubs/eppy/modeleditor.pyi.jinja2")
+    names = [f"Synthetic_Object{index}" for index in range(8)]
+    rendered = template.render(
+        package={"epbunch_path": "geomeppy.patches", "data": {"pypi_stubs_name": "pkg"}},
+        class_imports=[("objects", names), ("thermal_zones", ["Zone"])],
+        overloads=[("Zone", "ZONE")],
+    )
+    assert "from pkg.objects import (\n    Synthetic_Object0,\n" in rendered
+    assert "    Synthetic_Object7,\n)\nfrom pkg.thermal_zones import Zone\n" in rendered
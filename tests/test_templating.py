@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("jinja2")
+
+from mypy_eppy_builder import templating
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    templating.clear()
+    yield
+    templating.enable_bytecode_cache(None)
+    templating.clear()
+
+
+def test_environments_and_patterns_are_shared(tmp_path: Path) -> None:
+    (tmp_path / "hello.txt.jinja2").write_text("Hello {{ name }}")
+    env = templating.get_environment(tmp_path, trim_blocks=True)
+    assert templating.get_environment(str(tmp_path), trim_blocks=True) is env
+    assert templating.get_environment(tmp_path) is not env
+
+    pattern = "{{ package_slug }}"
+    assert templating.from_string(env, pattern) is templating.from_string(env, pattern)
+    assert templating.render_string(env, pattern, {"package_slug": "types_eplus231"}) == "types_eplus231"
+    assert env.get_template("hello.txt.jinja2").render(name="IDD") == "Hello IDD"
+
+
+def test_bytecode_cache_persists_compiled_templates(tmp_path: Path) -> None:
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "stub.pyi.jinja2").write_text("class {{ classname }}: ...")
+    cache_dir = tmp_path / "bytecode"
+
+    env = templating.get_environment(template_dir)
+    templating.enable_bytecode_cache(cache_dir)
+    env.get_template("stub.pyi.jinja2")
+
+    assert any(cache_dir.iterdir())
@@ -0,0 +1,53 @@
+from benchmarks.typecheck import (
+    SLIM_OPTIONS,
+    check_thresholds,
+    compare,
+    error_corpus,
+    usage_corpus,
+    without_options,
+)
+
+
+def test_usage_corpus_cycles_keys() -> None:
+    text = usage_corpus(["ZONE", "MATERIAL"], 3)
+    assert text.startswith("from archetypal.idfclass import IDF\n")
+    assert text.count("idf.newidfobject(") == 3
+    assert 'idf.getobject("MATERIAL", "name")' in text
+    assert 'idf.idfobjects["ZONE"]' in text
+    compile(text, "usage.py", "exec")
+
+
+def test_error_corpus_misspells_keys() -> None:
+    text = error_corpus(["ZONE"], 2, library="eppy")
+    assert text.startswith("from eppy.modeleditor import IDF\n")
+    assert '"ZONES"' in text
+    assert '"ZONE"' not in text
+
+
+def test_check_thresholds() -> None:
+    results = {
+        "mypy": {"wall_s": 12.0, "peak_rss_mb": 300.0, "cache_mb": 40.0, "clean": True, "rejects_unknown_keys": True},
+        "pyright": {"wall_s": 30.0, "peak_rss_mb": 900.0, "clean": True, "rejects_unknown_keys": False},
+    }
+    thresholds = {"max_regression": 0.1, "mypy": {"wall_s": 10.0}, "pyright": {"peak_rss_mb": 1000.0}}
+    baseline = {"mypy": {"wall_s": 11.5, "peak_rss_mb": 250.0}}
+
+    failures = check_thresholds(results, thresholds, baseline)
+
+    assert failures == [
+        "mypy wall_s 12.0 exceeds limit 10.0",
+        "mypy peak_rss_mb regressed from 250.0 to 300.0 (more than 10%)",
+        "pyright rejects_unknown_keys check failed",
+    ]
+    assert check_thresholds(results, {"mypy": {"wall_s": 20.0}}) == ["pyright rejects_unknown_keys check failed"]
+
+
+def test_without_options_drops_options_and_values() -> None:
+    args = ["--slim", "--slim-docs", "drop", "--overload-style", "compact", "--drop-constraints"]
+    assert without_options(args, SLIM_OPTIONS) == ["--overload-style", "compact"]
+
+
+def test_compare_reports_speedup_and_memory_ratio() -> None:
+    slim = {"mypy": {"wall_s": 5.0, "peak_rss_mb": 150.0}}
+    full = {"mypy": {"wall_s": 10.0, "peak_rss_mb": 300.0}, "pyright": {"wall_s": 30.0, "peak_rss_mb": 900.0}}
+    assert compare(slim, full) == {"mypy": {"wall_speedup": 2.0, "peak_rss_ratio": 0.5}}
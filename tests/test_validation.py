@@ -0,0 +1,101 @@
+import importlib.util
+import shutil
+import subprocess
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from mypy_eppy_builder.eppy_stubs_generator import EppyStubGenerator
+
+IDD_TEXT = """\
+Zone,
+  A1 , \\field Name
+      \\required-field
+  N1 , \\field Multiplier
+      \\type integer
+      \\minimum 1
+  N2 , \\field Ceiling Height
+      \\type real
+      \\minimum> 0
+      \\maximum< 100
+      \\autocalculatable
+  A2 ; \\field Zone Type
+      \\type choice
+      \\key Standard
+      \\key None
+
+Lead Input;
+"""
+
+
+def _render_validation(tmp_path: Path) -> Path:
+    idd_file = tmp_path / "Energy+.idd"
+    idd_file.write_text(IDD_TEXT)
+    module_path = tmp_path / "validation.py"
+    module_path.write_text(EppyStubGenerator(str(idd_file), "", use_cache=False).render_validator("23.1"))
+    return module_path
+
+
+def _validation_module(tmp_path: Path) -> ModuleType:
+    module_path = _render_validation(tmp_path)
+    spec = importlib.util.spec_from_file_location("validation", module_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_rules_come_from_the_idd(tmp_path: Path) -> None:
+    validation = _validation_module(tmp_path)
+    assert validation.RULES == {
+        "ZONE": (
+            ("Name", 1, "", True, None, None, None, None, None),
+            ("Multiplier", 2, "int", False, None, 1.0, None, None, None),
+            ("Ceiling_Height", 3, "float", False, None, None, 0.0, None, 100.0),
+            ("Zone_Type", 4, "", False, ("Standard", "None"), None, None, None, None),
+        ),
+        "LEAD INPUT": (),
+    }
+
+
+def test_validate_reports_every_violation_by_object(tmp_path: Path) -> None:
+    validation = _validation_module(tmp_path)
+    zones = [
+        SimpleNamespace(obj=["ZONE", "Core", 1, "Autocalculate", "standard"]),
+        ["ZONE", "", 1.5, 0, "Plenum"],
+        ["ZONE", "Attic", "x", "100"],
+        ["ZONE", "Short"],
+    ]
+    found = [(v.object_index, v.field, v.message) for v in validation.validate("Zone", zones)]
+    assert found == [
+        (1, "Name", "is required"),
+        (1, "Multiplier", "must be an integer"),
+        (1, "Ceiling_Height", "must be > 0"),
+        (1, "Zone_Type", "must be one of Standard, None"),
+        (2, "Multiplier", "must be a number"),
+        (2, "Ceiling_Height", "must be < 100"),
+    ]
+
+
+def test_check_idf_raises_with_all_violations(tmp_path: Path) -> None:
+    validation = _validation_module(tmp_path)
+    idf = SimpleNamespace(idfobjects={"ZONE": [["ZONE", "Core", 0]], "LEAD INPUT": [["LEAD INPUT"]], "MATERIAL": [[]]})
+    with pytest.raises(validation.ValidationError) as error:
+        validation.check_idf(idf)
+    assert [str(violation) for violation in error.value.violations] == [
+        "ZONE 'Core' (#0): Multiplier must be >= 1, got 0"
+    ]
+    with pytest.raises(KeyError):
+        validation.validate("Material", [])
+
+
+@pytest.mark.parametrize("command", [["mypy", "--strict"], ["pyright"]])
+def test_rendered_module_type_checks(tmp_path: Path, command: list[str]) -> None:
+    if shutil.which(command[0]) is None:
+        pytest.skip(f"{command[0]} is not installed")
+    module_path = _render_validation(tmp_path)
+    result = subprocess.run(  # noqa: S603
+        [*command, module_path.name], cwd=tmp_path, capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stdout
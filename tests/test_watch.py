@@ -0,0 +1,114 @@
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from mypy_eppy_builder import generate_package, watch
+from mypy_eppy_builder.watch import changed_paths, poll, snapshot
+
+
+def _touch(path: Path, offset: int) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset))
+
+
+def test_snapshot_expands_directories(tmp_path: Path) -> None:
+    (tmp_path / "templates" / "common").mkdir(parents=True)
+    template = tmp_path / "templates" / "common" / "stub.jinja2"
+    template.write_text("x")
+    idd = tmp_path / "Energy+.idd"
+    idd.write_text("y")
+
+    mtimes = snapshot([tmp_path / "templates", idd, tmp_path / "missing.idd"])
+
+    assert set(mtimes) == {template, idd}
+
+
+def test_changed_paths_reports_added_removed_and_modified(tmp_path: Path) -> None:
+    kept, edited, removed, added = (tmp_path / name for name in ("kept", "edited", "removed", "added"))
+    before = {kept: 1, edited: 1, removed: 1}
+    after = {kept: 1, edited: 2, added: 1}
+    assert changed_paths(before, after) == sorted([edited, removed, added])
+
+
+def test_poll_rebuilds_once_per_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    idd = tmp_path / "Energy+.idd"
+    idd.write_text("Version,")
+    ticks = iter(range(1, 100))
+
+    def fake_sleep(_interval: float) -> None:
+        # Every other poll sees a modified file
+        if next(ticks) % 2:
+            _touch(idd, 1_000_000)
+
+    monkeypatch.setattr(watch.time, "sleep", fake_sleep)
+    seen: list[list[Path]] = []
+
+    assert poll([idd], seen.append, interval=0, max_rebuilds=3) == 3
+    assert seen == [[idd]] * 3
+
+
+def test_poll_survives_failed_rebuilds(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    template = tmp_path / "class_stub.pyi.jinja2"
+    template.write_text("{{")
+    monkeypatch.setattr(watch.time, "sleep", lambda _interval: _touch(template, 1_000_000))
+
+    def broken(_changed: list[Path]) -> None:
+        raise ValueError("unexpected end of template")  # noqa: TRY003
+
+    assert poll([template], broken, interval=0, max_rebuilds=2) == 2
+    out = capsys.readouterr().out
+    assert out.count("Rebuild failed: unexpected end of template") == 2
+    assert "Rebuilt in" in out
+
+
+IDD_TEXT = """\
+!IDD_Version 23.1.0
+Zone,
+  A1 ; \\field Name
+"""
+
+
+def test_watch_packages_rebuilds_what_each_change_affects(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    idd = tmp_path / "Energy+.idd"
+    idd.write_text(IDD_TEXT)
+    options = {"output_dir": tmp_path, "use_cache": False, "incremental": True}
+    builds, _ = generate_package.build_version_packages(["23.1"], [str(idd)], **options)
+    generate_package.render_wrappers(["archetypal"], builds, output_dir=tmp_path, incremental=True)
+    stubs = tmp_path / "types-eplus231" / "src" / "types_eplus231"
+    idf_stub = tmp_path / "types-archetypal" / "src" / "archetypal-stubs" / "idfclass" / "idf.pyi"
+    wrapper_template = generate_package.TEMPLATES_DIR / "types-archetypal" / "src" / "archetypal-stubs" / "idfclass"
+
+    def add_material() -> list[Path]:
+        idd.write_text(IDD_TEXT + "Material,\n  A1 ; \\field Name\n")
+        return [idd]
+
+    def remove_outputs(*changed: Path) -> list[Path]:
+        (stubs / "Zone.pyi").unlink()
+        idf_stub.unlink(missing_ok=True)
+        return list(changed)
+
+    # Each change, then whether it brought back the class stub and the wrapper stub it removed
+    changes = [
+        (add_material, None),
+        (lambda: remove_outputs(generate_package.CLASS_STUB_TEMPLATES[0]), (True, False)),
+        (lambda: remove_outputs(wrapper_template / "idf.pyi.jinja2"), (False, True)),
+    ]
+
+    def scripted_poll(paths: list[Path], on_change: Callable[[list[Path]], object], **_kwargs: object) -> int:
+        assert idd in paths
+        for change, restored in changes:
+            on_change(change())
+            if restored is None:
+                assert (stubs / "Material.pyi").exists()
+                assert 'key: Literal["MATERIAL"]' in idf_stub.read_text()
+            else:
+                assert ((stubs / "Zone.pyi").exists(), idf_stub.exists()) == restored
+        return len(changes)
+
+    monkeypatch.setattr(generate_package, "poll", scripted_poll)
+
+    assert generate_package.watch_packages(["23.1"], [str(idd)], builds, **options) == 3